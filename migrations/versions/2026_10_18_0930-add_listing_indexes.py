@@ -0,0 +1,51 @@
+"""Add indexes for tasks and projects listing
+
+Revision ID: 3c1f9a7d2b84
+Revises: 6a973fbbe369
+Create Date: 2026-10-18 09:30:12.518204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f9a7d2b84"
+down_revision: str | None = "6a973fbbe369"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+INDEXES: dict[str, tuple[str, list[str]]] = {
+    "projects_user_id_created_at_id_idx": ("projects", ["user_id", "created_at", "id"]),
+    "tasks_user_id_created_at_id_idx": ("tasks", ["user_id", "created_at", "id"]),
+    "tasks_project_id_created_at_idx": ("tasks", ["project_id", "created_at"]),
+    "tasks_user_id_status_created_at_idx": ("tasks", ["user_id", "status", "created_at"]),
+    "tasks_user_id_priority_created_at_idx": ("tasks", ["user_id", "priority", "created_at"]),
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY does not lock the tables for writes, but can't be run inside a transaction.
+    with op.get_context().autocommit_block():
+        for index_name, (table_name, columns) in INDEXES.items():
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, (table_name, _) in INDEXES.items():
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,56 @@
+"""Add indexes for tasks filters and sorts
+
+Revision ID: 8e4b2d6f1a37
+Revises: 3c1f9a7d2b84
+Create Date: 2026-10-18 21:00:41.203958
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4b2d6f1a37"
+down_revision: str | None = "3c1f9a7d2b84"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+INDEXES: dict[str, tuple[list[str], str | None]] = {
+    # created_at breaks the ties of the sorts, bulk updates and imports make many of them.
+    "tasks_user_id_updated_at_created_at_idx": (["user_id", "updated_at", "created_at"], None),
+    "tasks_user_id_deadline_created_at_idx": (["user_id", "deadline", "created_at"], None),
+    # Only the tasks which can be overdue, the dashboards ask for them the most.
+    "tasks_user_id_overdue_deadline_idx": (
+        ["user_id", "deadline", "created_at"],
+        "status IN ('pending', 'progress') AND deadline IS NOT NULL",
+    ),
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY does not lock the tables for writes, but can't be run inside a transaction.
+    with op.get_context().autocommit_block():
+        for index_name, (columns, where) in INDEXES.items():
+            op.create_index(
+                index_name,
+                "tasks",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in INDEXES:
+            op.drop_index(
+                index_name,
+                table_name="tasks",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
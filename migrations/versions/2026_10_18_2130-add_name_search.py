@@ -0,0 +1,77 @@
+"""Add full-text and trigram search of task and project names
+
+Revision ID: 5d7c3e9b0f12
+Revises: 8e4b2d6f1a37
+Create Date: 2026-10-18 21:30:08.640275
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5d7c3e9b0f12"
+down_revision: str | None = "8e4b2d6f1a37"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+TABLES: tuple[str, ...] = ("tasks", "projects")
+# pg_trgm for the trigram index of the names, btree_gin for user_id in the GIN indexes.
+EXTENSIONS: tuple[str, ...] = ("pg_trgm", "btree_gin")
+
+
+def upgrade() -> None:
+    for extension in EXTENSIONS:
+        op.execute(f"CREATE EXTENSION IF NOT EXISTS {extension}")
+    for table_name in TABLES:
+        # The stored generated column is computed for the existing rows, which rewrites the table.
+        op.add_column(
+            table_name,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed("to_tsvector('simple', name)", persisted=True),
+                nullable=False,
+            ),
+        )
+    # CONCURRENTLY does not lock the tables for writes, but can't be run inside a transaction.
+    with op.get_context().autocommit_block():
+        for table_name in TABLES:
+            op.create_index(
+                f"{table_name}_user_id_search_vector_idx",
+                table_name,
+                ["user_id", "search_vector"],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.create_index(
+                f"{table_name}_user_id_name_trgm_idx",
+                table_name,
+                ["user_id", "name"],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={"name": "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table_name in TABLES:
+            for index_name in (f"{table_name}_user_id_search_vector_idx", f"{table_name}_user_id_name_trgm_idx"):
+                op.drop_index(
+                    index_name,
+                    table_name=table_name,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    for table_name in TABLES:
+        op.drop_column(table_name, "search_vector")
+    # The extensions are left, they may be used by other objects of the database.
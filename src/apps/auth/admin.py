@@ -19,7 +19,12 @@ from src.apps.users.repositories import UsersRepository
 from src.core.db import AsyncSessionFactory, engine
 from src.core.settings import settings
 from src.dependencies import get_users_repository
-from src.exceptions import TokenExpiredException, TokenHasNotValidSignatureException, UserNotCorrectPasswordException
+from src.exceptions import (
+    PasswordHasherOverloadedException,
+    TokenExpiredException,
+    TokenHasNotValidSignatureException,
+    UserNotCorrectPasswordException,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -59,8 +64,8 @@ class AdminAuth(AuthenticationBackend):
                 user: User | None = await user_repository.get_user_by_email(email=email)
                 if user is None or not user.is_active or not (user.is_staff or user.is_super_user):
                     return False
-                AuthService._validate_auth_user(user=user, password=password)
-            except UserNotCorrectPasswordException:
+                await AuthService._validate_auth_user(user=user, password=password)
+            except (UserNotCorrectPasswordException, PasswordHasherOverloadedException):
                 return False
         token: str = AuthService.generate_access_token(user_id=user.id)
         request.session.update({"token": token})
@@ -6,8 +6,9 @@ from fastapi.responses import RedirectResponse
 
 from src.apps.auth.services import AuthService
 from src.apps.users.schemas import UserLoginIn, UserLoginOut
-from src.dependencies import get_auth_service
-from src.exceptions import UserNotCorrectPasswordException
+from src.core.services.cache import PrimaryPins
+from src.dependencies import get_auth_service, get_primary_pins
+from src.exceptions import PasswordHasherOverloadedException, UserNotCorrectPasswordException
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -35,6 +36,7 @@ async def login_user(
 
     **Errors**:
     - `401 Unauthorized`: If the credentials are incorrect (invalid email or password).
+    - `503 Service Unavailable`: If the server is overloaded with password checks.
     """
     try:
         return await auth_service.login(payload.email, payload.password)
@@ -43,6 +45,11 @@ async def login_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e.detail),
         )
+    except PasswordHasherOverloadedException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e.detail),
+        )
 
 
 @router.get(
@@ -73,6 +80,7 @@ async def login_user_with_google(
 )
 async def google_auth(
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    primary_pins: Annotated[PrimaryPins, Depends(get_primary_pins)],
     code: str,
 ) -> UserLoginOut:
     """
@@ -87,7 +95,10 @@ async def google_auth(
     **Response**:
     - Returns a `UserLoginOut` object containing the user's ID and access token.
     """
-    return await auth_service.google_auth(code=code)
+    user: UserLoginOut = await auth_service.google_auth(code=code)
+    # The user may be created by the GET request, which ReadYourWritesMiddleware does not pin.
+    await primary_pins.pin(user_id=user.id)
+    return user
 
 
 @router.get(
@@ -120,6 +131,7 @@ async def login_user_with_yandex(
 )
 async def yandex_auth(
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    primary_pins: Annotated[PrimaryPins, Depends(get_primary_pins)],
     code: str,
 ) -> UserLoginOut:
     """
@@ -136,4 +148,7 @@ async def yandex_auth(
 
     If the authentication process fails or the code is invalid, an error will be raised.
     """
-    return await auth_service.yandex_auth(code=code)
+    user: UserLoginOut = await auth_service.yandex_auth(code=code)
+    # The user may be created by the GET request, which ReadYourWritesMiddleware does not pin.
+    await primary_pins.pin(user_id=user.id)
+    return user
@@ -1,3 +1,64 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from passlib.context import CryptContext
 
+from src.core.settings import settings
+from src.exceptions import PasswordHasherOverloadedException
+
 bcrypt_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasher:
+    """
+    Hash and verify passwords in a bounded thread pool instead of the event loop.
+
+    bcrypt releases the GIL, so up to ``max_workers`` passwords are hashed in parallel
+    and up to ``queue_size`` more calls wait for a free worker. Any other call fails
+    at once with ``PasswordHasherOverloadedException``.
+    """
+
+    def __init__(self, *, context: CryptContext, max_workers: int, queue_size: int) -> None:
+        self.context = context
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: int = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hasher",
+            )
+        return self._executor
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str | None) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_workers + self.queue_size:
+            raise PasswordHasherOverloadedException
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self._pending -= 1
+
+
+password_hasher = PasswordHasher(
+    context=bcrypt_context,
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    queue_size=settings.PASSWORD_HASHER_QUEUE_SIZE,
+)
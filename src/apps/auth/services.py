@@ -7,7 +7,8 @@ from typing import Any
 from jose import JWTError, jwt
 
 from src.apps.auth.schemas import GoogleUserDataOut, YandexUserDataOut
-from src.apps.auth.security import bcrypt_context
+from src.apps.auth.security import password_hasher
+from src.apps.auth.token_cache import VerifiedAccessToken, access_token_cache
 from src.apps.users.models import User
 from src.apps.users.repositories import UsersRepository
 from src.apps.users.schemas import UserLoginOut
@@ -35,7 +36,7 @@ class AuthService:
         user: User | None = await self.users_repository.get_user_by_email(
             email=email,
         )
-        self._validate_auth_user(user=user, password=password)
+        await self._validate_auth_user(user=user, password=password)
         await self.users_repository.update_last_login(user_id=user.id)
         access_token: str = self.generate_access_token(user_id=user.id)
         return UserLoginOut(id=user.id, access_token=access_token)
@@ -87,10 +88,10 @@ class AuthService:
         )
 
     @staticmethod
-    def _validate_auth_user(user: User, password: str) -> None:
+    async def _validate_auth_user(user: User | None, password: str) -> None:
         if not user:
             raise UserNotCorrectPasswordException
-        if not bcrypt_context.verify(password, user.password):
+        if not await password_hasher.verify(password, user.password):
             raise UserNotCorrectPasswordException
 
     @staticmethod
@@ -108,6 +109,8 @@ class AuthService:
 
     @staticmethod
     def get_user_id_from_access_token(*, access_token: str) -> uuid.UUID:
+        if token := access_token_cache.get(access_token):
+            return token.user_id
         try:
             payload: dict[str, Any] = jwt.decode(
                 access_token,
@@ -120,4 +123,8 @@ class AuthService:
             raise TokenHasNotValidSignatureException
         if payload["expire"] < datetime.now(UTC).timestamp():
             raise TokenExpiredException
+        access_token_cache.set(
+            access_token,
+            VerifiedAccessToken(user_id=payload["id"], expire=payload["expire"]),
+        )
         return payload["id"]
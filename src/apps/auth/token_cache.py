@@ -0,0 +1,69 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class VerifiedAccessToken:
+    user_id: Any
+    expire: float
+
+
+class AccessTokenCache:
+    """
+    Bounded LRU cache of verified access tokens of the process.
+
+    Tokens are keyed by their SHA-256 digest, so the tokens themselves are not kept in memory.
+    An entry lives until the `expire` claim of its token, an expired entry is a miss.
+    """
+
+    def __init__(self, *, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._tokens: OrderedDict[bytes, VerifiedAccessToken] = OrderedDict()
+
+    def get(self, access_token: str) -> VerifiedAccessToken | None:
+        key: bytes = self._make_key(access_token)
+        token: VerifiedAccessToken | None = self._tokens.get(key)
+        if token is None or token.expire < time.time():
+            if token is not None:
+                del self._tokens[key]
+            self.misses += 1
+            return None
+        self._tokens.move_to_end(key)
+        self.hits += 1
+        return token
+
+    def set(self, access_token: str, token: VerifiedAccessToken) -> None:
+        if self.max_size <= 0:
+            return
+        key: bytes = self._make_key(access_token)
+        self._tokens[key] = token
+        self._tokens.move_to_end(key)
+        if len(self._tokens) > self.max_size:
+            self._tokens.popitem(last=False)
+
+    def clear(self) -> None:
+        self._tokens.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._tokens),
+            "max_size": self.max_size,
+        }
+
+    @staticmethod
+    def _make_key(access_token: str) -> bytes:
+        return hashlib.sha256(access_token.encode()).digest()
+
+
+access_token_cache = AccessTokenCache(max_size=settings.JWT_CACHE_SIZE)
@@ -2,11 +2,21 @@ from typing import Annotated
 
 import sentry_sdk
 from fastapi import APIRouter, Depends, HTTPException, status
+from redis import Redis
+from redis.exceptions import RedisError
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.apps.healthcheck.schemas import HealthCheckDBResponseSchema, HealthCheckResponseSchema
-from src.core.db import get_async_session
+from src.apps.auth.token_cache import access_token_cache
+from src.apps.healthcheck.schemas import (
+    HealthCheckDBPoolResponseSchema,
+    HealthCheckDBResponseSchema,
+    HealthCheckRedisResponseSchema,
+    HealthCheckResponseSchema,
+    HealthCheckTokenCacheResponseSchema,
+)
+from src.core.db import get_async_session, get_db_pool_stats
+from src.core.services.cache import get_redis_connection, get_redis_pool_stats
 from src.dependencies import get_request_staff_or_superuser_user_id
 
 router = APIRouter(dependencies=[Depends(get_request_staff_or_superuser_user_id)])
@@ -58,6 +68,63 @@ async def get_healthcheck_status_db(
     return HealthCheckDBResponseSchema()
 
 
+@router.get(
+    "/db/pool",
+    name="Get database connection pool stats",
+    response_model=HealthCheckDBPoolResponseSchema,
+)
+async def get_healthcheck_db_pool() -> HealthCheckDBPoolResponseSchema:
+    """
+    Returns the usage of the database connection pool of the worker (Only staff).
+
+    **Response:**
+    - `200 OK`: Size of the pool, checked out, idle and overflow connections, the number of checkouts
+      and timeouts and the average and maximum wait of a checkout in milliseconds.
+    """
+    return HealthCheckDBPoolResponseSchema(**get_db_pool_stats())
+
+
+@router.get(
+    "/redis",
+    name="Get redis status",
+    response_model=HealthCheckRedisResponseSchema,
+)
+async def get_healthcheck_status_redis(
+    redis: Annotated[Redis, Depends(get_redis_connection)],
+) -> HealthCheckRedisResponseSchema:
+    """
+    Checks the availability of Redis and returns the connection pool usage of the worker (Only staff).
+
+    **Response:**
+    - `200 OK`: Maximum, in use, available and created connections of the pool.
+    - `503 Service Unavailable`: Redis is not available.
+    """
+    try:
+        await redis.ping()
+    except RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Redis is no available",
+        )
+
+    return HealthCheckRedisResponseSchema(**get_redis_pool_stats())
+
+
+@router.get(
+    "/token-cache",
+    name="Get access token cache stats",
+    response_model=HealthCheckTokenCacheResponseSchema,
+)
+async def get_healthcheck_token_cache() -> HealthCheckTokenCacheResponseSchema:
+    """
+    Returns the counters of the access token cache of the worker (Only staff).
+
+    **Response:**
+    - `200 OK`: Hits, misses, current and maximum size of the cache.
+    """
+    return HealthCheckTokenCacheResponseSchema(**access_token_cache.stats())
+
+
 @router.get(
     "/sentry-debug",
     name="Send error to the sentry 🤒",
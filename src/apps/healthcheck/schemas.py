@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from src.core.schemas import OutputApiSchema
+
 
 @dataclass
 class HealthCheckResponseSchema:
@@ -9,3 +11,29 @@ class HealthCheckResponseSchema:
 @dataclass
 class HealthCheckDBResponseSchema:
     status: str = "db is working."
+
+
+class HealthCheckTokenCacheResponseSchema(OutputApiSchema):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class HealthCheckRedisResponseSchema(OutputApiSchema):
+    max_connections: int
+    in_use_connections: int
+    available_connections: int
+    created_connections: int
+
+
+class HealthCheckDBPoolResponseSchema(OutputApiSchema):
+    pool_size: int
+    max_overflow: int
+    checked_out_connections: int
+    idle_connections: int
+    overflow_connections: int
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
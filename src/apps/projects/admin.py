@@ -4,6 +4,7 @@ from sqladmin import ModelView
 
 from src.apps.auth.services import AuthService
 from src.apps.projects.models import Project
+from src.dependencies import get_cache_tasks_repository
 
 
 class ProjectAdmin(ModelView, model=Project):
@@ -17,6 +18,9 @@ class ProjectAdmin(ModelView, model=Project):
     column_sortable_list = [
         Project.name,
     ]
+    form_excluded_columns = [
+        Project.search_vector,
+    ]
     form_create_rules = [
         "name",
     ]
@@ -36,3 +40,7 @@ class ProjectAdmin(ModelView, model=Project):
                     access_token=token,
                 )
                 data["user_id"] = user_id
+
+    async def after_model_delete(self, model, request) -> None:
+        # The tasks of the project are deleted by the cascade.
+        await get_cache_tasks_repository().invalidate(user_id=model.user_id)
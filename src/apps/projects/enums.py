@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class ProjectInclude(str, Enum):
+    """
+    This class represents the optional parts of a project in the responses.
+
+    Attributes:
+        tasks (str): The latest tasks of the project.
+        task_counts (str): The number of tasks of the project by status.
+    """
+
+    tasks = "tasks"
+    task_counts = "taskCounts"
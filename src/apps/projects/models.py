@@ -1,10 +1,10 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.db import Base, str_250
+from src.core.db import Base, name_search_vector, str_250
 from src.core.models import TimestampMixin
 
 if TYPE_CHECKING:
@@ -14,21 +14,43 @@ if TYPE_CHECKING:
 class Project(TimestampMixin, Base):
     # id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str_250]
+    search_vector: Mapped[name_search_vector]
     user_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey(
             "users.id",
             ondelete="CASCADE",
         ),
     )
+    # Tasks are never loaded with the project, the repository reads them only when requested.
     tasks: Mapped[list["Task"]] = relationship(
         back_populates="project",
-        lazy="selectin",
+        lazy="noload",
+        passive_deletes=True,
     )
     __table_args__ = (
         UniqueConstraint(
             "name",
             "user_id",
         ),
+        Index(
+            "projects_user_id_created_at_id_idx",
+            "user_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "projects_user_id_search_vector_idx",
+            "user_id",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "projects_user_id_name_trgm_idx",
+            "user_id",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
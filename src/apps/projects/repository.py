@@ -1,15 +1,53 @@
 import logging
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    case,
+    delete,
+    desc,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.projects.models import Project
+from src.apps.tasks.models import Task
+from src.apps.tasks.repository import get_task_row_columns
+from src.core.pagination import Cursor
+from src.core.utils.db import make_name_search, set_word_similarity_threshold
+from src.core.utils.serialization import api_datetime, api_uuid
+
+# Fields of ProjectOut in the response except the included ones, selected by ``get_project_row_columns``.
+PROJECT_ROW_FIELDS: tuple[str, ...] = ("id", "name", "createdAt", "updatedAt")
 
 logger = logging.getLogger(__name__)
 
 
+def get_project_row_columns() -> tuple[ColumnElement, ...]:
+    """
+    Returns the columns of ``PROJECT_ROW_FIELDS`` formatted by the database like ``ProjectOut`` does.
+    """
+    return (
+        api_uuid(Project.id),
+        Project.name,
+        api_datetime(Project.created_at),
+        api_datetime(Project.updated_at),
+    )
+
+
 @dataclass
 class ProjectRepository:
     session: AsyncSession
@@ -20,17 +58,120 @@ class ProjectRepository:
         order,
         page: int,
         per_page: int,
+        cursor: Cursor | None = None,
     ) -> list[Project]:
+        query = self._make_page_query(
+            select(Project),
+            user_id=user_id,
+            order=order,
+            page=page,
+            per_page=per_page,
+            cursor=cursor,
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().unique())
+
+    async def get_all_rows(
+        self,
+        user_id: uuid.UUID,
+        order,
+        page: int,
+        per_page: int,
+        cursor: Cursor | None = None,
+    ) -> Sequence[Row]:
+        """
+        Returns a page of projects as rows of ``PROJECT_ROW_FIELDS`` ready for the response followed by ``created_at``.
+        """
+        query = self._make_page_query(
+            select(*get_project_row_columns(), Project.created_at),
+            user_id=user_id,
+            order=order,
+            page=page,
+            per_page=per_page,
+            cursor=cursor,
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def search_rows(self, *, user_id: uuid.UUID, text: str, page: int, per_page: int) -> Sequence[Row]:
+        """
+        Returns a page of the projects whose names match the text as rows of ``PROJECT_ROW_FIELDS``,
+        the most relevant first.
+        """
+        await set_word_similarity_threshold(self.session)
+        condition, rank = make_name_search(search_vector=Project.search_vector, name=Project.name, text=text)
         result = await self.session.execute(
-            select(Project)
-            .where(Project.user_id == user_id)
+            select(*get_project_row_columns())
+            .where(Project.user_id == user_id, condition)
+            .order_by(
+                desc(rank),
+                desc(Project.created_at),
+                desc(Project.id),
+            )
             .limit(per_page)
-            .offset(page - 1 if page == 1 else (page - 1) * per_page)
+            .offset((page - 1) * per_page)
+        )
+        return result.all()
+
+    async def get_tasks(self, *, project_id: uuid.UUID, limit: int) -> list[Task]:
+        """
+        Returns up to ``limit`` latest tasks of the project.
+        """
+        result = await self.session.scalars(
+            select(Task)
+            .where(Task.project_id == project_id)
             .order_by(
-                order(Project.created_at),
-            ),
+                desc(Task.created_at),
+                desc(Task.id),
+            )
+            .limit(limit)
         )
-        return list(result.scalars().unique())
+        return list(result)
+
+    async def get_tasks_rows(self, *, project_ids: Sequence[uuid.UUID], limit: int) -> Sequence[Row]:
+        """
+        Returns up to ``limit`` latest tasks of every project as rows of ``TASK_ROW_FIELDS`` grouped by project.
+
+        The tasks are read per project by a LATERAL subquery, so only ``limit`` rows
+        of the project index are read however many tasks a project has.
+        """
+        if not project_ids:
+            return []
+        projects = select(Project.id).where(Project.id.in_(project_ids)).subquery("projects")
+        tasks = (
+            select(*get_task_row_columns(), Task.created_at, Task.id.label("task_id"))
+            .where(Task.project_id == projects.c.id)
+            .order_by(
+                desc(Task.created_at),
+                desc(Task.id),
+            )
+            .limit(limit)
+            .lateral("project_tasks")
+        )
+        result = await self.session.execute(
+            select(tasks)
+            .select_from(projects)
+            .join(tasks, true())
+            .order_by(
+                tasks.c.projectId,
+                desc(tasks.c.created_at),
+                desc(tasks.c.task_id),
+            )
+        )
+        return result.all()
+
+    async def get_task_counts(self, *, project_ids: Sequence[uuid.UUID]) -> Sequence[Row]:
+        """
+        Returns the number of tasks of the projects by status as rows of ``(project_id, status, count)``.
+        """
+        if not project_ids:
+            return []
+        result = await self.session.execute(
+            select(Task.project_id, Task.status, func.count())
+            .where(Task.project_id.in_(project_ids))
+            .group_by(Task.project_id, Task.status)
+        )
+        return result.all()
 
     async def get(self, *, user_id: uuid.UUID, project_id: uuid.UUID) -> Project | None:
         return await self.session.scalar(
@@ -40,42 +181,102 @@ class ProjectRepository:
             )
         )
 
-    async def get_by_name(self, *, user_id: uuid.UUID, name: str) -> Project | None:
-        return await self.session.scalar(
-            select(Project).where(
-                Project.name == name,
+    async def get_ids(self, *, user_id: uuid.UUID, project_ids: set[uuid.UUID]) -> set[uuid.UUID]:
+        """
+        Returns the ids of the given projects which belong to the user.
+        """
+        if not project_ids:
+            return set()
+        result = await self.session.scalars(
+            select(Project.id).where(
+                Project.id.in_(project_ids),
                 Project.user_id == user_id,
             )
         )
+        return set(result)
+
+    async def create(self, *, user_id: uuid.UUID, payload: dict) -> Project:
+        """
+        Creates the project of the user with one INSERT.
 
-    async def create(self, *, user_id: uuid.UUID, payload: dict) -> Project | None:
-        project: Project | None = (
-            await self.session.execute(
-                insert(Project)
-                .values(
-                    user_id=user_id,
-                    **payload,
-                )
-                .returning(Project)
+        Raises:
+            IntegrityError: If the name is taken.
+        """
+        query = (
+            insert(Project)
+            .values(
+                user_id=user_id,
+                **payload,
             )
-        ).scalar()
+            .returning(Project)
+        )
+        try:
+            project: Project = (await self.session.execute(query)).scalar_one()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         await self.session.commit()
         return project
 
-    async def update(self, *, project_id: uuid.UUID, payload: dict) -> Project | None:
-        project: Project | None = (
-            await self.session.execute(
-                update(Project)
-                .where(
-                    Project.id == project_id,
-                )
-                .values(**payload)
-                .returning(Project)
+    async def update(self, *, user_id: uuid.UUID, project_id: uuid.UUID, payload: dict) -> Project | None:
+        """
+        Updates the project of the user with one UPDATE and returns it or None if the project is not found.
+        ``updated_at`` is kept if nothing changes.
+
+        Raises:
+            IntegrityError: If the name is taken.
+        """
+        changed: ColumnElement[bool] = or_(
+            false(),
+            *(Project.__table__.c[key].is_distinct_from(value) for key, value in payload.items()),
+        )
+        query = (
+            update(Project)
+            .where(
+                Project.id == project_id,
+                Project.user_id == user_id,
             )
-        ).scalar()
+            .values(**payload, updated_at=case((changed, func.now()), else_=Project.updated_at))
+            .returning(Project)
+        )
+        try:
+            project: Project | None = (await self.session.execute(query)).scalar()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         await self.session.commit()
         return project
 
-    async def delete(self, *, project_id: uuid.UUID) -> None:
-        await self.session.execute(delete(Project).where(Project.id == project_id))
+    async def delete(self, *, user_id: uuid.UUID, project_id: uuid.UUID) -> bool:
+        """
+        Deletes the project of the user and returns whether it existed, its tasks are deleted in cascade.
+        """
+        project_id = await self.session.scalar(
+            delete(Project).where(Project.id == project_id, Project.user_id == user_id).returning(Project.id),
+        )
         await self.session.commit()
+        return project_id is not None
+
+    @staticmethod
+    def _make_page_query(
+        query: Select,
+        *,
+        user_id: uuid.UUID,
+        order,
+        page: int,
+        per_page: int,
+        cursor: Cursor | None,
+    ) -> Select:
+        query = (
+            query.where(Project.user_id == user_id)
+            .limit(per_page)
+            .order_by(
+                order(Project.created_at),
+                order(Project.id),
+            )
+        )
+        if cursor is None:
+            return query.offset(page - 1 if page == 1 else (page - 1) * per_page)
+        position = tuple_(Project.created_at, Project.id)
+        last_position = tuple_(literal(cursor.created_at), literal(cursor.id))
+        return query.where(position < last_position if order is desc else position > last_position)
@@ -1,16 +1,27 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 
+from src.apps.projects.enums import ProjectInclude
 from src.apps.projects.schemas import ProjectIn, ProjectOut
 from src.apps.projects.services import ProjectService
-from src.core.pagination import Pagination, pagination_params
-from src.dependencies import get_project_service, get_request_user_id
+from src.core.pagination import JsonPage, Pagination, make_page_response, pagination_params
+from src.core.search import Search, search_params
+from src.dependencies import get_project_read_service, get_project_service, get_request_user_id
 from src.exceptions import ProjectAlreadyExistsException, ProjectNotFoundException
 
 router = APIRouter()
 
+Include = Annotated[
+    list[ProjectInclude] | None,
+    Query(description="Parts of the projects to include: `tasks` and/or `taskCounts`"),
+]
+TasksLimit = Annotated[
+    int,
+    Query(alias="tasksLimit", ge=1, le=100, description="Count of the latest tasks included per project"),
+]
+
 
 @router.post(
     "",
@@ -53,9 +64,11 @@ async def create_project(
 )
 async def get_projects(
     user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
-    project_service: Annotated[ProjectService, Depends(get_project_service)],
+    project_service: Annotated[ProjectService, Depends(get_project_read_service)],
     pagination: Annotated[Pagination, Depends(pagination_params)],
-) -> list[ProjectOut]:
+    include: Include = None,
+    tasks_limit: TasksLimit = 10,
+) -> Response:
     """
     Get a list of all projects associated with the authenticated user.
 
@@ -65,18 +78,54 @@ async def get_projects(
         - **name**: The name of the project.
         - **created_at**: The timestamp of when the project was created.
         - **updated_at**: The timestamp of when the project was last updated.
-        - **tasks**: A list of tasks associated with the project (if any).
+        - **tasks**: The latest tasks of the project, newest first, if `include=tasks` is passed.
+        - **taskCounts**: The number of tasks of the project by status, if `include=taskCounts` is passed.
 
-    - **Pagination**: The response will be paginated based on the provided pagination parameters,
-      allowing users to fetch the projects in chunks.
+    - **Include**: Tasks are not loaded unless requested. With `include=tasks` up to `tasksLimit`
+      (10 by default) latest tasks of every project are returned.
+    - **Pagination**: The first page has `perPage` projects. If there are more projects, the `X-Next-Cursor`
+      response header contains the cursor of the next page. Pass it as `cursor` to get the next page
+      as fast as the first one, `page` is the OFFSET fallback and gets slower the deeper the page is.
 
     **Responses:**
     - `200 OK`: A list of projects associated with the authenticated user.
+    - `400 Bad Request`: Provided cursor is not valid.
     """
-    return await project_service.get_all(
+    page: JsonPage = await project_service.get_all(
         user_id=user_id,
         pagination=pagination,
+        include=set(include or ()),
+        tasks_limit=tasks_limit,
     )
+    return make_page_response(page)
+
+
+@router.get(
+    "/search",
+    name="Search projects",
+    response_model=list[ProjectOut],
+    status_code=status.HTTP_200_OK,
+)
+async def search_projects(
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+    project_service: Annotated[ProjectService, Depends(get_project_read_service)],
+    search: Annotated[Search, Depends(search_params)],
+) -> Response:
+    """
+    Search the projects of the authenticated user by name.
+
+    **Request**:
+    - **q**: Words of the name, prefixes are enough (`task` finds `TaskMania`), or a part of it with typos.
+    - **page**, **perPage**: Page of the results.
+
+    **Response**:
+    - Projects with the same attributes as in the list of projects without tasks, the most relevant first.
+
+    **Responses:**
+    - `200 OK`: Returns a list of projects (empty list if no projects are found).
+    """
+    page: JsonPage = await project_service.search(user_id=user_id, search=search)
+    return make_page_response(page)
 
 
 @router.get(
@@ -88,13 +137,17 @@ async def get_projects(
 async def get_project(
     project_id: Annotated[uuid.UUID, Path()],
     user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
-    project_service: Annotated[ProjectService, Depends(get_project_service)],
+    project_service: Annotated[ProjectService, Depends(get_project_read_service)],
+    include: Include = None,
+    tasks_limit: TasksLimit = 10,
 ) -> ProjectOut:
     """
     Get the details of a specific project by its ID for the authenticated user.
 
     **Request**:
     - **project_id**: The unique ID of the project to be fetched (must be a uuid).
+    - **include**: `tasks` and/or `taskCounts` to include them in the response.
+    - **tasksLimit**: Count of the latest tasks included (10 by default).
 
     **Response**:
     - Returns the project details, including:
@@ -102,14 +155,20 @@ async def get_project(
         - **name**: The name of the project.
         - **created_at**: The timestamp of when the project was created.
         - **updated_at**: The timestamp of when the project was last updated.
-        - **tasks**: A list of tasks associated with the project (if any).
+        - **tasks**: The latest tasks of the project, newest first, if `include=tasks` is passed.
+        - **taskCounts**: The number of tasks of the project by status, if `include=taskCounts` is passed.
 
     **Errors**:
     - `404 Not Found`: If the project does not exist or does not belong to the authenticated user.
 
     """
     try:
-        return await project_service.get(user_id=user_id, project_id=project_id)
+        return await project_service.get(
+            user_id=user_id,
+            project_id=project_id,
+            include=set(include or ()),
+            tasks_limit=tasks_limit,
+        )
     except ProjectNotFoundException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -142,10 +201,10 @@ async def update_project(
         - **name**: The updated name of the project.
         - **created_at**: The timestamp of when the project was created.
         - **updated_at**: The timestamp of when the project was last updated.
-        - **tasks**: A list of tasks associated with the project (if any).
 
     **Errors**:
     - `404 Not Found`: If the project does not exist or does not belong to the authenticated user.
+    - `409 Conflict`: If another project of the user has the same name.
     """
     try:
         return await project_service.update(
@@ -158,6 +217,11 @@ async def update_project(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e.detail),
         )
+    except ProjectAlreadyExistsException as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e.detail),
+        )
 
 
 @router.delete(
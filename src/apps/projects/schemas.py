@@ -11,9 +11,17 @@ class ProjectIn(InputApiSchema):
     name: str = Field(min_length=2, max_length=250, examples=["TaskMania"])
 
 
+class ProjectTaskCountsOut(OutputApiSchema):
+    pending: int = 0
+    progress: int = 0
+    completed: int = 0
+    expired: int = 0
+
+
 class ProjectOut(OutputApiSchema):
     id: uuid.UUID
     name: str = Field(min_length=2, max_length=250, examples=["TaskMania"])
     created_at: datetime
     updated_at: datetime
     tasks: list[TaskOut] | None = None
+    task_counts: ProjectTaskCountsOut | None = None
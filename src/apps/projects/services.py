@@ -1,74 +1,172 @@
 import logging
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 
-from sqlalchemy import asc, desc
+import orjson
+from sqlalchemy import Row, asc, desc
+from sqlalchemy.exc import IntegrityError
 
+from src.apps.projects.enums import ProjectInclude
 from src.apps.projects.models import Project
-from src.apps.projects.repository import ProjectRepository
-from src.apps.projects.schemas import ProjectIn, ProjectOut
-from src.core.pagination import Pagination, SortEnum
+from src.apps.projects.repository import PROJECT_ROW_FIELDS, ProjectRepository
+from src.apps.projects.schemas import ProjectIn, ProjectOut, ProjectTaskCountsOut
+from src.apps.tasks.cache_repositories import CacheTasks
+from src.apps.tasks.enums import Status
+from src.apps.tasks.models import Task
+from src.apps.tasks.repository import TASK_ROW_FIELDS
+from src.apps.tasks.schemas import TaskOut
+from src.core.pagination import JsonPage, Pagination, SortEnum, get_next_row_cursor
+from src.core.search import Search
+from src.core.utils.db import UNIQUE_VIOLATION, get_sqlstate
+from src.core.utils.serialization import make_objects
 from src.exceptions import ProjectAlreadyExistsException, ProjectNotFoundException
 
 logger = logging.getLogger(__name__)
 
 
+def _make_project_out(project: Project) -> ProjectOut:
+    # Project.tasks is never loaded, tasks and task counts are set only when they are included.
+    return ProjectOut(
+        id=project.id,
+        name=project.name,
+        created_at=project.created_at,
+        updated_at=project.updated_at,
+    )
+
+
 @dataclass
 class ProjectService:
     project_repository: ProjectRepository
+    cache_task_repository: CacheTasks
 
     async def create(self, *, user_id: uuid.UUID, payload: ProjectIn) -> ProjectOut:
-        exists_project: Project | None = await self.project_repository.get_by_name(
-            user_id=user_id,
-            name=payload.name,
-        )
-        if not exists_project:
-            project: Project | None = await self.project_repository.create(
+        """
+        Creates the project with one statement, a taken name is reported by the unique constraint.
+        """
+        try:
+            project: Project = await self.project_repository.create(
                 user_id=user_id,
                 payload=payload.model_dump(),
             )
-            return ProjectOut.model_validate(project)
-        raise ProjectAlreadyExistsException
+        except IntegrityError as e:
+            self._raise_conflict(e)
+            raise
+        return _make_project_out(project)
+
+    async def get_all(
+        self,
+        *,
+        user_id: uuid.UUID,
+        pagination: Pagination,
+        include: set[ProjectInclude],
+        tasks_limit: int,
+    ) -> JsonPage:
+        """
+        Returns the page of projects encoded to the JSON of ``list[ProjectOut]`` from the rows.
 
-    async def get_all(self, *, user_id: uuid.UUID, pagination: Pagination) -> list[ProjectOut]:
+        Tasks and task counts are read for the whole page at once and only if they are included.
+        """
         order = desc if pagination.order == SortEnum.DESC else asc
-        projects: list[Project] = await self.project_repository.get_all(
+        rows: Sequence[Row] = await self.project_repository.get_all_rows(
             user_id=user_id,
             order=order,
             page=pagination.page,
             per_page=pagination.perPage,
+            cursor=pagination.cursor,
+        )
+        projects: list[dict] = make_objects(rows, PROJECT_ROW_FIELDS)
+        project_ids: list[uuid.UUID] = [uuid.UUID(project["id"]) for project in projects]
+        tasks: dict[str, list[dict]] = {}
+        if ProjectInclude.tasks in include:
+            tasks = {project["id"]: [] for project in projects}
+            task_rows: Sequence[Row] = await self.project_repository.get_tasks_rows(
+                project_ids=project_ids,
+                limit=tasks_limit,
+            )
+            for task in make_objects(task_rows, TASK_ROW_FIELDS):
+                tasks[task["projectId"]].append(task)
+        task_counts: dict[str, dict[str, int]] = {}
+        if ProjectInclude.task_counts in include:
+            task_counts = await self._get_task_counts(project_ids=project_ids)
+        for project in projects:
+            project["tasks"] = tasks.get(project["id"])
+            project["taskCounts"] = task_counts.get(project["id"])
+        return JsonPage(
+            content=orjson.dumps(projects),
+            next_cursor=get_next_row_cursor(rows=rows, pagination=pagination),
+        )
+
+    async def search(self, *, user_id: uuid.UUID, search: Search) -> JsonPage:
+        """
+        Returns the page of the projects matching the text encoded to the JSON of ``list[ProjectOut]``.
+        """
+        rows: Sequence[Row] = await self.project_repository.search_rows(
+            user_id=user_id,
+            text=search.text,
+            page=search.page,
+            per_page=search.perPage,
         )
-        return [ProjectOut.model_validate(project) for project in projects]
+        projects: list[dict] = make_objects(rows, PROJECT_ROW_FIELDS)
+        for project in projects:
+            project["tasks"] = project["taskCounts"] = None
+        return JsonPage(content=orjson.dumps(projects), next_cursor=None)
 
-    async def get(self, *, user_id: uuid.UUID, project_id: uuid.UUID) -> ProjectOut:
+    async def get(
+        self,
+        *,
+        user_id: uuid.UUID,
+        project_id: uuid.UUID,
+        include: set[ProjectInclude],
+        tasks_limit: int,
+    ) -> ProjectOut:
         project: Project | None = await self.project_repository.get(
             user_id=user_id,
             project_id=project_id,
         )
         if project is None:
             raise ProjectNotFoundException
-        return ProjectOut.model_validate(project)
+        project_out: ProjectOut = _make_project_out(project)
+        if ProjectInclude.tasks in include:
+            tasks: list[Task] = await self.project_repository.get_tasks(project_id=project_id, limit=tasks_limit)
+            project_out.tasks = [TaskOut.model_validate(task) for task in tasks]
+        if ProjectInclude.task_counts in include:
+            task_counts: dict[str, dict[str, int]] = await self._get_task_counts(project_ids=[project_id])
+            project_out.task_counts = ProjectTaskCountsOut.model_validate(task_counts[str(project_id)])
+        return project_out
 
     async def update(self, *, user_id: uuid.UUID, project_id: uuid.UUID, payload: ProjectIn) -> ProjectOut:
-        project: Project | None = await self.project_repository.get(
-            user_id=user_id,
-            project_id=project_id,
-        )
-        if project:
-            if project.name == payload.name:
-                return ProjectOut.model_validate(project)
-            updated_project: Project | None = await self.project_repository.update(
-                project_id=project.id,
+        try:
+            project: Project | None = await self.project_repository.update(
+                user_id=user_id,
+                project_id=project_id,
                 payload=payload.model_dump(exclude_unset=True),
             )
-            return ProjectOut.model_validate(updated_project)
-        raise ProjectNotFoundException
+        except IntegrityError as e:
+            self._raise_conflict(e)
+            raise
+        if project is None:
+            raise ProjectNotFoundException
+        return _make_project_out(project)
 
     async def delete(self, *, user_id: uuid.UUID, project_id: uuid.UUID) -> None:
-        project: Project | None = await self.project_repository.get(
-            user_id=user_id,
-            project_id=project_id,
-        )
-        if project is None:
+        if not await self.project_repository.delete(user_id=user_id, project_id=project_id):
             raise ProjectNotFoundException
-        await self.project_repository.delete(project_id=project_id)
+        # Tasks of the project are deleted in cascade.
+        await self.cache_task_repository.invalidate(user_id=user_id)
+
+    async def _get_task_counts(self, *, project_ids: list[uuid.UUID]) -> dict[str, dict[str, int]]:
+        """
+        Returns the number of tasks of every project by status, in the order of ``ProjectTaskCountsOut``.
+        """
+        task_counts: dict[str, dict[str, int]] = {
+            str(project_id): {status.value: 0 for status in Status} for project_id in project_ids
+        }
+        for project_id, status, count in await self.project_repository.get_task_counts(project_ids=project_ids):
+            task_counts[str(project_id)][status.value] = count
+        return task_counts
+
+    @staticmethod
+    def _raise_conflict(error: IntegrityError) -> None:
+        if get_sqlstate(error) == UNIQUE_VIOLATION:
+            raise ProjectAlreadyExistsException from error
@@ -5,6 +5,7 @@ from sqladmin import ModelView
 
 from src.apps.auth.services import AuthService
 from src.apps.tasks.models import Task
+from src.dependencies import get_cache_tasks_repository
 
 
 class TaskAdmin(ModelView, model=Task):
@@ -18,6 +19,9 @@ class TaskAdmin(ModelView, model=Task):
     column_sortable_list = [
         Task.name,
     ]
+    form_excluded_columns = [
+        Task.search_vector,
+    ]
 
     name = "Task"
     name_plural = "Tasks"
@@ -32,3 +36,16 @@ class TaskAdmin(ModelView, model=Task):
                     access_token=token,
                 )
                 data["user_id"] = user_id
+        else:
+            # The task may be moved to another user, the tasks of the previous one are invalidated too.
+            request.state.task_user_id = model.user_id
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        cache_tasks_repository = get_cache_tasks_repository()
+        await cache_tasks_repository.invalidate(user_id=model.user_id)
+        previous_user_id: uuid.UUID | None = getattr(request.state, "task_user_id", None)
+        if previous_user_id is not None and previous_user_id != model.user_id:
+            await cache_tasks_repository.invalidate(user_id=previous_user_id)
+
+    async def after_model_delete(self, model, request) -> None:
+        await get_cache_tasks_repository().invalidate(user_id=model.user_id)
@@ -1,22 +1,133 @@
+import hashlib
+import logging
+import uuid
+
+import orjson
 from redis import Redis
+from redis.exceptions import RedisError
+
+from src.apps.tasks.schemas import TaskOut, TasksFilterIn, TasksStatsOut
+from src.core.pagination import JsonPage, Pagination, encode_cursor
+from src.core.settings import cache
 
-from src.apps.tasks.schemas import TaskOut
+logger = logging.getLogger(__name__)
 
 
 class CacheTasks:
+    """
+    Per-user read-through cache of the task pages and tasks.
+
+    Keys contain the version of the tasks of the user, so every write only increments
+    the version and the old entries are never read again and expire after ``TASKS_CACHE_TTL`` seconds.
+    Redis errors are logged and treated as a miss, the cache is skipped if ``TASKS_CACHE_ENABLED`` is off.
+    """
+
     def __init__(self, *, redis: Redis) -> None:
         self.redis: Redis = redis
 
-    async def get_all(self) -> list[TaskOut]:
-        async with self.redis as redis:
-            tasks_json = await redis.lrange("tasks", 0, -1)
-            return [TaskOut.model_validate_json(task) for task in tasks_json]  # type: ignore
+    async def get_version(self, *, user_id: uuid.UUID) -> int | None:
+        """
+        Returns the version of the tasks of the user or None if the cache is not available.
+        """
+        if not cache.TASKS_CACHE_ENABLED:
+            return None
+        try:
+            version = await self.redis.get(self._make_version_key(user_id))
+        except RedisError:
+            logger.warning("Failed to get the tasks version of the user %s from the cache", user_id, exc_info=True)
+            return None
+        return int(version or 0)
+
+    async def get_page(
+        self,
+        *,
+        user_id: uuid.UUID,
+        version: int,
+        pagination: Pagination,
+        filters: TasksFilterIn,
+    ) -> JsonPage | None:
+        page_value: bytes | None = await self._get(self._make_page_key(user_id, version, pagination, filters))
+        if page_value is None:
+            return None
+        next_cursor, _, content = page_value.partition(b"\n")
+        return JsonPage(content=content, next_cursor=next_cursor.decode() or None)
+
+    async def set_page(
+        self,
+        *,
+        user_id: uuid.UUID,
+        version: int,
+        pagination: Pagination,
+        filters: TasksFilterIn,
+        page: JsonPage,
+    ) -> None:
+        # The cursor is base64 and the content is compact JSON, so neither contains a newline.
+        await self._set(
+            self._make_page_key(user_id, version, pagination, filters),
+            (page.next_cursor or "").encode() + b"\n" + page.content,
+        )
+
+    async def get(self, *, user_id: uuid.UUID, version: int, task_id: uuid.UUID) -> TaskOut | None:
+        task_json: bytes | None = await self._get(self._make_task_key(user_id, version, task_id))
+        if task_json is None:
+            return None
+        return TaskOut.model_validate_json(task_json)
+
+    async def set(self, *, user_id: uuid.UUID, version: int, task: TaskOut) -> None:
+        await self._set(self._make_task_key(user_id, version, task.id), orjson.dumps(task.model_dump(), default=str))
+
+    async def get_stats(self, *, user_id: uuid.UUID, version: int) -> TasksStatsOut | None:
+        stats_json: bytes | None = await self._get(self._make_stats_key(user_id, version))
+        if stats_json is None:
+            return None
+        return TasksStatsOut.model_validate_json(stats_json)
+
+    async def set_stats(self, *, user_id: uuid.UUID, version: int, stats: TasksStatsOut) -> None:
+        # The overdue counts may be stale until they expire as the time passes.
+        await self._set(self._make_stats_key(user_id, version), orjson.dumps(stats.model_dump(), default=str))
+
+    async def invalidate(self, *, user_id: uuid.UUID) -> None:
+        """
+        Makes all cached tasks of the user stale by incrementing the version of the tasks.
+        """
+        if not cache.TASKS_CACHE_ENABLED:
+            return
+        try:
+            await self.redis.incr(self._make_version_key(user_id))
+        except RedisError:
+            logger.warning("Failed to invalidate the tasks of the user %s in the cache", user_id, exc_info=True)
+
+    async def _get(self, key: str) -> bytes | None:
+        try:
+            return await self.redis.get(key)
+        except RedisError:
+            logger.warning("Failed to get %s from the cache", key, exc_info=True)
+            return None
+
+    async def _set(self, key: str, value: bytes) -> None:
+        try:
+            await self.redis.set(key, value, ex=cache.TASKS_CACHE_TTL)
+        except RedisError:
+            logger.warning("Failed to set %s to the cache", key, exc_info=True)
+
+    @staticmethod
+    def _make_version_key(user_id: uuid.UUID) -> str:
+        return f"tasks:{user_id}:version"
+
+    @staticmethod
+    def _make_page_key(user_id: uuid.UUID, version: int, pagination: Pagination, filters: TasksFilterIn) -> str:
+        if pagination.cursor is None:
+            position: str = f"page:{pagination.page}"
+        else:
+            position = f"cursor:{encode_cursor(created_at=pagination.cursor.created_at, id=pagination.cursor.id)}"
+        # Pages of the overdue tasks may be stale until they expire as the time passes.
+        filters_hash: str = hashlib.sha1(filters.model_dump_json().encode()).hexdigest()
+        return f"tasks:{user_id}:{version}:{pagination.order}:{pagination.perPage}:{filters_hash}:{position}"
 
-    async def create(self, tasks: list[TaskOut]) -> None:
-        tasks_json: list[str] = [task.model_dump_json() for task in tasks]
-        async with self.redis as redis:
-            await redis.lpush("tasks", *tasks_json)
+    @staticmethod
+    def _make_task_key(user_id: uuid.UUID, version: int, task_id: uuid.UUID) -> str:
+        return f"tasks:{user_id}:{version}:task:{task_id}"
 
-    async def delete(self):
-        async with self.redis as redis:
-            await redis.delete("tasks")
+    @staticmethod
+    def _make_stats_key(user_id: uuid.UUID, version: int) -> str:
+        return f"tasks:{user_id}:{version}:stats"
@@ -31,3 +31,33 @@ class Status(str, Enum):
     progress = "progress"
     completed = "completed"
     expired = "expired"
+
+
+class TasksFileFormat(str, Enum):
+    """
+    This class represents the format of the tasks export and import files.
+
+    Attributes:
+        ndjson (str): One JSON object per line.
+        csv (str): Comma separated values with a header.
+    """
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class TaskSort(str, Enum):
+    """
+    This class represents the field the tasks are sorted by.
+
+    Attributes:
+        created_at (str): The creation time, the only sort supporting the cursor.
+        updated_at (str): The time of the last update.
+        deadline (str): The deadline, tasks without a deadline are sorted as the latest ones.
+        priority (str): The priority, from low to high.
+    """
+
+    created_at = "createdAt"
+    updated_at = "updatedAt"
+    deadline = "deadline"
+    priority = "priority"
@@ -2,11 +2,11 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, UniqueConstraint, text
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.apps.tasks.enums import Priority, Status
-from src.core.db import Base, str_500
+from src.core.db import Base, name_search_vector, str_500
 from src.core.models import TimestampMixin
 
 if TYPE_CHECKING:
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 class Task(TimestampMixin, Base):
     name: Mapped[str_500]
+    search_vector: Mapped[name_search_vector]
     priority: Mapped[Priority] = mapped_column(
         default=Priority.low,
         server_default=text("'low'"),
@@ -36,9 +37,10 @@ class Task(TimestampMixin, Base):
             ondelete="CASCADE",
         )
     )
+    # TaskOut has no project, so it is never joined, load it with an explicit loader option when needed.
     project: Mapped["Project"] = relationship(
         back_populates="tasks",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
@@ -46,6 +48,61 @@ class Task(TimestampMixin, Base):
             "name",
             "user_id",
         ),
+        Index(
+            "tasks_user_id_created_at_id_idx",
+            "user_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "tasks_project_id_created_at_idx",
+            "project_id",
+            "created_at",
+        ),
+        Index(
+            "tasks_user_id_status_created_at_idx",
+            "user_id",
+            "status",
+            "created_at",
+        ),
+        Index(
+            "tasks_user_id_priority_created_at_idx",
+            "user_id",
+            "priority",
+            "created_at",
+        ),
+        Index(
+            "tasks_user_id_updated_at_created_at_idx",
+            "user_id",
+            "updated_at",
+            "created_at",
+        ),
+        Index(
+            "tasks_user_id_deadline_created_at_idx",
+            "user_id",
+            "deadline",
+            "created_at",
+        ),
+        Index(
+            "tasks_user_id_overdue_deadline_idx",
+            "user_id",
+            "deadline",
+            "created_at",
+            postgresql_where=text("status IN ('pending', 'progress') AND deadline IS NOT NULL"),
+        ),
+        Index(
+            "tasks_user_id_search_vector_idx",
+            "user_id",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "tasks_user_id_name_trgm_idx",
+            "user_id",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,49 +1,257 @@
 import logging
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
+from datetime import datetime
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    desc,
+    exists,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
+from src.apps.projects.models import Project
+from src.apps.tasks.enums import Priority, Status, TaskSort
 from src.apps.tasks.models import Task
+from src.core.pagination import Cursor
+from src.core.utils.db import make_name_search, set_word_similarity_threshold
+from src.core.utils.serialization import api_datetime, api_uuid
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Rows of one multi-row INSERT, asyncpg accepts up to 32767 parameters per statement.
+CREATE_MANY_CHUNK_SIZE = 1000
+# Rows fetched from the server-side cursor at once.
+STREAM_BATCH_SIZE = 1000
+
+# Fields of TaskOut in the response, selected by ``get_task_row_columns``.
+TASK_ROW_FIELDS: tuple[str, ...] = ("id", "name", "projectId", "priority", "status", "createdAt", "updatedAt")
+
+# Statuses of the tasks which are overdue once their deadline has passed.
+ACTIVE_STATUSES: tuple[Status, ...] = (Status.pending, Status.progress)
+
+SORT_COLUMNS: dict[TaskSort, InstrumentedAttribute] = {
+    TaskSort.updated_at: Task.updated_at,
+    TaskSort.deadline: Task.deadline,
+    TaskSort.priority: Task.priority,
+}
+
+IMPORT_TABLE = "tasks_import"
+IMPORT_COLUMNS: tuple[str, ...] = ("line", "name", "project_id", "priority", "status")
+
+
+def get_task_row_columns() -> tuple[ColumnElement, ...]:
+    """
+    Returns the columns of ``TASK_ROW_FIELDS`` formatted by the database like ``TaskOut`` does.
+    """
+    columns: tuple[ColumnElement, ...] = (
+        api_uuid(Task.id),
+        Task.name,
+        api_uuid(Task.project_id),
+        Task.priority,
+        Task.status,
+        api_datetime(Task.created_at),
+        api_datetime(Task.updated_at),
+    )
+    return tuple(column.label(field) for column, field in zip(columns, TASK_ROW_FIELDS, strict=True))
+
 
 @dataclass
 class TaskRepository:
     session: AsyncSession
 
     async def create(self, *, user_id: uuid.UUID, payload: dict) -> Task | None:
-        task: Task | None = (
-            await self.session.execute(
-                insert(
-                    Task,
-                )
-                .values(user_id=user_id, **payload)
-                .returning(Task)
+        """
+        Creates the task with one INSERT ... SELECT which inserts nothing if the project
+        of the task does not belong to the user, then None is returned.
+
+        Raises:
+            IntegrityError: If the name is taken or the project was deleted meanwhile.
+        """
+        values: dict = {"user_id": user_id, **payload}
+        query = (
+            insert(Task)
+            .from_select(
+                list(values),
+                select(*(literal(value, Task.__table__.c[key].type) for key, value in values.items())).where(
+                    self._make_project_guard(user_id=user_id, project_id=payload.get("project_id"))
+                ),
             )
-        ).scalar()
+            .returning(Task)
+        )
+        try:
+            task: Task | None = (await self.session.execute(query)).scalar()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         await self.session.commit()
         return task
 
+    async def create_many(self, *, user_id: uuid.UUID, payloads: list[dict]) -> list[Task]:
+        """
+        Inserts the tasks with multi-row INSERTs in one transaction.
+
+        Tasks whose name is already taken by the user are skipped and not returned.
+
+        Raises:
+            IntegrityError: If a project was deleted meanwhile, nothing is inserted.
+        """
+        tasks: list[Task] = []
+        try:
+            for start in range(0, len(payloads), CREATE_MANY_CHUNK_SIZE):
+                chunk: list[dict] = payloads[start : start + CREATE_MANY_CHUNK_SIZE]
+                result = await self.session.scalars(
+                    postgresql.insert(Task)
+                    .values([{"user_id": user_id, **payload} for payload in chunk])
+                    .on_conflict_do_nothing(index_elements=[Task.name, Task.user_id])
+                    .returning(Task)
+                )
+                tasks.extend(result)
+        except IntegrityError:
+            await self.session.rollback()
+            raise
+        await self.session.commit()
+        return tasks
+
     async def get_all(
         self,
         user_id: uuid.UUID,
         order,
         page: int,
         per_page: int,
+        cursor: Cursor | None = None,
     ) -> list[Task]:
+        query = self._make_page_query(
+            select(Task),
+            user_id=user_id,
+            order=order,
+            page=page,
+            per_page=per_page,
+            cursor=cursor,
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().unique())
+
+    async def get_all_rows(
+        self,
+        user_id: uuid.UUID,
+        order,
+        page: int,
+        per_page: int,
+        cursor: Cursor | None = None,
+        sort: TaskSort = TaskSort.created_at,
+        status: list[Status] | None = None,
+        priority: list[Priority] | None = None,
+        project_id: uuid.UUID | None = None,
+        deadline_from: datetime | None = None,
+        deadline_to: datetime | None = None,
+        overdue: bool | None = None,
+    ) -> Sequence[Row]:
+        """
+        Returns a page of the filtered tasks as rows of ``TASK_ROW_FIELDS`` ready for the response
+        followed by ``created_at``.
+
+        The cursor is used only with the sort by ``created_at``, other sorts are paginated by offset.
+        """
+        query = self._make_page_query(
+            select(*get_task_row_columns(), Task.created_at).where(
+                *self._make_list_filters(status, priority, project_id, deadline_from, deadline_to, overdue)
+            ),
+            user_id=user_id,
+            order=order,
+            page=page,
+            per_page=per_page,
+            cursor=cursor,
+            sort=sort,
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def search_rows(self, *, user_id: uuid.UUID, text: str, page: int, per_page: int) -> Sequence[Row]:
+        """
+        Returns a page of the tasks whose names match the text as rows of ``TASK_ROW_FIELDS``, the most relevant first.
+        """
+        await set_word_similarity_threshold(self.session)
+        condition, rank = make_name_search(search_vector=Task.search_vector, name=Task.name, text=text)
         result = await self.session.execute(
-            select(Task)
-            .where(Task.user_id == user_id)
-            .limit(per_page)
-            .offset(page - 1 if page == 1 else (page - 1) * per_page)
+            select(*get_task_row_columns())
+            .where(Task.user_id == user_id, condition)
             .order_by(
-                order(Task.created_at),
-            ),
+                desc(rank),
+                desc(Task.created_at),
+                desc(Task.id),
+            )
+            .limit(per_page)
+            .offset((page - 1) * per_page)
         )
-        return list(result.scalars().unique())
+        return result.all()
+
+    async def get_stats(self, *, user_id: uuid.UUID) -> Sequence[Row]:
+        """
+        Returns the counts of the tasks of the user with one GROUP BY as rows of ``project_id``, ``is_total``,
+        ``total``, ``overdue`` and ``status_<status>``, ``priority_<priority>`` for every status and priority.
+
+        There is a row per project (``project_id`` is None for the tasks without a project)
+        and the row of all tasks of the user with ``is_total`` set.
+        """
+        result = await self.session.execute(
+            select(
+                Task.project_id,
+                func.grouping(Task.project_id).label("is_total"),
+                func.count().label("total"),
+                func.count().filter(*self._make_list_filters(overdue=True)).label("overdue"),
+                *(func.count().filter(Task.status == status).label(f"status_{status.value}") for status in Status),
+                *(
+                    func.count().filter(Task.priority == priority).label(f"priority_{priority.value}")
+                    for priority in Priority
+                ),
+            )
+            .where(Task.user_id == user_id)
+            .group_by(func.rollup(Task.project_id))
+        )
+        return result.all()
+
+    async def stream_all(self, *, user_id: uuid.UUID) -> AsyncIterator[Sequence[Row]]:
+        """
+        Yields all tasks of the user as batches of rows read from a server-side cursor.
+        """
+        result = await self.session.stream(
+            select(
+                Task.id,
+                Task.name,
+                Task.project_id,
+                Task.priority,
+                Task.status,
+                Task.created_at,
+                Task.updated_at,
+            )
+            .where(Task.user_id == user_id)
+            .order_by(Task.created_at, Task.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield rows
 
     async def get(self, task_id: uuid.UUID, user_id: uuid.UUID) -> Task | None:
         return await self.session.scalar(
@@ -52,31 +260,282 @@ class TaskRepository:
             ).where(Task.id == task_id, Task.user_id == user_id),
         )
 
-    async def get_by_name(self, *, user_id: uuid.UUID, name: str) -> Task | None:
-        return await self.session.scalar(
-            select(
-                Task,
-            ).where(Task.user_id == user_id, Task.name == name),
+    async def get_names(self, *, user_id: uuid.UUID, names: list[str]) -> set[str]:
+        """
+        Returns the given names which are already taken by the tasks of the user.
+        """
+        result = await self.session.scalars(
+            select(Task.name).where(Task.user_id == user_id, Task.name.in_(names)),
         )
+        return set(result)
 
-    async def update(self, *, task_id: uuid.UUID, payload: dict) -> Task | None:
-        task: Task | None = (
-            await self.session.execute(
-                update(Task)
-                .where(
-                    Task.id == task_id,
-                )
-                .values(**payload)
-                .returning(Task)
+    async def update(self, *, user_id: uuid.UUID, task_id: uuid.UUID, payload: dict) -> Task | None:
+        """
+        Updates the task of the user with one UPDATE and returns it or None if the task is not found
+        or the new project does not belong to the user. ``updated_at`` is kept if nothing changes.
+
+        Raises:
+            IntegrityError: If the name is taken or the project was deleted meanwhile.
+        """
+        query = (
+            update(Task)
+            .where(
+                Task.id == task_id,
+                Task.user_id == user_id,
+                self._make_project_guard(user_id=user_id, project_id=payload.get("project_id")),
             )
-        ).scalar()
+            .values(**payload, updated_at=self._make_updated_at(payload))
+            .returning(Task)
+        )
+        try:
+            task: Task | None = (await self.session.execute(query)).scalar()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         await self.session.commit()
         return task
 
-    async def delete(self, *, user_id: uuid.UUID, task_id: uuid.UUID) -> None:
+    async def delete(self, *, user_id: uuid.UUID, task_id: uuid.UUID) -> bool:
+        """
+        Deletes the task of the user and returns whether it existed.
+        """
+        task_id = await self.session.scalar(
+            delete(Task).where(Task.id == task_id, Task.user_id == user_id).returning(Task.id),
+        )
+        await self.session.commit()
+        return task_id is not None
+
+    @staticmethod
+    def _make_updated_at(payload: dict) -> ColumnElement[datetime]:
+        changed: ColumnElement[bool] = or_(
+            false(),
+            *(Task.__table__.c[key].is_distinct_from(value) for key, value in payload.items()),
+        )
+        return case((changed, func.now()), else_=Task.updated_at)
+
+    @staticmethod
+    def _make_project_guard(*, user_id: uuid.UUID, project_id: uuid.UUID | None) -> ColumnElement[bool]:
+        if project_id is None:
+            return true()
+        return exists().where(Project.id == project_id, Project.user_id == user_id)
+
+    async def update_many(
+        self,
+        *,
+        user_id: uuid.UUID,
+        payload: dict,
+        ids: list[uuid.UUID] | None = None,
+        project_id: uuid.UUID | None = None,
+        priority: Priority | None = None,
+        status: Status | None = None,
+    ) -> list[uuid.UUID]:
+        """
+        Updates the tasks of the user matching the ids and the filters with one UPDATE and returns their ids.
+        ``updated_at`` is kept for the tasks which do not change.
+        """
+        result = await self.session.scalars(
+            update(Task)
+            .where(*self._make_bulk_filters(user_id, ids, project_id, priority, status))
+            .values(**payload, updated_at=self._make_updated_at(payload))
+            .returning(Task.id)
+        )
+        task_ids: list[uuid.UUID] = list(result)
+        await self.session.commit()
+        return task_ids
+
+    async def delete_many(
+        self,
+        *,
+        user_id: uuid.UUID,
+        ids: list[uuid.UUID] | None = None,
+        project_id: uuid.UUID | None = None,
+        priority: Priority | None = None,
+        status: Status | None = None,
+    ) -> list[uuid.UUID]:
+        """
+        Deletes the tasks of the user matching the ids and the filters with one DELETE.
+        """
+        result = await self.session.scalars(
+            delete(Task).where(*self._make_bulk_filters(user_id, ids, project_id, priority, status)).returning(Task.id)
+        )
+        task_ids: list[uuid.UUID] = list(result)
+        await self.session.commit()
+        return task_ids
+
+    @staticmethod
+    def _make_bulk_filters(
+        user_id: uuid.UUID,
+        ids: list[uuid.UUID] | None,
+        project_id: uuid.UUID | None,
+        priority: Priority | None,
+        status: Status | None,
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = [Task.user_id == user_id]
+        if ids is not None:
+            # One array parameter instead of a parameter per id.
+            filters.append(Task.id == any_(bindparam("ids", ids, type_=postgresql.ARRAY(postgresql.UUID))))
+        if project_id is not None:
+            filters.append(Task.project_id == project_id)
+        if priority is not None:
+            filters.append(Task.priority == priority)
+        if status is not None:
+            filters.append(Task.status == status)
+        return filters
+
+    async def start_import(self) -> None:
+        """
+        Creates the staging table of the import, it is dropped with the end of the transaction.
+        """
         await self.session.execute(
-            delete(
-                Task,
-            ).where(Task.id == task_id, Task.user_id == user_id)
+            text(
+                f"""
+                CREATE TEMPORARY TABLE {IMPORT_TABLE} (
+                    line integer NOT NULL,
+                    name varchar(500) NOT NULL,
+                    project_id uuid,
+                    priority priority NOT NULL,
+                    status status NOT NULL,
+                    error text
+                ) ON COMMIT DROP
+                """
+            )
+        )
+
+    async def copy_import_rows(self, rows: list[tuple]) -> None:
+        """
+        Loads the rows into the staging table with COPY.
+        """
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+            IMPORT_TABLE,
+            records=rows,
+            columns=IMPORT_COLUMNS,
+        )
+
+    async def finish_import(self, *, user_id: uuid.UUID, errors_limit: int) -> tuple[int, int, list[tuple[int, str]]]:
+        """
+        Moves the rows of the staging table without errors into the tasks of the user and commits.
+
+        Returns the number of created tasks, the number of the rejected rows and the lines
+        of the first ``errors_limit`` of them with the reasons.
+        """
+        params: dict = {"user_id": user_id}
+        await self.session.execute(text(f"ANALYZE {IMPORT_TABLE}"))
+        await self.session.execute(
+            text(
+                f"""
+                UPDATE {IMPORT_TABLE} i SET error = 'Project not found'
+                WHERE i.project_id IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = i.project_id AND p.user_id = :user_id)
+                """
+            ),
+            params,
+        )
+        await self.session.execute(
+            text(
+                f"""
+                UPDATE {IMPORT_TABLE} i SET error = 'Task already exists'
+                FROM (
+                    SELECT line, row_number() OVER (PARTITION BY name ORDER BY line) AS position
+                    FROM {IMPORT_TABLE} WHERE error IS NULL
+                ) d
+                WHERE d.line = i.line
+                  AND (d.position > 1 OR EXISTS (SELECT 1 FROM tasks t WHERE t.user_id = :user_id AND t.name = i.name))
+                """
+            ),
+            params,
         )
+        # Names taken by concurrent requests after the checks are skipped by the insert.
+        created: int = (
+            await self.session.execute(
+                text(
+                    f"""
+                    WITH created AS (
+                        INSERT INTO tasks (name, user_id, project_id, priority, status, created_at, updated_at)
+                        SELECT name, :user_id, project_id, priority, status, clock_timestamp(), clock_timestamp()
+                        FROM {IMPORT_TABLE}
+                        WHERE error IS NULL
+                        ORDER BY line
+                        ON CONFLICT (name, user_id) DO NOTHING
+                        RETURNING name
+                    ), skipped AS (
+                        UPDATE {IMPORT_TABLE} i SET error = 'Task already exists'
+                        WHERE i.error IS NULL AND NOT EXISTS (SELECT 1 FROM created c WHERE c.name = i.name)
+                    )
+                    SELECT count(*) FROM created
+                    """
+                ),
+                params,
+            )
+        ).scalar_one()
+        errors: Sequence[Row] = (
+            await self.session.execute(
+                text(
+                    f"""
+                    SELECT line, error, count(*) OVER () AS rejected_count FROM {IMPORT_TABLE}
+                    WHERE error IS NOT NULL ORDER BY line LIMIT :limit
+                    """
+                ),
+                {"limit": errors_limit},
+            )
+        ).all()
+        rejected: list[tuple[int, str]] = [(line, error) for line, error, _ in errors]
         await self.session.commit()
+        # The window count is computed before the limit, so it counts all rejected rows.
+        return created, errors[0].rejected_count if errors else 0, rejected
+
+    @staticmethod
+    def _make_list_filters(
+        status: list[Status] | None = None,
+        priority: list[Priority] | None = None,
+        project_id: uuid.UUID | None = None,
+        deadline_from: datetime | None = None,
+        deadline_to: datetime | None = None,
+        overdue: bool | None = None,
+    ) -> list[ColumnElement[bool]]:
+        filters: list[ColumnElement[bool]] = []
+        if status is not None:
+            filters.append(Task.status.in_(status))
+        if priority is not None:
+            filters.append(Task.priority.in_(priority))
+        if project_id is not None:
+            filters.append(Task.project_id == project_id)
+        if deadline_from is not None:
+            filters.append(Task.deadline >= deadline_from)
+        if deadline_to is not None:
+            filters.append(Task.deadline < deadline_to)
+        if overdue is not None:
+            # Deadlines are stored in UTC without the time zone. The statuses are inlined,
+            # so the condition matches the predicate of tasks_user_id_overdue_deadline_idx.
+            now: ColumnElement[datetime] = func.timezone("UTC", func.now())
+            active = bindparam("active_statuses", list(ACTIVE_STATUSES), expanding=True, literal_execute=True)
+            if overdue:
+                filters.append(and_(Task.status.in_(active), Task.deadline < now))
+            else:
+                filters.append(or_(Task.status.not_in(active), Task.deadline.is_(None), Task.deadline >= now))
+        return filters
+
+    @staticmethod
+    def _make_page_query(
+        query: Select,
+        *,
+        user_id: uuid.UUID,
+        order,
+        page: int,
+        per_page: int,
+        cursor: Cursor | None,
+        sort: TaskSort = TaskSort.created_at,
+    ) -> Select:
+        query = query.where(Task.user_id == user_id).limit(per_page)
+        if sort != TaskSort.created_at:
+            query = query.order_by(order(SORT_COLUMNS[sort]))
+        query = query.order_by(
+            order(Task.created_at),
+            order(Task.id),
+        )
+        if cursor is None:
+            return query.offset(page - 1 if page == 1 else (page - 1) * per_page)
+        position = tuple_(Task.created_at, Task.id)
+        last_position = tuple_(literal(cursor.created_at), literal(cursor.id))
+        return query.where(position < last_position if order is desc else position > last_position)
@@ -2,13 +2,39 @@ import logging
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
-
-from src.apps.tasks.schemas import TaskIn, TaskOut
-from src.apps.tasks.services import TasksService
-from src.core.pagination import Pagination, pagination_params
-from src.dependencies import get_request_user_id, get_tasks_service
-from src.exceptions import ProjectNotFoundException, TaskAlreadyExistsException, TaskNotFoundException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from src.apps.tasks.enums import TasksFileFormat
+from src.apps.tasks.schemas import (
+    TaskIn,
+    TaskOut,
+    TasksBulkDeleteIn,
+    TasksBulkDeleteOut,
+    TasksBulkIn,
+    TasksBulkOut,
+    TasksBulkUpdateIn,
+    TasksBulkUpdateOut,
+    TasksFilterIn,
+    TasksImportOut,
+    TasksStatsOut,
+)
+from src.apps.tasks.services import TasksExportService, TasksService
+from src.core.pagination import JsonPage, Pagination, make_page_response, pagination_params
+from src.core.search import Search, search_params
+from src.dependencies import (
+    get_request_user_id,
+    get_tasks_export_service,
+    get_tasks_filter,
+    get_tasks_read_service,
+    get_tasks_service,
+)
+from src.exceptions import (
+    ProjectNotFoundException,
+    TaskAlreadyExistsException,
+    TaskNotFoundException,
+    TasksImportFileNotValidException,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -53,6 +79,130 @@ async def create_task(
         )
 
 
+@router.post(
+    "/bulk",
+    name="Create many tasks",
+    response_model=TasksBulkOut,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_bulk(
+    payload: TasksBulkIn,
+    task_service: Annotated[TasksService, Depends(get_tasks_service)],
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+) -> TasksBulkOut:
+    """
+    Create up to 5000 tasks for the authenticated user in one request.
+
+    **Request**:
+    - **tasks**: List of tasks with the same fields as for creating one task.
+
+    **Response**:
+    - **created**: The created tasks in the order of the request.
+    - **errors**: The tasks which were not created with their `index` in the request and the `detail`:
+        - `Project not found`: Provided project does not exist.
+        - `Task already exists`: Task with the same name already exists or is repeated in the request.
+
+    **Responses:**
+    - `201 Created`: Valid tasks are created, the rest are reported in `errors`.
+    - `422 Unprocessable Entity`: Request is empty, too large or has not valid tasks.
+    """
+    return await task_service.create_bulk(user_id=user_id, payloads=payload.tasks)
+
+
+@router.patch(
+    "/bulk",
+    name="Update many tasks",
+    response_model=TasksBulkUpdateOut,
+    status_code=status.HTTP_200_OK,
+)
+async def update_tasks_bulk(
+    payload: TasksBulkUpdateIn,
+    task_service: Annotated[TasksService, Depends(get_tasks_service)],
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+) -> TasksBulkUpdateOut:
+    """
+    Update the priority or the status of many tasks of the authenticated user with one query.
+
+    **Request**:
+    - **filter**: Tasks to update, all given conditions must match:
+        - **ids**: Up to 5000 task IDs.
+        - **project_id**: ID of the project of the tasks.
+        - **priority**: Current priority of the tasks (`low`, `medium`, or `high`).
+        - **status**: Current status of the tasks (`pending`, `progress`, or `completed`).
+    - **priority**: Optional new priority of the tasks.
+    - **status**: Optional new status of the tasks.
+
+    **Responses:**
+    - `200 OK`: Returns the IDs of the updated tasks (empty list if no tasks match the filter).
+    - `422 Unprocessable Entity`: Filter is empty or nothing to update.
+    """
+    return await task_service.update_bulk(user_id=user_id, payload=payload)
+
+
+@router.delete(
+    "/bulk",
+    name="Delete many tasks",
+    response_model=TasksBulkDeleteOut,
+    status_code=status.HTTP_200_OK,
+)
+async def delete_tasks_bulk(
+    payload: TasksBulkDeleteIn,
+    task_service: Annotated[TasksService, Depends(get_tasks_service)],
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+) -> TasksBulkDeleteOut:
+    """
+    Delete many tasks of the authenticated user with one query.
+
+    **Request**:
+    - **filter**: Tasks to delete, with the same conditions as for updating many tasks.
+
+    **Responses:**
+    - `200 OK`: Returns the IDs of the deleted tasks (empty list if no tasks match the filter).
+    - `422 Unprocessable Entity`: Filter is empty.
+    """
+    return await task_service.delete_bulk(user_id=user_id, payload=payload)
+
+
+@router.post(
+    "/import",
+    name="Import tasks from a file",
+    response_model=TasksImportOut,
+    status_code=status.HTTP_200_OK,
+)
+async def import_tasks(
+    file: UploadFile,
+    task_service: Annotated[TasksService, Depends(get_tasks_service)],
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+    import_format: Annotated[TasksFileFormat, Query(alias="format")] = TasksFileFormat.ndjson,
+) -> TasksImportOut:
+    """
+    Import tasks of the authenticated user from an uploaded file, e.g. made by the export.
+
+    The file is read in chunks in a thread and loaded with COPY, all tasks are created in one transaction.
+
+    **Request**:
+    - **file**: UTF-8 file with the tasks, every task has `name` and optional `projectId`, `priority` and `status`.
+    - **format**: `ndjson` (default) for one JSON object per line or `csv` for comma separated values with a header.
+
+    **Response**:
+    - **total**: Number of the read rows.
+    - **created**: Number of the created tasks.
+    - **rejectedCount**: Number of the rows which are not imported.
+    - **rejected**: The first 1000 rows which are not imported with their `line` in the file and the `detail`.
+
+    **Responses:**
+    - `200 OK`: Valid tasks are created, the rest are reported in `rejected`.
+    - `400 Bad Request`: File is not UTF-8 or not valid CSV.
+    """
+    try:
+        return await task_service.import_tasks(user_id=user_id, file=file.file, file_format=import_format)
+    except TasksImportFileNotValidException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e.detail),
+        )
+
+
 @router.get(
     "",
     name="Get tasks",
@@ -60,10 +210,11 @@ async def create_task(
     status_code=status.HTTP_200_OK,
 )
 async def get_tasks(
-    task_service: Annotated[TasksService, Depends(get_tasks_service)],
+    task_service: Annotated[TasksService, Depends(get_tasks_read_service)],
     user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
     pagination: Annotated[Pagination, Depends(pagination_params)],
-) -> list[TaskOut]:
+    filters: Annotated[TasksFilterIn, Depends(get_tasks_filter)],
+) -> Response:
     """
     Get a list of all tasks for the authenticated user.
 
@@ -75,13 +226,109 @@ async def get_tasks(
         - **created_at**: The timestamp of when the task was created.
         - **updated_at**: The timestamp of when the task was last updated.
 
-    - **Pagination**: The response will be paginated based on the provided pagination parameters,
-      allowing users to fetch the projects in chunks.
+    - **Filters**: `status` and `priority` (repeat the parameter to pass several values), `projectId`,
+      `deadlineFrom`/`deadlineTo` and `overdue` for pending or in progress tasks with a passed deadline.
+    - **Sorting**: `sort` by `createdAt` (default), `updatedAt`, `deadline` or `priority` in the `order` direction,
+      tasks without a deadline are sorted as the latest ones.
+    - **Pagination**: The first page has `perPage` tasks. If there are more tasks, the `X-Next-Cursor`
+      response header contains the cursor of the next page. Pass it as `cursor` to get the next page
+      as fast as the first one. The cursor is available only for the sort by `createdAt`,
+      `page` is the OFFSET fallback for the other sorts and gets slower the deeper the page is.
 
     **Responses:**
     - `200 OK`: Returns a list of tasks (empty list if no tasks are found).
+    - `400 Bad Request`: Provided cursor is not valid, is used with another sort or the deadline range is empty.
+    """
+    page: JsonPage = await task_service.get_all(user_id=user_id, pagination=pagination, filters=filters)
+    return make_page_response(page)
+
+
+@router.get(
+    "/stats",
+    name="Get statistics of tasks",
+    response_model=TasksStatsOut,
+    status_code=status.HTTP_200_OK,
+)
+async def get_tasks_stats(
+    task_service: Annotated[TasksService, Depends(get_tasks_read_service)],
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+) -> TasksStatsOut:
+    """
+    Get the statistics of all tasks of the authenticated user and of the tasks of every project.
+
+    **Response**:
+    - **total**: The number of tasks.
+    - **status**, **priority**: The number of tasks by status and by priority.
+    - **overdue**: The number of pending and in progress tasks whose deadline has passed.
+    - **completionRate**: The share of completed tasks, from 0 to 1.
+    - **projects**: The same statistics for every project with tasks (`projectId` is null for tasks without a project).
+
+    **Responses:**
+    - `200 OK`: Returns the statistics (zeros if the user has no tasks).
     """
-    return await task_service.get_all(user_id=user_id, pagination=pagination)
+    return await task_service.get_stats(user_id=user_id)
+
+
+@router.get(
+    "/search",
+    name="Search tasks",
+    response_model=list[TaskOut],
+    status_code=status.HTTP_200_OK,
+)
+async def search_tasks(
+    task_service: Annotated[TasksService, Depends(get_tasks_read_service)],
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+    search: Annotated[Search, Depends(search_params)],
+) -> Response:
+    """
+    Search the tasks of the authenticated user by name.
+
+    **Request**:
+    - **q**: Words of the name, prefixes are enough (`med` finds `Meditation`), or a part of it with typos.
+    - **page**, **perPage**: Page of the results.
+
+    **Response**:
+    - Tasks with the same attributes as in the list of tasks, the most relevant first.
+
+    **Responses:**
+    - `200 OK`: Returns a list of tasks (empty list if no tasks are found).
+    """
+    page: JsonPage = await task_service.search(user_id=user_id, search=search)
+    return make_page_response(page)
+
+
+@router.get(
+    "/export",
+    name="Export all tasks",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_tasks(
+    export_service: Annotated[TasksExportService, Depends(get_tasks_export_service)],
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+    export_format: Annotated[TasksFileFormat, Query(alias="format")] = TasksFileFormat.ndjson,
+) -> StreamingResponse:
+    """
+    Export all tasks of the authenticated user as a file.
+
+    Tasks are read from a server-side cursor and streamed while they are read,
+    ordered by the creation time.
+
+    **Request**:
+    - **format**: `ndjson` (default) for one JSON object per line or `csv` for comma separated values with a header.
+
+    **Response**:
+    - Every task has `id`, `name`, `projectId`, `priority`, `status`, `createdAt` and `updatedAt`,
+      the timestamps are in ISO 8601 format.
+
+    **Responses:**
+    - `200 OK`: Returns the file with the tasks.
+    """
+    return StreamingResponse(
+        export_service.export(user_id=user_id, export_format=export_format),
+        media_type="application/x-ndjson" if export_format == TasksFileFormat.ndjson else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'},
+    )
 
 
 @router.get(
@@ -92,7 +339,7 @@ async def get_tasks(
 )
 async def get_task(
     task_id: uuid.UUID,
-    task_service: Annotated[TasksService, Depends(get_tasks_service)],
+    task_service: Annotated[TasksService, Depends(get_tasks_read_service)],
     user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
 ) -> TaskOut:
     """
@@ -1,9 +1,9 @@
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
-from src.apps.tasks.enums import Priority, Status
+from src.apps.tasks.enums import Priority, Status, TaskSort
 from src.core import schemas
 
 
@@ -24,6 +24,13 @@ class TaskIn(schemas.InputApiSchema):
         examples=["pending", "progress", "completed"],
     )
 
+    @field_validator("name")
+    def validate_name(cls, value: str) -> str:
+        # PostgreSQL text can not contain NUL.
+        if "\x00" in value:
+            raise ValueError("Name must not contain NUL characters.")
+        return value
+
     @field_validator("status", mode="before")
     def validate_status(cls, value) -> str:
         if value == Status.expired:
@@ -39,3 +46,125 @@ class TaskOut(schemas.OutputApiSchema):
     status: Status | None = Status.pending
     created_at: datetime
     updated_at: datetime
+
+
+class TasksFilterIn(schemas.InputApiSchema):
+    status: list[Status] | None = None
+    priority: list[Priority] | None = None
+    project_id: uuid.UUID | None = None
+    deadline_from: datetime | None = None
+    deadline_to: datetime | None = None
+    overdue: bool | None = None
+    sort: TaskSort = TaskSort.created_at
+
+    @field_validator("deadline_from", "deadline_to")
+    def validate_deadline(cls, value: datetime | None) -> datetime | None:
+        # Deadlines are stored in UTC without the time zone.
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        return value
+
+    @model_validator(mode="after")
+    def validate_deadline_range(self) -> "TasksFilterIn":
+        # The range is half-open, so equal bounds would match nothing.
+        if self.deadline_from and self.deadline_to and self.deadline_from >= self.deadline_to:
+            raise ValueError("deadlineFrom must be before deadlineTo.")
+        return self
+
+
+class TasksBulkIn(schemas.InputApiSchema):
+    tasks: list[TaskIn] = Field(min_length=1, max_length=5000)
+
+
+class TaskBulkErrorOut(schemas.OutputApiSchema):
+    index: int
+    detail: str
+
+
+class TasksBulkOut(schemas.OutputApiSchema):
+    created: list[TaskOut]
+    errors: list[TaskBulkErrorOut]
+
+
+class TasksBulkFilterIn(schemas.InputApiSchema):
+    ids: list[uuid.UUID] | None = Field(default=None, min_length=1, max_length=5000)
+    project_id: uuid.UUID | None = Field(default=None, examples=[None])
+    priority: Priority | None = Field(default=None, examples=[None])
+    status: Status | None = Field(default=None, examples=["progress"])
+
+    @model_validator(mode="after")
+    def validate_not_empty(self) -> "TasksBulkFilterIn":
+        if self.ids is None and self.project_id is None and self.priority is None and self.status is None:
+            raise ValueError("Provide ids or at least one filter.")
+        return self
+
+
+class TasksBulkUpdateIn(schemas.InputApiSchema):
+    filter: TasksBulkFilterIn
+    priority: Priority | None = Field(default=None, examples=[None])
+    status: Status | None = Field(default=None, examples=["completed"])
+
+    @field_validator("status", mode="before")
+    def validate_status(cls, value) -> str:
+        if value == Status.expired:
+            raise ValueError("Status 'expired' is not allowed.")
+        return value
+
+    @model_validator(mode="after")
+    def validate_not_empty(self) -> "TasksBulkUpdateIn":
+        if self.priority is None and self.status is None:
+            raise ValueError("Provide priority or status to update.")
+        return self
+
+
+class TasksBulkUpdateOut(schemas.OutputApiSchema):
+    ids: list[uuid.UUID]
+
+
+class TasksBulkDeleteIn(schemas.InputApiSchema):
+    filter: TasksBulkFilterIn
+
+
+class TasksBulkDeleteOut(schemas.OutputApiSchema):
+    ids: list[uuid.UUID]
+
+
+class TaskImportErrorOut(schemas.OutputApiSchema):
+    line: int
+    detail: str
+
+
+class TasksImportOut(schemas.OutputApiSchema):
+    total: int
+    created: int
+    rejected_count: int
+    rejected: list[TaskImportErrorOut]
+
+
+class TaskStatusCountsOut(schemas.OutputApiSchema):
+    pending: int = 0
+    progress: int = 0
+    completed: int = 0
+    expired: int = 0
+
+
+class TaskPriorityCountsOut(schemas.OutputApiSchema):
+    low: int = 0
+    medium: int = 0
+    high: int = 0
+
+
+class TaskStatsOut(schemas.OutputApiSchema):
+    total: int = 0
+    status: TaskStatusCountsOut = TaskStatusCountsOut()
+    priority: TaskPriorityCountsOut = TaskPriorityCountsOut()
+    overdue: int = 0
+    completion_rate: float = 0.0
+
+
+class ProjectTaskStatsOut(TaskStatsOut):
+    project_id: uuid.UUID | None
+
+
+class TasksStatsOut(TaskStatsOut):
+    projects: list[ProjectTaskStatsOut] = []
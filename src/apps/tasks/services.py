@@ -1,96 +1,462 @@
+import asyncio
+import csv
+import io
+import itertools
 import logging
 import uuid
+from collections.abc import AsyncIterator, Iterator, Sequence
 from dataclasses import dataclass
+from typing import BinaryIO
 
-from sqlalchemy import asc, desc
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import Row, asc, desc
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.apps.projects.models import Project
 from src.apps.projects.repository import ProjectRepository
 from src.apps.tasks.cache_repositories import CacheTasks
+from src.apps.tasks.enums import Priority, Status, TasksFileFormat, TaskSort
 from src.apps.tasks.models import Task
-from src.apps.tasks.repository import TaskRepository
-from src.apps.tasks.schemas import TaskIn, TaskOut
-from src.core.pagination import Pagination, SortEnum
-from src.exceptions import ProjectNotFoundException, TaskAlreadyExistsException, TaskNotFoundException
+from src.apps.tasks.repository import TASK_ROW_FIELDS, TaskRepository
+from src.apps.tasks.schemas import (
+    ProjectTaskStatsOut,
+    TaskBulkErrorOut,
+    TaskImportErrorOut,
+    TaskIn,
+    TaskOut,
+    TaskPriorityCountsOut,
+    TasksBulkDeleteIn,
+    TasksBulkDeleteOut,
+    TasksBulkOut,
+    TasksBulkUpdateIn,
+    TasksBulkUpdateOut,
+    TasksFilterIn,
+    TasksImportOut,
+    TasksStatsOut,
+    TaskStatusCountsOut,
+)
+from src.core.pagination import JsonPage, Pagination, SortEnum, get_next_row_cursor
+from src.core.search import Search
+from src.core.utils.db import FOREIGN_KEY_VIOLATION, UNIQUE_VIOLATION, get_sqlstate
+from src.core.utils.serialization import dumps_rows
+from src.exceptions import (
+    ProjectNotFoundException,
+    TaskAlreadyExistsException,
+    TaskNotFoundException,
+    TasksImportFileNotValidException,
+)
 
 logger = logging.getLogger(__name__)
 
+EXPORT_FIELDS: tuple[str, ...] = ("id", "name", "projectId", "priority", "status", "createdAt", "updatedAt")
+# Rows validated and copied into the staging table at once.
+IMPORT_CHUNK_SIZE = 5000
+# Rejected rows reported by the import, the rest are only counted.
+IMPORT_REJECTED_LIMIT = 1000
+
+
+def _make_stats(row: Row) -> dict:
+    """
+    Returns the fields of ``TaskStatsOut`` from the row of ``TaskRepository.get_stats``.
+    """
+    counts: dict = row._asdict()
+    return {
+        "total": counts["total"],
+        "status": TaskStatusCountsOut(**{status.value: counts[f"status_{status.value}"] for status in Status}),
+        "priority": TaskPriorityCountsOut(
+            **{priority.value: counts[f"priority_{priority.value}"] for priority in Priority}
+        ),
+        "overdue": counts["overdue"],
+        "completion_rate": round(counts[f"status_{Status.completed.value}"] / counts["total"], 4)
+        if counts["total"]
+        else 0.0,
+    }
+
 
 @dataclass
 class TasksService:
     task_repository: TaskRepository
     cache_task_repository: CacheTasks
     project_repository: ProjectRepository
+    use_cache: bool = True
 
-    async def get_all(self, *, user_id: uuid.UUID, pagination: Pagination) -> list[TaskOut]:
+    async def get_all(self, *, user_id: uuid.UUID, pagination: Pagination, filters: TasksFilterIn) -> JsonPage:
+        """
+        Returns the page of the filtered tasks encoded to the JSON of ``list[TaskOut]`` straight from the rows.
+        """
+        version: int | None = await self._get_cache_version(user_id=user_id)
+        if version is not None:
+            cached_page: JsonPage | None = await self.cache_task_repository.get_page(
+                user_id=user_id,
+                version=version,
+                pagination=pagination,
+                filters=filters,
+            )
+            if cached_page is not None:
+                return cached_page
         order = desc if pagination.order == SortEnum.DESC else asc
-        tasks: list[Task] = await self.task_repository.get_all(
+        rows: Sequence[Row] = await self.task_repository.get_all_rows(
             user_id=user_id,
             order=order,
             page=pagination.page,
             per_page=pagination.perPage,
+            cursor=pagination.cursor,
+            **filters.model_dump(),
+        )
+        page = JsonPage(
+            content=dumps_rows(rows, TASK_ROW_FIELDS),
+            next_cursor=(
+                get_next_row_cursor(rows=rows, pagination=pagination) if filters.sort == TaskSort.created_at else None
+            ),
+        )
+        if version is not None:
+            await self.cache_task_repository.set_page(
+                user_id=user_id,
+                version=version,
+                pagination=pagination,
+                filters=filters,
+                page=page,
+            )
+        return page
+
+    async def search(self, *, user_id: uuid.UUID, search: Search) -> JsonPage:
+        """
+        Returns the page of the tasks matching the text encoded to the JSON of ``list[TaskOut]``.
+        """
+        rows: Sequence[Row] = await self.task_repository.search_rows(
+            user_id=user_id,
+            text=search.text,
+            page=search.page,
+            per_page=search.perPage,
         )
-        return [TaskOut.model_validate(task) for task in tasks]
+        return JsonPage(content=dumps_rows(rows, TASK_ROW_FIELDS), next_cursor=None)
+
+    async def get_stats(self, *, user_id: uuid.UUID) -> TasksStatsOut:
+        version: int | None = await self._get_cache_version(user_id=user_id)
+        if version is not None:
+            cached_stats: TasksStatsOut | None = await self.cache_task_repository.get_stats(
+                user_id=user_id,
+                version=version,
+            )
+            if cached_stats is not None:
+                return cached_stats
+        rows: Sequence[Row] = await self.task_repository.get_stats(user_id=user_id)
+        stats = TasksStatsOut(
+            **next((_make_stats(row) for row in rows if row.is_total), {}),
+            projects=[
+                ProjectTaskStatsOut(project_id=row.project_id, **_make_stats(row)) for row in rows if not row.is_total
+            ],
+        )
+        if version is not None:
+            await self.cache_task_repository.set_stats(user_id=user_id, version=version, stats=stats)
+        return stats
 
     async def get(self, user_id: uuid.UUID, task_id: uuid.UUID) -> TaskOut:
+        version: int | None = await self._get_cache_version(user_id=user_id)
+        if version is not None:
+            cached_task: TaskOut | None = await self.cache_task_repository.get(
+                user_id=user_id,
+                version=version,
+                task_id=task_id,
+            )
+            if cached_task is not None:
+                return cached_task
         task: Task | None = await self.task_repository.get(
             task_id=task_id,
             user_id=user_id,
         )
         if task:
-            return TaskOut.model_validate(task)
+            task_out: TaskOut = TaskOut.model_validate(task)
+            if version is not None:
+                await self.cache_task_repository.set(user_id=user_id, version=version, task=task_out)
+            return task_out
         raise TaskNotFoundException
 
     async def create(self, *, user_id: uuid.UUID, payload: TaskIn) -> TaskOut:
-        if payload.project_id:
-            exists_project: Project | None = await self.project_repository.get(
-                user_id=user_id,
-                project_id=payload.project_id,
-            )
-            if not exists_project:
-                raise ProjectNotFoundException
-        exists_task_name: Task | None = await self.task_repository.get_by_name(
-            user_id=user_id,
-            name=payload.name,
-        )
-        if not exists_task_name:
+        """
+        Creates the task with one statement, the conflicts are reported by the constraints.
+        """
+        try:
             task: Task | None = await self.task_repository.create(
                 user_id=user_id,
                 payload=payload.model_dump(),
             )
-            return TaskOut.model_validate(task)
-        raise TaskAlreadyExistsException
+        except IntegrityError as e:
+            self._raise_conflict(e)
+            raise
+        if task is None:
+            raise ProjectNotFoundException
+        await self.cache_task_repository.invalidate(user_id=user_id)
+        return TaskOut.model_validate(task)
+
+    async def create_bulk(self, *, user_id: uuid.UUID, payloads: list[TaskIn]) -> TasksBulkOut:
+        """
+        Creates the valid tasks and reports the rest by their index in the payload.
+
+        Ownership of the projects and conflicts of the names are checked with one query each.
+        """
+        project_ids: set[uuid.UUID] = await self.project_repository.get_ids(
+            user_id=user_id,
+            project_ids={payload.project_id for payload in payloads if payload.project_id},
+        )
+        taken_names: set[str] = await self.task_repository.get_names(
+            user_id=user_id,
+            names=[payload.name for payload in payloads],
+        )
+        errors: list[TaskBulkErrorOut] = []
+        indexes: dict[str, int] = {}
+        for index, payload in enumerate(payloads):
+            if payload.project_id and payload.project_id not in project_ids:
+                errors.append(TaskBulkErrorOut(index=index, detail=ProjectNotFoundException.detail))
+            elif payload.name in taken_names:
+                errors.append(TaskBulkErrorOut(index=index, detail=TaskAlreadyExistsException.detail))
+            else:
+                taken_names.add(payload.name)
+                indexes[payload.name] = index
+        tasks: list[Task] = []
+        while indexes:
+            try:
+                tasks = await self.task_repository.create_many(
+                    user_id=user_id,
+                    payloads=[payloads[index].model_dump() for index in indexes.values()],
+                )
+            except IntegrityError as e:
+                if get_sqlstate(e) != FOREIGN_KEY_VIOLATION:
+                    raise
+                # A project was deleted after the ownership check, its tasks are reported and the rest are retried.
+                project_ids = await self.project_repository.get_ids(user_id=user_id, project_ids=project_ids)
+                deleted: dict[str, int] = {
+                    name: index
+                    for name, index in indexes.items()
+                    if payloads[index].project_id and payloads[index].project_id not in project_ids
+                }
+                if not deleted:
+                    raise
+                errors.extend(
+                    TaskBulkErrorOut(index=index, detail=ProjectNotFoundException.detail) for index in deleted.values()
+                )
+                indexes = {name: index for name, index in indexes.items() if name not in deleted}
+                continue
+            await self.cache_task_repository.invalidate(user_id=user_id)
+            break
+        created: dict[str, TaskOut] = {task.name: TaskOut.model_validate(task) for task in tasks}
+        # Names taken by concurrent requests after the check are skipped by the insert.
+        errors.extend(
+            TaskBulkErrorOut(index=index, detail=TaskAlreadyExistsException.detail)
+            for name, index in indexes.items()
+            if name not in created
+        )
+        return TasksBulkOut(
+            created=[created[name] for name in indexes if name in created],
+            errors=sorted(errors, key=lambda error: error.index),
+        )
 
     async def update(self, *, user_id: uuid.UUID, task_id: uuid.UUID, payload: TaskIn) -> TaskOut:
-        if payload.project_id:
-            exists_project: Project | None = await self.project_repository.get(
+        """
+        Updates the task with one statement, the project is looked up only if nothing was updated
+        to tell a missing project from a missing task.
+        """
+        try:
+            task: Task | None = await self.task_repository.update(
                 user_id=user_id,
-                project_id=payload.project_id,
+                task_id=task_id,
+                payload=payload.model_dump(exclude_unset=True),
             )
-            if not exists_project:
+        except IntegrityError as e:
+            self._raise_conflict(e)
+            raise
+        if task is None:
+            if payload.project_id and not await self.project_repository.get_ids(
+                user_id=user_id,
+                project_ids={payload.project_id},
+            ):
                 raise ProjectNotFoundException
-        task: Task | None = await self.task_repository.get(
-            task_id=task_id,
+            raise TaskNotFoundException
+        await self.cache_task_repository.invalidate(user_id=user_id)
+        return TaskOut.model_validate(task)
+
+    async def delete(self, *, user_id: uuid.UUID, task_id: uuid.UUID) -> None:
+        if not await self.task_repository.delete(user_id=user_id, task_id=task_id):
+            raise TaskNotFoundException
+        await self.cache_task_repository.invalidate(user_id=user_id)
+
+    async def update_bulk(self, *, user_id: uuid.UUID, payload: TasksBulkUpdateIn) -> TasksBulkUpdateOut:
+        task_ids: list[uuid.UUID] = await self.task_repository.update_many(
             user_id=user_id,
+            payload=payload.model_dump(exclude={"filter"}, exclude_none=True),
+            **payload.filter.model_dump(),
         )
-        if task:
-            if (
-                payload.name == task.name
-                and payload.priority == task.priority
-                and payload.status == task.status
-                and (payload.project_id == task.project_id or (payload.project_id is None and task.project_id is None))
-            ):
-                return TaskOut.model_validate(task)
-            updated_task = await self.task_repository.update(
-                task_id=task_id,
-                payload=payload.model_dump(exclude_unset=True),
+        if task_ids:
+            await self.cache_task_repository.invalidate(user_id=user_id)
+        return TasksBulkUpdateOut(ids=task_ids)
+
+    async def delete_bulk(self, *, user_id: uuid.UUID, payload: TasksBulkDeleteIn) -> TasksBulkDeleteOut:
+        task_ids: list[uuid.UUID] = await self.task_repository.delete_many(
+            user_id=user_id,
+            **payload.filter.model_dump(),
+        )
+        if task_ids:
+            await self.cache_task_repository.invalidate(user_id=user_id)
+        return TasksBulkDeleteOut(ids=task_ids)
+
+    async def import_tasks(self, *, user_id: uuid.UUID, file: BinaryIO, file_format: TasksFileFormat) -> TasksImportOut:
+        """
+        Imports the tasks from the file in one transaction.
+
+        The file is read and validated in chunks, which are copied into a staging table
+        and merged into the tasks of the user at the end. Rows which are not valid,
+        repeat a name or refer to an unknown project are rejected by their line in the file,
+        the first ``IMPORT_REJECTED_LIMIT`` of them are reported and all are counted.
+
+        Raises:
+            TasksImportFileNotValidException: If the file is not UTF-8 or not valid CSV.
+        """
+        total: int = 0
+        rejected_count: int = 0
+        rejected: list[TaskImportErrorOut] = []
+        await self.task_repository.start_import()
+        rows: Iterator[tuple[int, dict | str]] = self._read_import_rows(file=file, file_format=file_format)
+        try:
+            # Reading, parsing and validation of the file block, so every chunk is made in a thread.
+            while chunk := await asyncio.to_thread(self._read_import_chunk, rows):
+                records, errors = chunk
+                rejected_count += len(errors)
+                rejected.extend(errors[: IMPORT_REJECTED_LIMIT - len(rejected)])
+                await self.task_repository.copy_import_rows(records)
+                total += len(records) + len(errors)
+                logger.info("Import of the tasks of the user %s: %s rows are read", user_id, total)
+        except (UnicodeDecodeError, csv.Error) as e:
+            raise TasksImportFileNotValidException from e
+        created, errors_count, errors = await self.task_repository.finish_import(
+            user_id=user_id,
+            errors_limit=IMPORT_REJECTED_LIMIT,
+        )
+        if created:
+            await self.cache_task_repository.invalidate(user_id=user_id)
+        rejected.extend(TaskImportErrorOut(line=line, detail=detail) for line, detail in errors)
+        return TasksImportOut(
+            total=total,
+            created=created,
+            rejected_count=rejected_count + errors_count,
+            rejected=sorted(rejected, key=lambda error: error.line)[:IMPORT_REJECTED_LIMIT],
+        )
+
+    async def _get_cache_version(self, *, user_id: uuid.UUID) -> int | None:
+        """
+        Returns the version of the cached tasks of the user or None if the cache is not used.
+        """
+        if not self.use_cache:
+            return None
+        return await self.cache_task_repository.get_version(user_id=user_id)
+
+    @staticmethod
+    def _raise_conflict(error: IntegrityError) -> None:
+        if get_sqlstate(error) == UNIQUE_VIOLATION:
+            raise TaskAlreadyExistsException from error
+        if get_sqlstate(error) == FOREIGN_KEY_VIOLATION:
+            # The project was deleted after the ownership check of the statement.
+            raise ProjectNotFoundException from error
+
+    @classmethod
+    def _read_import_chunk(
+        cls,
+        rows: Iterator[tuple[int, dict | str]],
+    ) -> tuple[list[tuple], list[TaskImportErrorOut]] | None:
+        """
+        Reads and validates the next ``IMPORT_CHUNK_SIZE`` rows, returns the records for the staging table
+        and the rejected rows or None at the end of the file.
+        """
+        chunk: list[tuple[int, dict | str]] = list(itertools.islice(rows, IMPORT_CHUNK_SIZE))
+        if not chunk:
+            return None
+        records: list[tuple] = []
+        errors: list[TaskImportErrorOut] = []
+        for line, row in chunk:
+            try:
+                if isinstance(row, str):
+                    raise ValueError(row)
+                task = TaskIn.model_validate(row)
+            except (ValidationError, ValueError) as e:
+                errors.append(TaskImportErrorOut(line=line, detail=cls._make_import_error(e)))
+                continue
+            records.append(
+                (line, task.name, task.project_id, task.priority or Priority.low, task.status or Status.pending)
             )
-            return TaskOut.model_validate(updated_task)
-        raise TaskNotFoundException
+        return records, errors
 
-    async def delete(self, *, user_id: uuid.UUID, task_id: uuid.UUID) -> None:
-        task: Task | None = await self.task_repository.get(task_id=task_id, user_id=user_id)
-        if task:
-            await self.task_repository.delete(user_id=user_id, task_id=task_id)
-            return
-        raise TaskNotFoundException
+    @staticmethod
+    def _read_import_rows(*, file: BinaryIO, file_format: TasksFileFormat) -> Iterator[tuple[int, dict | str]]:
+        """
+        Yields the line and the parsed row or the parsing error for every row of the file.
+        """
+        lines = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        try:
+            if file_format == TasksFileFormat.csv:
+                reader = csv.DictReader(lines)
+                for row in reader:
+                    # Empty cells are missing values, e.g. a task without a project.
+                    yield reader.line_num, {key: value for key, value in row.items() if key and value}
+                return
+            for line, value in enumerate(lines, start=1):
+                if not value.strip():
+                    continue
+                try:
+                    yield line, orjson.loads(value)
+                except orjson.JSONDecodeError:
+                    yield line, "Not valid JSON"
+        finally:
+            lines.detach()
+
+    @staticmethod
+    def _make_import_error(error: ValidationError | ValueError) -> str:
+        if isinstance(error, ValidationError):
+            return "; ".join(
+                f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}" if detail["loc"] else detail["msg"]
+                for detail in error.errors()
+            )
+        return str(error)
+
+
+@dataclass
+class TasksExportService:
+    """
+    Exports all tasks of the user without loading them into memory.
+
+    The export outlives the request dependencies, so it reads the tasks in its own session.
+    """
+
+    session_factory: async_sessionmaker[AsyncSession]
+
+    async def export(self, *, user_id: uuid.UUID, export_format: TasksFileFormat) -> AsyncIterator[bytes]:
+        serialize = self._serialize_ndjson if export_format == TasksFileFormat.ndjson else self._serialize_csv
+        if export_format == TasksFileFormat.csv:
+            yield ",".join(EXPORT_FIELDS).encode() + b"\r\n"
+        async with self.session_factory() as session:
+            async for rows in TaskRepository(session=session).stream_all(user_id=user_id):
+                yield serialize(rows)
+
+    @staticmethod
+    def _serialize_ndjson(rows: Sequence[Row]) -> bytes:
+        return b"".join(
+            orjson.dumps(dict(zip(EXPORT_FIELDS, row, strict=True)), default=str, option=orjson.OPT_APPEND_NEWLINE)
+            for row in rows
+        )
+
+    @staticmethod
+    def _serialize_csv(rows: Sequence[Row]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for task_id, name, project_id, priority, status, created_at, updated_at in rows:
+            writer.writerow(
+                (
+                    task_id,
+                    name,
+                    project_id or "",
+                    priority.value,
+                    status.value,
+                    created_at.isoformat(),
+                    updated_at.isoformat(),
+                )
+            )
+        return buffer.getvalue().encode()
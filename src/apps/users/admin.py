@@ -1,7 +1,8 @@
 from sqladmin import ModelView
 
-from src.apps.auth.security import bcrypt_context
+from src.apps.auth.security import password_hasher
 from src.apps.users.models import User
+from src.dependencies import get_cache_user_roles_repository
 
 
 class UserAdmin(ModelView, model=User):
@@ -41,5 +42,12 @@ class UserAdmin(ModelView, model=User):
 
     async def on_model_change(self, data, model, is_created, request):
         if is_created:
-            hashed_password: str = bcrypt_context.hash(data["password"])
+            hashed_password: str = await password_hasher.hash(data["password"])
             data["password"] = hashed_password
+
+    async def after_model_change(self, data, model, is_created, request) -> None:
+        if not is_created:
+            await get_cache_user_roles_repository().delete(user_id=model.id)
+
+    async def after_model_delete(self, model, request) -> None:
+        await get_cache_user_roles_repository().delete(user_id=model.id)
@@ -0,0 +1,74 @@
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass
+
+import orjson
+from redis import Redis
+from redis.exceptions import RedisError
+
+from src.core.settings import cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class UserRoles:
+    is_staff: bool
+    is_super_user: bool
+
+
+# Local cache of the worker in front of Redis: user_id -> (expires at, roles).
+_local_user_roles: dict[str, tuple[float, UserRoles]] = {}
+
+
+class CacheUserRoles:
+    """
+    Two-level cache of the user roles: a short-lived local cache of the worker and Redis.
+
+    Redis keeps the roles for ``ROLES_CACHE_TTL`` seconds and is invalidated on change,
+    local caches of other workers may serve old roles for up to ``ROLES_CACHE_LOCAL_TTL`` seconds.
+    Redis errors are logged and treated as a miss.
+    """
+
+    def __init__(self, *, redis: Redis) -> None:
+        self.redis: Redis = redis
+
+    async def get(self, *, user_id: uuid.UUID) -> UserRoles | None:
+        local: tuple[float, UserRoles] | None = _local_user_roles.get(str(user_id))
+        if local is not None and local[0] > time.monotonic():
+            return local[1]
+        try:
+            roles_json = await self.redis.get(self._make_key(user_id))
+        except RedisError:
+            logger.warning("Failed to get roles of the user %s from the cache", user_id, exc_info=True)
+            return None
+        if roles_json is None:
+            return None
+        roles = UserRoles(**orjson.loads(roles_json))
+        self._set_local(user_id=user_id, roles=roles)
+        return roles
+
+    async def set(self, *, user_id: uuid.UUID, roles: UserRoles) -> None:
+        self._set_local(user_id=user_id, roles=roles)
+        try:
+            await self.redis.set(self._make_key(user_id), orjson.dumps(asdict(roles)), ex=cache.ROLES_CACHE_TTL)
+        except RedisError:
+            logger.warning("Failed to set roles of the user %s to the cache", user_id, exc_info=True)
+
+    async def delete(self, *, user_id: uuid.UUID) -> None:
+        _local_user_roles.pop(str(user_id), None)
+        try:
+            await self.redis.delete(self._make_key(user_id))
+        except RedisError:
+            logger.warning("Failed to delete roles of the user %s from the cache", user_id, exc_info=True)
+
+    @staticmethod
+    def _set_local(*, user_id: uuid.UUID, roles: UserRoles) -> None:
+        if len(_local_user_roles) >= cache.ROLES_CACHE_LOCAL_SIZE:
+            _local_user_roles.clear()
+        _local_user_roles[str(user_id)] = (time.monotonic() + cache.ROLES_CACHE_LOCAL_TTL, roles)
+
+    @staticmethod
+    def _make_key(user_id: uuid.UUID) -> str:
+        return f"users:{user_id}:roles"
@@ -3,6 +3,7 @@ import uuid
 from dataclasses import dataclass
 
 from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.users.models import User
@@ -15,7 +16,13 @@ logger = logging.getLogger(__name__)
 class UsersRepository:
     session: AsyncSession
 
-    async def create(self, **payload) -> User | None:
+    async def create(self, **payload) -> User:
+        """
+        Creates the user with one INSERT.
+
+        Raises:
+            IntegrityError: If the email is taken.
+        """
         query = (
             insert(User)
             .values(
@@ -24,7 +31,11 @@ class UsersRepository:
             .returning(User)
         )
         # logger.debug("Query:\n%s" % (query.compile(engine, compile_kwargs={"literal_binds": True})))
-        user: User | None = (await self.session.execute(query)).scalar()
+        try:
+            user: User = (await self.session.execute(query)).scalar_one()
+        except IntegrityError:
+            await self.session.rollback()
+            raise
         await self.session.commit()
         return user
 
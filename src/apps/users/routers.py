@@ -4,8 +4,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.apps.users.schemas import ChangeUserPasswordIn, UserLoginOut, UserMeOut, UserSignUpIn
 from src.apps.users.services import UsersService
-from src.dependencies import get_request_user_id, get_users_service
-from src.exceptions import UserAlreadyExistsException, UserNotCorrectPasswordException, UserNotFoundException
+from src.core.services.cache import PrimaryPins
+from src.dependencies import get_primary_pins, get_request_user_id, get_users_read_service, get_users_service
+from src.exceptions import (
+    PasswordHasherOverloadedException,
+    UserAlreadyExistsException,
+    UserNotCorrectPasswordException,
+    UserNotFoundException,
+)
 
 __all__ = ("router",)
 
@@ -22,6 +28,7 @@ router = APIRouter()
 async def create_user(
     payload: UserSignUpIn,
     users_service: Annotated[UsersService, Depends(get_users_service)],
+    primary_pins: Annotated[PrimaryPins, Depends(get_primary_pins)],
 ) -> UserLoginOut:
     """
     Register a new user with the provided information.
@@ -36,14 +43,23 @@ async def create_user(
 
     **Errors**:
     - `409 Conflict`: If the user with the provided email already exists.
+    - `503 Service Unavailable`: If the server is overloaded with password hashing.
     """
     try:
-        return await users_service.create(payload=payload)
+        user: UserLoginOut = await users_service.create(payload=payload)
     except UserAlreadyExistsException as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e.detail),
         )
+    except PasswordHasherOverloadedException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e.detail),
+        )
+    # The new user is not authenticated by the request, so ReadYourWritesMiddleware does not pin it.
+    await primary_pins.pin(user_id=user.id)
+    return user
 
 
 @router.put(
@@ -67,6 +83,7 @@ async def user_change_password(
 
     **Errors**:
     - `400 Bad Request`: If the user is not found or the old password provided is incorrect.
+    - `503 Service Unavailable`: If the server is overloaded with password hashing.
     """
     try:
         await users_service.change_password(payload=payload)
@@ -76,6 +93,11 @@ async def user_change_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e.detail),
         )
+    except PasswordHasherOverloadedException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e.detail),
+        )
 
 
 @router.get(
@@ -85,7 +107,7 @@ async def user_change_password(
     status_code=status.HTTP_200_OK,
 )
 async def me(
-    users_service: Annotated[UsersService, Depends(get_users_service)],
+    users_service: Annotated[UsersService, Depends(get_users_read_service)],
     user_id: int = Depends(get_request_user_id),
 ) -> UserMeOut:
     """
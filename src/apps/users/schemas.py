@@ -11,6 +11,8 @@ from src.core.utils.auth.password_validation import (
     UserAttributeSimilarityValidator,
 )
 
+common_password_validator = CommonPasswordValidator()
+
 
 class UserLoginIn(InputApiSchema):
     email: EmailStr = Field(min_length=6, max_length=250, examples=["beazley@example.com"])
@@ -30,8 +32,7 @@ class UserSignUpIn(InputApiSchema):
 
     @field_validator("password", mode="before")
     def validate_password_common(cls, value) -> str:
-        password_validator = CommonPasswordValidator()
-        password_validator.validate(password=value)
+        common_password_validator.validate(password=value)
         return value
 
     @field_validator("password", mode="before")
@@ -54,8 +55,7 @@ class ChangeUserPasswordIn(InputApiSchema):
 
     @field_validator("new_password", mode="before")
     def validate_password_common(cls, value) -> str:
-        password_validator = CommonPasswordValidator()
-        password_validator.validate(password=value)
+        common_password_validator.validate(password=value)
         return value
 
     @field_validator("new_password", mode="before")
@@ -1,11 +1,14 @@
 import logging
 from dataclasses import dataclass
 
-from src.apps.auth.security import bcrypt_context
+from sqlalchemy.exc import IntegrityError
+
+from src.apps.auth.security import password_hasher
 from src.apps.auth.services import AuthService
 from src.apps.users.models import User
 from src.apps.users.repositories import UsersRepository
 from src.apps.users.schemas import ChangeUserPasswordIn, UserLoginOut, UserMeOut, UserSignUpIn
+from src.core.utils.db import UNIQUE_VIOLATION, get_sqlstate
 from src.exceptions import UserAlreadyExistsException, UserNotFoundException
 
 logger = logging.getLogger(__name__)
@@ -17,12 +20,22 @@ class UsersService:
     auth_service: AuthService
 
     async def create(self, *, payload: UserSignUpIn) -> UserLoginOut:
-        exists_user: User | None = await self.users_repository.get_user_by_email(email=payload.email)
-        if exists_user:
+        """
+        Creates the user, a taken email is reported by the unique constraint.
+
+        The email is looked up before hashing the password, so signups with a taken email
+        do not take the bounded password hasher, the constraint still covers concurrent signups.
+        """
+        if await self.users_repository.get_user_by_email(email=payload.email):
             raise UserAlreadyExistsException
-        hashed_password: str = bcrypt_context.hash(payload.password)
+        hashed_password: str = await password_hasher.hash(payload.password)
         updated_payload: UserSignUpIn = payload.model_copy(update={"password": hashed_password})
-        user: User | None = await self.users_repository.create(**updated_payload.model_dump())
+        try:
+            user: User = await self.users_repository.create(**updated_payload.model_dump())
+        except IntegrityError as e:
+            if get_sqlstate(e) == UNIQUE_VIOLATION:
+                raise UserAlreadyExistsException from e
+            raise
         access_token: str = self.auth_service.generate_access_token(user_id=user.id)
         return UserLoginOut(id=user.id, access_token=access_token)
 
@@ -35,8 +48,8 @@ class UsersService:
     async def change_password(self, *, payload: ChangeUserPasswordIn) -> None:
         user: User | None = await self.users_repository.get_user_by_email(email=payload.email)
         if user:
-            self.auth_service._validate_auth_user(user, payload.old_password)
-            new_hashed_password: str = bcrypt_context.hash(payload.new_password)
+            await self.auth_service._validate_auth_user(user, payload.old_password)
+            new_hashed_password: str = await password_hasher.hash(payload.new_password)
             if user.password == new_hashed_password:
                 return
             await self.users_repository.change_password(
@@ -9,13 +9,20 @@ from fastapi.responses import ORJSONResponse
 
 from src.apps import api_router
 from src.apps.auth.admin import init_admin
+from src.apps.auth.security import password_hasher
+from src.core.db import engine, read_engine
 from src.core.description import DESCRIPTION, TITLE
 from src.core.loggers import set_logging
 
 # from src.core.services.sentry import sentry_init
 from src.core.services.broker.consumer import make_amqp_consumer
+from src.core.services.broker.publisher import amqp_publisher
+from src.core.services.cache import close_redis_pool, get_redis_pool
+from src.core.services.clients.http import close_http_client, get_http_client
 from src.core.settings import settings
+from src.core.utils.auth.password_validation import get_common_passwords
 from src.middlewares.corse_middleware import init_corse_middleware
+from src.middlewares.read_your_writes_middleware import init_read_your_writes_middleware
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +34,20 @@ def _init_loggers(app: FastAPI) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.PRELOAD_COMMON_PASSWORDS:
+        get_common_passwords()
+    get_redis_pool()
+    get_http_client()
     if settings.EMAIL_SERVICE:
         await make_amqp_consumer()
+        await amqp_publisher.start()
     yield
+    await amqp_publisher.close()
+    await close_redis_pool()
+    await close_http_client()
+    await engine.dispose()
+    await read_engine.dispose()
+    password_hasher.shutdown()
 
 
 def _init_routers(app: FastAPI) -> None:
@@ -38,6 +56,7 @@ def _init_routers(app: FastAPI) -> None:
 
 def _init_middlewares(app: FastAPI) -> None:
     init_corse_middleware(app)
+    init_read_your_writes_middleware(app)
     app.add_middleware(GZipMiddleware)
 
 
@@ -1,7 +1,9 @@
+import logging
 import uuid
 from typing import Annotated
 
-from sqlalchemy import UUID, Boolean, MetaData, String, func
+from sqlalchemy import DDL, UUID, Boolean, Computed, MetaData, NullPool, String, event, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
     AsyncEngine,
@@ -10,13 +12,66 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
 
-from src.core.settings import db
-from src.core.utils.db import camel_to_snake, singular_to_plural
+from src.core.settings import db, settings
+from src.core.utils.db import SEARCH_CONFIG, MeteredAsyncQueuePool, camel_to_snake, singular_to_plural
+
+logger = logging.getLogger(__name__)
+
+
+def get_engine_pool_options(*, workers: int) -> dict:
+    """
+    Returns the options of the connection pool of the engine of one worker.
+
+    The workers share ``DB_CONNECTIONS_BUDGET`` connections, so one worker keeps up to
+    ``DB_CONNECTIONS_BUDGET // workers`` of them: ``DB_POOL_SIZE`` persistent connections
+    (the whole share by default) and ``DB_MAX_OVERFLOW`` temporary ones. Larger values are cut to the share.
+    With ``DB_NULL_POOL`` the worker keeps no connections at all.
+    """
+    if db.DB_NULL_POOL:
+        return {"poolclass": NullPool}
+    budget: int = max(db.DB_CONNECTIONS_BUDGET // workers, 1)
+    pool_size: int = min(db.DB_POOL_SIZE or budget, budget)
+    max_overflow: int = min(db.DB_MAX_OVERFLOW, budget - pool_size)
+    if (db.DB_POOL_SIZE or budget) + db.DB_MAX_OVERFLOW > budget:
+        logger.warning(
+            "DB_POOL_SIZE + DB_MAX_OVERFLOW exceed the budget of %s connections per worker, "
+            "the pool is limited to %s + %s connections",
+            budget,
+            pool_size,
+            max_overflow,
+        )
+    return {
+        "poolclass": MeteredAsyncQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": db.DB_POOL_TIMEOUT,
+        "pool_recycle": db.DB_POOL_RECYCLE,
+        "pool_pre_ping": db.DB_POOL_PRE_PING,
+    }
+
+
+def get_engine_connect_args(*, pgbouncer: bool) -> dict:
+    """
+    Returns the arguments of the asyncpg connections.
+
+    PgBouncer in transaction mode runs the transactions of one client connection on any server connection,
+    so a statement prepared on one of them is missing on the others and a cached name may already
+    be taken by another client. Prepared statements are not cached then and get unique names.
+    """
+    if not pgbouncer:
+        return {}
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    }
+
 
 engine: AsyncEngine = create_async_engine(
     url=db.ASYNC_DNS_DB,
     echo=db.SQL_REQUESTS_SHOW_IN_CONSOLE,
-    pool_pre_ping=True,
+    connect_args=get_engine_connect_args(pgbouncer=db.DB_PGBOUNCER),
+    **get_engine_pool_options(workers=settings.APP_WORKERS),
 )
 
 AsyncSessionFactory = async_sessionmaker(
@@ -27,6 +82,26 @@ AsyncSessionFactory = async_sessionmaker(
     autoflush=False,
 )
 
+# Engine of the reads which may lag behind the writes, the primary if there is no replica.
+read_engine: AsyncEngine = (
+    create_async_engine(
+        url=db.ASYNC_DNS_REPLICA_DB,
+        echo=db.SQL_REQUESTS_SHOW_IN_CONSOLE,
+        connect_args=get_engine_connect_args(pgbouncer=db.DB_PGBOUNCER),
+        **get_engine_pool_options(workers=settings.APP_WORKERS),
+    )
+    if db.POSTGRES_REPLICA_HOST
+    else engine
+)
+
+ReadSessionFactory = async_sessionmaker(
+    bind=read_engine,
+    autocommit=False,
+    expire_on_commit=False,
+    future=True,
+    autoflush=False,
+)
+
 # Types for SQLALCHEMY
 uuid_id = Annotated[
     uuid.UUID,
@@ -65,6 +140,16 @@ uniq_str_500_or_none = Annotated[str | None, mapped_column(String(length=100), u
 boolean_true = Annotated[bool, mapped_column(Boolean, default=True)]
 boolean_false = Annotated[bool, mapped_column(Boolean, default=False)]
 
+# Full-text search document of the name, computed by the database and never loaded with the rows.
+name_search_vector = Annotated[
+    str,
+    mapped_column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', name)", persisted=True),
+        deferred=True,
+    ),
+]
+
 
 POSTGRES_INDEXES_NAMING_CONVENTION = {
     "ix": "%(column_0_label)s_idx",
@@ -89,6 +174,56 @@ class Base(AsyncAttrs, DeclarativeBase):
         )
 
 
+# Extensions of the search indexes, the migrations create them too.
+for extension in ("pg_trgm", "btree_gin"):
+    event.listen(metadata, "before_create", DDL(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+
+
+def get_db_pool_stats() -> dict[str, int | float]:
+    pool: MeteredAsyncQueuePool = engine.pool  # type: ignore
+    if not isinstance(pool, MeteredAsyncQueuePool):
+        # There is no pool with DB_NULL_POOL, every session opens a new connection.
+        return dict.fromkeys(
+            (
+                "pool_size",
+                "max_overflow",
+                "checked_out_connections",
+                "idle_connections",
+                "overflow_connections",
+                "checkouts",
+                "timeouts",
+                "wait_avg_ms",
+                "wait_max_ms",
+            ),
+            0,
+        )
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out_connections": pool.checkedout(),
+        "idle_connections": pool.checkedin(),
+        "overflow_connections": max(pool.overflow(), 0),
+        "checkouts": pool.metrics.checkouts,
+        "timeouts": pool.metrics.timeouts,
+        "wait_avg_ms": round(pool.metrics.wait_total / pool.metrics.checkouts * 1000, 3)
+        if pool.metrics.checkouts
+        else 0.0,
+        "wait_max_ms": round(pool.metrics.wait_max * 1000, 3),
+    }
+
+
 async def get_async_session():
     async with AsyncSessionFactory() as session:
         yield session
+
+
+async def get_async_read_session():
+    async with ReadSessionFactory() as session:
+        yield session
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Returns the session factory for the responses which outlive the request dependencies, e.g. streaming.
+    """
+    return AsyncSessionFactory
@@ -1,18 +1,109 @@
+import base64
+import binascii
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
 from enum import StrEnum
+from typing import Protocol
 
-from fastapi import Query
+from fastapi import HTTPException, Query, Response, status
 from pydantic import BaseModel
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class SortEnum(StrEnum):
     ASC = "asc"
     DESC = "desc"
 
 
+class Cursor(BaseModel):
+    """
+    Position of the last row of a page in keyset (cursor) pagination.
+
+    Rows are ordered by ``created_at`` with ``id`` as a tie-breaker,
+    so the next page starts right after ``(created_at, id)``.
+    """
+
+    created_at: datetime
+    id: uuid.UUID
+
+
+class CursorItem(Protocol):
+    id: uuid.UUID
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class JsonPage:
+    """
+    Page of a list response already encoded to JSON and the cursor of the next page.
+    """
+
+    content: bytes
+    next_cursor: str | None
+
+
 class Pagination(BaseModel):
     perPage: int
     page: int
     order: SortEnum
+    cursor: Cursor | None = None
+
+
+def encode_cursor(*, created_at: datetime, id: uuid.UUID | str) -> str:
+    """
+    Encode the position of a row into an opaque url-safe string.
+    """
+    raw: str = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    """
+    Decode an opaque cursor made by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw: str = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    created_at, _, id = raw.partition("|")
+    try:
+        return Cursor(created_at=datetime.fromisoformat(created_at), id=uuid.UUID(id))
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+def get_next_cursor(*, items: Sequence[CursorItem], pagination: Pagination) -> str | None:
+    """
+    Return the cursor of the page following ``items`` or None if it is the last page.
+    """
+    if len(items) < pagination.perPage:
+        return None
+    last: CursorItem = items[-1]
+    return encode_cursor(created_at=last.created_at, id=last.id)
+
+
+def get_next_row_cursor(*, rows: Sequence[Sequence], pagination: Pagination) -> str | None:
+    """
+    Return the cursor of the page following ``rows`` which start with the id and end with ``created_at``.
+    """
+    if len(rows) < pagination.perPage:
+        return None
+    last: Sequence = rows[-1]
+    return encode_cursor(created_at=last[-1], id=last[0])
+
+
+def make_page_response(page: JsonPage) -> Response:
+    """
+    Return the encoded page as is, with the cursor of the next page in the ``X-Next-Cursor`` header.
+    """
+    headers: dict[str, str] | None = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    return Response(content=page.content, media_type="application/json", headers=headers)
 
 
 def pagination_params(
@@ -21,7 +112,10 @@ def pagination_params(
         le=5000,
         required=False,
         default=1,
-        description="Number of page",
+        description=(
+            "Number of page, the OFFSET fallback for clients which can not follow the cursor, "
+            "deeper pages are slower (ignored when `cursor` is provided)"
+        ),
     ),
     perPage: int = Query(
         ge=1,
@@ -34,5 +128,20 @@ def pagination_params(
         default=SortEnum.DESC,
         description="Sorting by time",
     ),
+    cursor: str | None = Query(
+        default=None,
+        description=(
+            f"Opaque cursor from the `{NEXT_CURSOR_HEADER}` header of every full page, the first one included. "
+            "The default way to get the next pages, every page costs the same as the first one."
+        ),
+    ),
 ) -> Pagination:
-    return Pagination(perPage=perPage, page=page, order=order)
+    if cursor is None:
+        return Pagination(perPage=perPage, page=page, order=order)
+    try:
+        return Pagination(perPage=perPage, page=1, order=order, cursor=decode_cursor(cursor))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
@@ -0,0 +1,36 @@
+from fastapi import Query
+from pydantic import BaseModel
+
+
+class Search(BaseModel):
+    """
+    Text searched in the names and the page of the results ordered by relevance.
+    """
+
+    text: str
+    page: int
+    perPage: int
+
+
+def search_params(
+    q: str = Query(
+        min_length=1,
+        max_length=200,
+        description="Words of the name (prefixes are enough) or a part of it with typos",
+    ),
+    page: int = Query(
+        ge=1,
+        le=5000,
+        required=False,
+        default=1,
+        description="Number of page",
+    ),
+    perPage: int = Query(
+        ge=1,
+        le=100,
+        required=False,
+        default=10,
+        description="Count elements on page",
+    ),
+) -> Search:
+    return Search(text=q.strip(), page=page, perPage=perPage)
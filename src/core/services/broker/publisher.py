@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.pool import Pool
+
+from src.core.services.broker.consumer import get_broker_connection
+from src.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _PendingMessage:
+    message: aio_pika.Message
+    routing_key: str
+    confirmed: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class AmqpPublisher:
+    """
+    Long-lived publisher of the worker to the default exchange of the broker.
+
+    One robust connection and a pool of up to ``pool_size`` channels with publisher confirms
+    are opened by ``start`` and reused by all calls. Messages are collected in batches of up to
+    ``batch_size`` messages or ``batch_timeout`` seconds and published concurrently on one channel,
+    ``publish`` returns when the broker confirmed the message.
+    """
+
+    def __init__(self, *, pool_size: int, batch_size: int, batch_timeout: float) -> None:
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self._connection: AbstractRobustConnection | None = None
+        self._channels: Pool[AbstractChannel] | None = None
+        # None in the queue stops the flusher after it started the batch being collected.
+        self._queue: asyncio.Queue[_PendingMessage | None] | None = None
+        self._flusher: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+        # Set by ``close``, so no message is queued after the queue is drained.
+        self._closing: bool = False
+
+    @property
+    def started(self) -> bool:
+        return self._flusher is not None
+
+    async def start(self) -> None:
+        if self.started:
+            return
+        self._connection = await get_broker_connection()
+        self._channels = Pool(self._get_channel, max_size=self.pool_size)
+        self._queue = asyncio.Queue()
+        self._flusher = asyncio.create_task(self._flush())
+
+    async def close(self) -> None:
+        """
+        Publishes the queued messages and closes the channels and the connection.
+        """
+        if self._flusher is None or self._closing:
+            return
+        self._closing = True
+        self._queue.put_nowait(None)  # type: ignore
+        await asyncio.gather(self._flusher, return_exceptions=True)
+        await self._publish_queued()
+        await asyncio.gather(*self._batches, return_exceptions=True)
+        await self._channels.close()  # type: ignore
+        await self._connection.close()  # type: ignore
+        self._flusher = self._channels = self._connection = self._queue = None
+        self._closing = False
+
+    async def publish(self, *, message: aio_pika.Message, routing_key: str) -> None:
+        """
+        Publishes the message and waits for the confirmation of the broker.
+
+        Raises:
+            RuntimeError: If the publisher is not started or is closing.
+            aio_pika.exceptions.DeliveryError: If the broker did not accept the message.
+        """
+        if self._queue is None:
+            raise RuntimeError("AMQP publisher is not started")
+        if self._closing:
+            raise RuntimeError("AMQP publisher is closing")
+        pending = _PendingMessage(message=message, routing_key=routing_key)
+        self._queue.put_nowait(pending)
+        await pending.confirmed
+
+    async def _get_channel(self) -> AbstractChannel:
+        return await self._connection.channel(publisher_confirms=True)  # type: ignore
+
+    async def _flush(self) -> None:
+        while (pending := await self._queue.get()) is not None:  # type: ignore
+            batch: list[_PendingMessage] = [pending]
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            deadline: float = loop.time() + self.batch_timeout
+            while len(batch) < self.batch_size:
+                try:
+                    pending = await asyncio.wait_for(self._queue.get(), deadline - loop.time())  # type: ignore
+                except TimeoutError:
+                    break
+                if pending is None:
+                    self._start_batch(batch)
+                    return
+                batch.append(pending)
+            self._start_batch(batch)
+
+    async def _publish_queued(self) -> None:
+        batch: list[_PendingMessage] = []
+        # Messages are left in the queue if the flusher stopped with an error.
+        while not self._queue.empty():  # type: ignore
+            if pending := self._queue.get_nowait():  # type: ignore
+                batch.append(pending)
+        if batch:
+            await self._publish_batch(batch)
+
+    def _start_batch(self, batch: list[_PendingMessage]) -> None:
+        # Batches are published in the background, so the next batch is collected meanwhile.
+        task: asyncio.Task = asyncio.create_task(self._publish_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _publish_batch(self, batch: list[_PendingMessage]) -> None:
+        try:
+            async with self._channels.acquire() as channel:  # type: ignore
+                results = await asyncio.gather(
+                    *(
+                        channel.default_exchange.publish(message=pending.message, routing_key=pending.routing_key)
+                        for pending in batch
+                    ),
+                    return_exceptions=True,
+                )
+        except Exception as e:
+            logger.exception("Failed to publish a batch of %s messages", len(batch))
+            results = [e] * len(batch)
+        for pending, result in zip(batch, results, strict=True):
+            if pending.confirmed.done():
+                continue
+            if isinstance(result, BaseException):
+                pending.confirmed.set_exception(result)
+            else:
+                pending.confirmed.set_result(None)
+
+
+amqp_publisher = AmqpPublisher(
+    pool_size=settings.AMQP_PUBLISHER_CHANNELS,
+    batch_size=settings.AMQP_PUBLISHER_BATCH_SIZE,
+    batch_timeout=settings.AMQP_PUBLISHER_BATCH_TIMEOUT,
+)
@@ -1 +1,5 @@
+from src.core.services.cache.primary_pins import PrimaryPins as PrimaryPins
+from src.core.services.cache.redis_connection import close_redis_pool as close_redis_pool
 from src.core.services.cache.redis_connection import get_redis_connection as get_redis_connection
+from src.core.services.cache.redis_connection import get_redis_pool as get_redis_pool
+from src.core.services.cache.redis_connection import get_redis_pool_stats as get_redis_pool_stats
@@ -0,0 +1,41 @@
+import logging
+import uuid
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from src.core.settings import db
+
+logger = logging.getLogger(__name__)
+
+
+class PrimaryPins:
+    """
+    Users whose reads go to the primary database after a write, so they see their writes
+    while the replica catches up. A pin expires after ``DB_REPLICA_PIN_SECONDS`` seconds.
+
+    Pins are kept in Redis to be seen by all workers and only if a replica is configured.
+    Redis errors are logged and treated as pinned, the primary always has the latest data.
+    """
+
+    def __init__(self, *, redis: Redis) -> None:
+        self.redis: Redis = redis
+
+    async def pin(self, *, user_id: uuid.UUID) -> None:
+        if not db.POSTGRES_REPLICA_HOST:
+            return
+        try:
+            await self.redis.set(self._make_key(user_id), 1, px=int(db.DB_REPLICA_PIN_SECONDS * 1000))
+        except RedisError:
+            logger.warning("Failed to pin the user %s to the primary database", user_id, exc_info=True)
+
+    async def is_pinned(self, *, user_id: uuid.UUID) -> bool:
+        try:
+            return bool(await self.redis.exists(self._make_key(user_id)))
+        except RedisError:
+            logger.warning("Failed to get the pin of the user %s to the primary database", user_id, exc_info=True)
+            return True
+
+    @staticmethod
+    def _make_key(user_id: uuid.UUID) -> str:
+        return f"db:primary:{user_id}"
@@ -2,10 +2,49 @@ from redis import asyncio as redis
 
 from src.core.settings import cache
 
+_redis_pool: redis.BlockingConnectionPool | None = None
+
+
+def get_redis_pool() -> redis.BlockingConnectionPool:
+    """
+    Returns the connection pool shared by all Redis clients of the worker.
+
+    The pool is created on first use and keeps up to ``REDIS_MAX_CONNECTIONS`` connections,
+    a call waits up to ``REDIS_POOL_TIMEOUT`` seconds for a free connection.
+    """
+    global _redis_pool
+    if _redis_pool is None:
+        _redis_pool = redis.BlockingConnectionPool(
+            host=cache.REDIS_HOST,
+            port=cache.REDIS_PORT,
+            db=cache.REDIS_DB,
+            max_connections=cache.REDIS_MAX_CONNECTIONS,
+            timeout=cache.REDIS_POOL_TIMEOUT,
+            socket_timeout=cache.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=cache.REDIS_SOCKET_CONNECT_TIMEOUT,
+            health_check_interval=cache.REDIS_HEALTH_CHECK_INTERVAL,
+        )
+    return _redis_pool
+
+
+async def close_redis_pool() -> None:
+    global _redis_pool
+    if _redis_pool is not None:
+        await _redis_pool.aclose()
+        _redis_pool = None
+
+
+def get_redis_pool_stats() -> dict[str, int]:
+    pool: redis.BlockingConnectionPool = get_redis_pool()
+    in_use: int = len(pool._in_use_connections)
+    available: int = len(pool._available_connections)
+    return {
+        "max_connections": pool.max_connections,
+        "in_use_connections": in_use,
+        "available_connections": available,
+        "created_connections": in_use + available,
+    }
+
 
 def get_redis_connection() -> redis.Redis:
-    return redis.Redis(
-        host=cache.REDIS_HOST,
-        port=cache.REDIS_PORT,
-        db=cache.REDIS_DB,
-    )
+    return redis.Redis(connection_pool=get_redis_pool())
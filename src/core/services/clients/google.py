@@ -11,22 +11,23 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class GoogleClient:
+    http_client: httpx.AsyncClient
+
     async def get_user_info(self, code) -> GoogleUserDataOut:
         access_token: str = await self._get_user_access_token(
             code=code,
         )
-        async with httpx.AsyncClient() as client:
-            response: httpx.Response = await client.get(
-                "https://www.googleapis.com/oauth2/v3/userinfo",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                },
-            )
-            google_data = GoogleUserDataOut(
-                **response.json(),
-            )
-            logger.info(google_data)
-            return google_data
+        response: httpx.Response = await self.http_client.get(
+            settings.GOOGLE_USER_INFO_URL,
+            headers={
+                "Authorization": f"Bearer {access_token}",
+            },
+        )
+        google_data = GoogleUserDataOut(
+            **response.json(),
+        )
+        logger.info(google_data)
+        return google_data
 
     async def _get_user_access_token(self, code: str) -> str:
         payload: dict[str, str] = {
@@ -36,9 +37,8 @@ class GoogleClient:
             "redirect_uri": settings.GOOGLE_REDIRECT_URI,
             "grant_type": "authorization_code",
         }
-        async with httpx.AsyncClient() as client:
-            response: httpx.Response = await client.post(
-                settings.GOOGLE_TOKEN_URL,
-                data=payload,
-            )
-            return response.json()["access_token"]
+        response: httpx.Response = await self.http_client.post(
+            settings.GOOGLE_TOKEN_URL,
+            data=payload,
+        )
+        return response.json()["access_token"]
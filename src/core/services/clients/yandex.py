@@ -11,21 +11,22 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class YandexClient:
+    http_client: httpx.AsyncClient
+
     async def get_user_info(self, code) -> YandexUserDataOut:
         access_token: str = await self._get_user_access_token(
             code=code,
         )
-        async with httpx.AsyncClient() as client:
-            response: httpx.Response = await client.get(
-                "https://login.yandex.ru/info?format=json",
-                headers={
-                    "Authorization": f"OAuth {access_token}",
-                },
-            )
-            return YandexUserDataOut(
-                **response.json(),
-                access_token=access_token,
-            )
+        response: httpx.Response = await self.http_client.get(
+            settings.YANDEX_USER_INFO_URL,
+            headers={
+                "Authorization": f"OAuth {access_token}",
+            },
+        )
+        return YandexUserDataOut(
+            **response.json(),
+            access_token=access_token,
+        )
 
     async def _get_user_access_token(self, code: str) -> str:
         payload: dict[str, str] = {
@@ -34,12 +35,11 @@ class YandexClient:
             "client_secret": settings.YANDEX_CLIENT_SECRET,
             "grant_type": "authorization_code",
         }
-        async with httpx.AsyncClient() as client:
-            response: httpx.Response = await client.post(
-                settings.YANDEX_TOKEN_URL,
-                data=payload,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-            )
-            return response.json()["access_token"]
+        response: httpx.Response = await self.http_client.post(
+            settings.YANDEX_TOKEN_URL,
+            data=payload,
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+        )
+        return response.json()["access_token"]
@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     APP_PORT: int = 8000
     APP_HOST: str = "0.0.0.0"
+    # Processes of gunicorn, they share DB_CONNECTIONS_BUDGET.
+    APP_WORKERS: int = 4
     ENVIRONMENT: Literal["dev", "prod", "tests"] = "dev"
     ALLOW_ORIGINS_URLS: list["str"] = []
     API_VERSION: str = "0.0.1"
@@ -32,17 +34,33 @@ class Settings(BaseSettings):
     JWT_UPDATE_TIME: int = 24
     JWT_SECRET_KEY: str = "your_secret_key"
     JWT_ALGORITHM: str = "HS256"
+    JWT_CACHE_SIZE: int = 10_000
+
+    # PASSWORDS
+    PRELOAD_COMMON_PASSWORDS: bool = True
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_QUEUE_SIZE: int = 64
 
     # OAUTH
     GOOGLE_CLIENT_ID: str = ""
     GOOGLE_CLIENT_SECRET: str = ""
     GOOGLE_REDIRECT_URI: str = ""
     GOOGLE_TOKEN_URL: str = "https://accounts.google.com/o/oauth2/token"
+    GOOGLE_USER_INFO_URL: str = "https://www.googleapis.com/oauth2/v3/userinfo"
 
     YANDEX_CLIENT_ID: str = ""
     YANDEX_CLIENT_SECRET: str = ""
     YANDEX_REDIRECT_URI: str = ""
     YANDEX_TOKEN_URL: str = "https://oauth.yandex.ru/token"
+    YANDEX_USER_INFO_URL: str = "https://login.yandex.ru/info?format=json"
+
+    # HTTP CLIENT
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30
+    HTTP_CLIENT_TIMEOUT: float = 10
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5
+    HTTP_CLIENT_HTTP2: bool = False
 
     # BROKER
     EMAIL_SERVICE: bool = False
@@ -50,6 +68,9 @@ class Settings(BaseSettings):
     RABBITMQ_USER: str = ""
     RABBITMQ_PASS: str = ""
     RABBITMQ_PORT: int = 5672
+    AMQP_PUBLISHER_CHANNELS: int = 4
+    AMQP_PUBLISHER_BATCH_SIZE: int = 100
+    AMQP_PUBLISHER_BATCH_TIMEOUT: float = 0.005
 
     # LOGGING
     SENTRY_URL: str = ""
@@ -74,6 +95,18 @@ class Cache(BaseSettings):
     REDIS_HOST: str = "0.0.0.0"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 5
+    REDIS_SOCKET_TIMEOUT: float = 5
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    ROLES_CACHE_TTL: int = 300
+    ROLES_CACHE_LOCAL_TTL: float = 5
+    ROLES_CACHE_LOCAL_SIZE: int = 10_000
+
+    TASKS_CACHE_ENABLED: bool = True
+    TASKS_CACHE_TTL: int = 60
 
 
 class DB(BaseSettings):
@@ -86,6 +119,39 @@ class DB(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     SQL_REQUESTS_SHOW_IN_CONSOLE: bool = False
 
+    # CONNECTION POOL
+    # Connections of all workers of one instance of the API, e.g. the pool of PgBouncer
+    # or max_connections of Postgres divided by the number of instances.
+    DB_CONNECTIONS_BUDGET: int = 40
+    # Persistent connections of a worker, all of its share of the budget by default.
+    DB_POOL_SIZE: int | None = None
+    # Connections opened by a worker above DB_POOL_SIZE under load and closed when returned.
+    DB_MAX_OVERFLOW: int = 0
+    DB_POOL_TIMEOUT: float = 10
+    # Seconds after which a connection is replaced, -1 to keep connections forever.
+    DB_POOL_RECYCLE: int = 1800
+    # Ping every connection on checkout, it costs a round trip per request. Disconnects are
+    # detected on use anyway, enable it if a proxy drops idle connections faster than DB_POOL_RECYCLE.
+    DB_POOL_PRE_PING: bool = False
+
+    # PGBOUNCER
+    # POSTGRES_HOST and POSTGRES_PORT point to PgBouncer in transaction mode, so the next transaction
+    # may run on another server connection and prepared statements are not cached and get unique names.
+    DB_PGBOUNCER: bool = False
+    # Open a connection for every session instead of keeping a pool in the worker,
+    # useful behind PgBouncer which keeps the server connections itself.
+    DB_NULL_POOL: bool = False
+    # READ REPLICA
+    # GET endpoints read from the replica if its host is set. Users who wrote are pinned to the primary
+    # for DB_REPLICA_PIN_SECONDS, so they read their own writes while the replica catches up.
+    POSTGRES_REPLICA_HOST: str = ""
+    POSTGRES_REPLICA_PORT: int = 5432
+    DB_REPLICA_PIN_SECONDS: float = 5
+
+    # PgBouncer of the tests, they are skipped if it is not running.
+    PGBOUNCER_HOST: str = "localhost"
+    PGBOUNCER_PORT: int = 6432
+
     SYNC_PROVIDER: str = "postgresql+psycopg2"
     ASYNC_PROVIDER: str = "postgresql+asyncpg"
 
@@ -93,10 +159,22 @@ class DB(BaseSettings):
     def ASYNC_DNS_DB(self) -> str:
         return f"{self.ASYNC_PROVIDER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def ASYNC_DNS_REPLICA_DB(self) -> str:
+        return f"{self.ASYNC_PROVIDER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{self.POSTGRES_REPLICA_PORT}/{self.POSTGRES_DB}"
+
     @property
     def DNS_TEST_DB(self) -> str:
         return f"{self.ASYNC_PROVIDER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/test_{self.POSTGRES_DB}"
 
+    @property
+    def DNS_TEST_REPLICA_DB(self) -> str:
+        return f"{self.ASYNC_PROVIDER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/test_{self.POSTGRES_DB}_replica"
+
+    @property
+    def DNS_TEST_PGBOUNCER_DB(self) -> str:
+        return f"{self.ASYNC_PROVIDER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.PGBOUNCER_HOST}:{self.PGBOUNCER_PORT}/test_{self.POSTGRES_DB}"
+
 
 def get_settings() -> Settings:
     return Settings()  # type: ignore
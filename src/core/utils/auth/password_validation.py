@@ -1,9 +1,11 @@
 import gzip
 import re
 from difflib import SequenceMatcher
-from functools import cached_property
+from functools import cache, cached_property
 from pathlib import Path
 
+DEFAULT_PASSWORD_LIST_PATH: Path = Path(__file__).resolve().parent / "common-passwords.txt.gz"
+
 
 def exceeds_maximum_length_ratio(password, max_similarity, value):
     """
@@ -35,6 +37,23 @@ def exceeds_maximum_length_ratio(password, max_similarity, value):
     return pwd_len >= 10 * value_len and value_len < length_bound_similarity
 
 
+def get_common_passwords(password_list_path: Path | str = DEFAULT_PASSWORD_LIST_PATH) -> frozenset[str]:
+    """
+    Return the list of common passwords, it is read once per process for each path.
+    """
+    return _read_common_passwords(Path(password_list_path))
+
+
+@cache
+def _read_common_passwords(password_list_path: Path) -> frozenset[str]:
+    try:
+        with gzip.open(password_list_path, "rt", encoding="utf-8") as f:
+            return frozenset(x.strip() for x in f)
+    except OSError:
+        with open(password_list_path) as f:
+            return frozenset(x.strip() for x in f)
+
+
 class UserAttributeSimilarityValidator:
     """
     Validate that the password is sufficiently different from the user's
@@ -86,21 +105,17 @@ class CommonPasswordValidator:
     passwords (unhexed, lowercased and deduplicated), created by Royce Williams:
     https://gist.github.com/roycewilliams/226886fd01572964e1431ac8afc999ce
     The password list must be lowercased to match the comparison in validate().
+
+    The list is read on the first validation and shared by all validators
+    with the same path for the lifetime of the process.
     """
 
+    def __init__(self, password_list_path: Path | str = DEFAULT_PASSWORD_LIST_PATH) -> None:
+        self.password_list_path = password_list_path
+
     @cached_property
-    def DEFAULT_PASSWORD_LIST_PATH(self) -> Path:
-        return Path(__file__).resolve().parent / "common-passwords.txt.gz"
-
-    def __init__(self, password_list_path=DEFAULT_PASSWORD_LIST_PATH) -> None:
-        if password_list_path is CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH:
-            password_list_path = self.DEFAULT_PASSWORD_LIST_PATH
-        try:
-            with gzip.open(password_list_path, "rt", encoding="utf-8") as f:  # type: ignore
-                self.passwords = {x.strip() for x in f}
-        except OSError:
-            with open(password_list_path) as f:  # type: ignore
-                self.passwords = {x.strip() for x in f}
+    def passwords(self) -> frozenset[str]:
+        return get_common_passwords(self.password_list_path)
 
     def validate(self, *, password) -> None:
         if password and password.lower().strip() in self.passwords:
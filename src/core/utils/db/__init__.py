@@ -1,2 +1,10 @@
+from src.core.utils.db.errors import FOREIGN_KEY_VIOLATION as FOREIGN_KEY_VIOLATION
+from src.core.utils.db.errors import UNIQUE_VIOLATION as UNIQUE_VIOLATION
+from src.core.utils.db.errors import get_sqlstate as get_sqlstate
 from src.core.utils.db.generate_table_name import camel_to_snake as camel_to_snake
 from src.core.utils.db.generate_table_name import singular_to_plural as singular_to_plural
+from src.core.utils.db.pool import MeteredAsyncQueuePool as MeteredAsyncQueuePool
+from src.core.utils.db.pool import PoolMetrics as PoolMetrics
+from src.core.utils.db.search import SEARCH_CONFIG as SEARCH_CONFIG
+from src.core.utils.db.search import make_name_search as make_name_search
+from src.core.utils.db.search import set_word_similarity_threshold as set_word_similarity_threshold
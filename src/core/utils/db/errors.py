@@ -0,0 +1,12 @@
+from sqlalchemy.exc import DBAPIError
+
+# SQLSTATE codes of the integrity errors of PostgreSQL.
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def get_sqlstate(error: DBAPIError) -> str | None:
+    """
+    Returns the SQLSTATE code of the error raised by the driver.
+    """
+    return getattr(error.orig, "sqlstate", None) or getattr(error.orig, "pgcode", None)
@@ -0,0 +1,45 @@
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass(slots=True)
+class PoolMetrics:
+    """
+    Counters of the checkouts of a connection pool since it was created.
+
+    The wait of a checkout is the time spent to get a connection, including opening a new one
+    and the ping of the connection if ``pool_pre_ping`` is on.
+    """
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def add_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool of the async engine which counts the checkouts, their waits and the timeouts in ``metrics``.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> PoolProxiedConnection:
+        started: float = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.add_wait(time.perf_counter() - started)
@@ -0,0 +1,46 @@
+import re
+
+from sqlalchemy import ColumnElement, func, literal, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Names are in any language, so the words are not stemmed.
+SEARCH_CONFIG = "simple"
+WORD_PATTERN: re.Pattern = re.compile(r"\w+")
+# The default of pg_trgm (0.6) misses one-letter typos, e.g. "grocries" in "Buy groceries" is 0.58.
+WORD_SIMILARITY_THRESHOLD: float = 0.5
+
+
+async def set_word_similarity_threshold(session: AsyncSession) -> None:
+    """
+    Sets the threshold of the ``<%`` operator of ``make_name_search`` for the current transaction.
+    """
+    await session.execute(
+        select(func.set_config("pg_trgm.word_similarity_threshold", str(WORD_SIMILARITY_THRESHOLD), true())),
+    )
+
+
+def make_name_search(
+    *,
+    search_vector: ColumnElement,
+    name: ColumnElement[str],
+    text: str,
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """
+    Returns the condition and the rank of the search of the text in the names.
+
+    A name matches if it contains words starting with every word of the text (full-text search
+    on ``search_vector``) or if it has a part similar to the text, e.g. with a typo (pg_trgm word similarity).
+    Call ``set_word_similarity_threshold`` in the transaction of the query first.
+    The rank is the best of both.
+    """
+    similar: ColumnElement[bool] = literal(text).op("<%")(name)
+    similarity: ColumnElement[float] = func.word_similarity(text, name)
+    words: list[str] = WORD_PATTERN.findall(text.lower())
+    if not words:
+        return similar, similarity
+    # Only word characters are left, so the words are valid lexemes of the query.
+    ts_query: ColumnElement = func.to_tsquery(SEARCH_CONFIG, " & ".join(f"{word}:*" for word in words))
+    return (
+        or_(search_vector.op("@@")(ts_query), similar),
+        func.greatest(func.ts_rank(search_vector, ts_query), similarity),
+    )
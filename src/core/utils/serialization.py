@@ -0,0 +1,34 @@
+"""
+A module for encoding rows straight to the JSON of the API responses.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import orjson
+from sqlalchemy import ColumnElement, String, cast, func
+
+# The format of OutputApiSchema.serialize_datetime ("%Y-%m-%d %H:%M:%S") in PostgreSQL.
+API_DATETIME_FORMAT = "YYYY-MM-DD HH24:MI:SS"
+
+
+def api_datetime(column: Any) -> ColumnElement[str]:
+    """
+    Formats the timestamp in UTC, as asyncpg returns it, in the database.
+    """
+    return func.to_char(func.timezone("UTC", column), API_DATETIME_FORMAT)
+
+
+def api_uuid(column: Any) -> ColumnElement[str]:
+    return cast(column, String)
+
+
+def make_objects(rows: Iterable[Sequence], fields: Sequence[str]) -> list[dict]:
+    """
+    Makes the objects of the response from the rows, columns after the fields are skipped.
+    """
+    return [dict(zip(fields, row, strict=False)) for row in rows]
+
+
+def dumps_rows(rows: Iterable[Sequence], fields: Sequence[str]) -> bytes:
+    return orjson.dumps(make_objects(rows, fields))
@@ -1,25 +1,35 @@
 import logging
 import uuid
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, Security, security
+import httpx
+from fastapi import Depends, HTTPException, Query, Request, Security, security, status
+from pydantic import ValidationError
 from redis import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.apps.auth.services import AuthService
 from src.apps.projects.repository import ProjectRepository
 from src.apps.projects.services import ProjectService
 from src.apps.tasks.cache_repositories import CacheTasks
+from src.apps.tasks.enums import Priority, Status, TaskSort
 from src.apps.tasks.repository import TaskRepository
-from src.apps.tasks.services import TasksService
+from src.apps.tasks.schemas import TasksFilterIn
+from src.apps.tasks.services import TasksExportService, TasksService
+from src.apps.users.cache_repositories import CacheUserRoles, UserRoles
 from src.apps.users.models import User
 from src.apps.users.repositories import UsersRepository
 from src.apps.users.services import UsersService
-from src.core.db import get_async_session
-from src.core.services.cache import get_redis_connection
+from src.core.db import get_async_read_session, get_async_session, get_async_session_factory
+from src.core.pagination import Pagination, pagination_params
+from src.core.services.broker.publisher import amqp_publisher
+from src.core.services.cache import PrimaryPins, get_redis_connection
 from src.core.services.clients.google import GoogleClient
+from src.core.services.clients.http import get_http_client
 from src.core.services.clients.mail import MailClient
 from src.core.services.clients.yandex import YandexClient
+from src.core.settings import db
 from src.exceptions import (
     TokenExpiredException,
     TokenHasNotValidSignatureException,
@@ -33,15 +43,19 @@ session = Annotated[AsyncSession, Depends(get_async_session)]
 
 
 def get_mail_client() -> MailClient:
-    return MailClient()
+    return MailClient(publisher=amqp_publisher)
 
 
-def get_google_client() -> GoogleClient:
-    return GoogleClient()
+def get_google_client(
+    http_client: Annotated[httpx.AsyncClient, Depends(get_http_client)],
+) -> GoogleClient:
+    return GoogleClient(http_client=http_client)
 
 
-def get_yandex_client() -> YandexClient:
-    return YandexClient()
+def get_yandex_client(
+    http_client: Annotated[httpx.AsyncClient, Depends(get_http_client)],
+) -> YandexClient:
+    return YandexClient(http_client=http_client)
 
 
 def get_tasks_repository(
@@ -55,6 +69,16 @@ def get_cache_tasks_repository() -> CacheTasks:
     return CacheTasks(redis=redis_connection)
 
 
+def get_primary_pins() -> PrimaryPins:
+    redis_connection: Redis = get_redis_connection()  # type: ignore
+    return PrimaryPins(redis=redis_connection)
+
+
+def get_cache_user_roles_repository() -> CacheUserRoles:
+    redis_connection: Redis = get_redis_connection()  # type: ignore
+    return CacheUserRoles(redis=redis_connection)
+
+
 def get_users_repository(
     session: session,
 ) -> UsersRepository:
@@ -69,8 +93,12 @@ def get_project_repository(
 
 def get_project_service(
     project_repository: Annotated[ProjectRepository, Depends(get_project_repository)],
+    cache_task_repository: Annotated[CacheTasks, Depends(get_cache_tasks_repository)],
 ) -> ProjectService:
-    return ProjectService(project_repository=project_repository)
+    return ProjectService(
+        project_repository=project_repository,
+        cache_task_repository=cache_task_repository,
+    )
 
 
 def get_tasks_service(
@@ -85,6 +113,12 @@ def get_tasks_service(
     )
 
 
+def get_tasks_export_service(
+    session_factory: Annotated[async_sessionmaker, Depends(get_async_session_factory)],
+) -> TasksExportService:
+    return TasksExportService(session_factory=session_factory)
+
+
 def get_auth_service(
     users_repository: Annotated[UsersRepository, Depends(get_users_repository)],
     google_client: Annotated[GoogleClient, Depends(get_google_client)],
@@ -109,7 +143,43 @@ def get_users_service(
     )
 
 
+def get_tasks_filter(
+    pagination: Annotated[Pagination, Depends(pagination_params)],
+    task_status: Annotated[list[Status] | None, Query(alias="status", description="Any of the statuses")] = None,
+    priority: Annotated[list[Priority] | None, Query(description="Any of the priorities")] = None,
+    project_id: Annotated[uuid.UUID | None, Query(alias="projectId")] = None,
+    deadline_from: Annotated[datetime | None, Query(alias="deadlineFrom", description="Deadline at or after")] = None,
+    deadline_to: Annotated[datetime | None, Query(alias="deadlineTo", description="Deadline before")] = None,
+    overdue: Annotated[
+        bool | None,
+        Query(description="Pending or in progress tasks with a passed deadline (`true`) or all others (`false`)"),
+    ] = None,
+    sort: Annotated[TaskSort, Query(description="Field to sort by, `order` is its direction")] = TaskSort.created_at,
+) -> TasksFilterIn:
+    if pagination.cursor is not None and sort != TaskSort.created_at:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor is supported only for sort by createdAt",
+        )
+    try:
+        return TasksFilterIn(
+            status=task_status,
+            priority=priority,
+            project_id=project_id,
+            deadline_from=deadline_from,
+            deadline_to=deadline_to,
+            overdue=overdue,
+            sort=sort,
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.errors()[0]["msg"].removeprefix("Value error, "),
+        )
+
+
 async def get_request_user_id(
+    request: Request,
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
     token: security.http.HTTPAuthorizationCredentials = Security(reusable_oauth2),
 ) -> uuid.UUID:
@@ -120,12 +190,68 @@ async def get_request_user_id(
             status_code=401,
             detail=e.detail,
         )
+    # The user of the writes is pinned to the primary database by ReadYourWritesMiddleware.
+    request.state.user_id = user_id
     return user_id
 
 
+async def get_read_session(
+    user_id: Annotated[uuid.UUID, Depends(get_request_user_id)],
+    primary_session: session,
+    replica_session: Annotated[AsyncSession, Depends(get_async_read_session)],
+    primary_pins: Annotated[PrimaryPins, Depends(get_primary_pins)],
+) -> AsyncSession:
+    """
+    Returns the session of the replica for the reads of the user or the session of the primary
+    if the user wrote in the last ``DB_REPLICA_PIN_SECONDS`` seconds.
+    """
+    if db.POSTGRES_REPLICA_HOST and not await primary_pins.is_pinned(user_id=user_id):
+        replica_session.info["replica"] = True
+        return replica_session
+    return primary_session
+
+
+read_session = Annotated[AsyncSession, Depends(get_read_session)]
+
+
+def get_project_read_service(
+    read_session: read_session,
+    cache_task_repository: Annotated[CacheTasks, Depends(get_cache_tasks_repository)],
+) -> ProjectService:
+    return ProjectService(
+        project_repository=ProjectRepository(session=read_session),
+        cache_task_repository=cache_task_repository,
+    )
+
+
+def get_tasks_read_service(
+    read_session: read_session,
+    cache_task_repository: Annotated[CacheTasks, Depends(get_cache_tasks_repository)],
+) -> TasksService:
+    return TasksService(
+        task_repository=TaskRepository(session=read_session),
+        project_repository=ProjectRepository(session=read_session),
+        cache_task_repository=cache_task_repository,
+        # A lagging replica would cache stale tasks under the version of a newer write,
+        # and without filling the cache its reads would hardly ever hit.
+        use_cache=not read_session.info.get("replica", False),
+    )
+
+
+def get_users_read_service(
+    read_session: read_session,
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+) -> UsersService:
+    return UsersService(
+        users_repository=UsersRepository(session=read_session),
+        auth_service=auth_service,
+    )
+
+
 async def get_request_staff_or_superuser_user_id(
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
     users_repository: Annotated[UsersRepository, Depends(get_users_repository)],
+    cache_user_roles_repository: Annotated[CacheUserRoles, Depends(get_cache_user_roles_repository)],
     token: security.http.HTTPAuthorizationCredentials = Security(reusable_oauth2),
 ) -> uuid.UUID:
     try:
@@ -135,9 +261,14 @@ async def get_request_staff_or_superuser_user_id(
             status_code=401,
             detail=e.detail,
         )
-    user: User | None = await users_repository.get(user_id=user_id)
-    if user:
-        if not (user.is_staff or user.is_super_user):
+    roles: UserRoles | None = await cache_user_roles_repository.get(user_id=user_id)
+    if roles is None:
+        user: User | None = await users_repository.get(user_id=user_id)
+        if user:
+            roles = UserRoles(is_staff=user.is_staff, is_super_user=user.is_super_user)
+            await cache_user_roles_repository.set(user_id=user_id, roles=roles)
+    if roles:
+        if not (roles.is_staff or roles.is_super_user):
             raise HTTPException(
                 status_code=401,
                 detail="Permission denied",
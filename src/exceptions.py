@@ -26,6 +26,10 @@ class TaskAlreadyExistsException(Exception):
     detail: str = "Task already exists"
 
 
+class TasksImportFileNotValidException(Exception):
+    detail: str = "File is not valid"
+
+
 class ProjectNotFoundException(Exception):
     detail: str = "Project not found"
 
@@ -36,3 +40,7 @@ class ProjectAlreadyExistsException(Exception):
 
 class PermissionDeniedException(Exception):
     detail: str = "Token has not valid signature"
+
+
+class PasswordHasherOverloadedException(Exception):
+    detail: str = "Too many requests, try again later"
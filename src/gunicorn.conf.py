@@ -3,5 +3,6 @@ from uvicorn.workers import UvicornWorker
 from src.core.settings import settings
 
 bind: str = f"{settings.APP_HOST}:{settings.APP_PORT}"
-workers = 4
+# Every worker has its own pool of DB_CONNECTIONS_BUDGET // APP_WORKERS connections.
+workers: int = settings.APP_WORKERS
 worker_class = UvicornWorker
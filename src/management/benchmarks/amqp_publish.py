@@ -0,0 +1,86 @@
+"""
+Benchmark of publishing the welcome emails to the broker.
+
+Publishes the same messages to a throwaway queue with a new connection per message
+(as MailClient did before) and with the shared AmqpPublisher, and prints the throughput.
+Needs the RabbitMQ of docker compose (RABBITMQ_* settings):
+
+    python3 src/management/benchmarks/amqp_publish.py --messages 10000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import aio_pika
+
+sys.path.append(str(Path(__file__).parents[3]))
+from src.core.services.broker.consumer import get_broker_connection
+from src.core.services.broker.publisher import AmqpPublisher
+from src.core.settings import settings
+
+QUEUE = "benchmark_email_queue"
+
+
+def make_message() -> aio_pika.Message:
+    return aio_pika.Message(
+        body=json.dumps({"subject": "Welcome email", "body": "Welcome to pomodoro", "email": "a@b.c"}).encode(),
+        correlation_id=str(uuid.uuid4()),
+    )
+
+
+async def publish_with_new_connection() -> None:
+    connection = await aio_pika.connect_robust(settings.AMQP_BROKER_URL)
+    async with connection:
+        channel = await connection.channel()
+        await channel.default_exchange.publish(message=make_message(), routing_key=QUEUE)
+
+
+async def run(name: str, publish: Callable[[], Awaitable[None]], messages: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def publish_one() -> None:
+        async with semaphore:
+            await publish()
+
+    started: float = time.perf_counter()
+    await asyncio.gather(*(publish_one() for _ in range(messages)))
+    seconds: float = time.perf_counter() - started
+    print(f"\x1b[35m{name}: {messages / seconds:,.0f} messages/s ({seconds:.2f} s)\x1b[0m")
+
+
+async def main(messages: int, concurrency: int) -> None:
+    connection = await get_broker_connection()
+    async with connection:
+        channel = await connection.channel()
+        queue = await channel.declare_queue(QUEUE, auto_delete=True)
+
+        await run("connection per message", publish_with_new_connection, messages // 10, concurrency)
+
+        publisher = AmqpPublisher(
+            pool_size=settings.AMQP_PUBLISHER_CHANNELS,
+            batch_size=settings.AMQP_PUBLISHER_BATCH_SIZE,
+            batch_timeout=settings.AMQP_PUBLISHER_BATCH_TIMEOUT,
+        )
+        await publisher.start()
+        await run(
+            "shared publisher",
+            lambda: publisher.publish(message=make_message(), routing_key=QUEUE),
+            messages,
+            concurrency,
+        )
+        await publisher.close()
+        await queue.delete(if_unused=False, if_empty=False)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.concurrency))
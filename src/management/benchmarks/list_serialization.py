@@ -0,0 +1,99 @@
+"""
+Benchmark of the serialization of the tasks list.
+
+Reads 100-item pages of the benchmark account filled by `listing_queries.py` and
+encodes them as GET /tasks did before (ORM objects validated into TaskOut and dumped by FastAPI)
+and as it does now (rows of the formatted columns encoded by orjson), checks that both give
+the same bytes and prints the latency of both paths with and without the query:
+
+    python3 src/management/benchmarks/list_serialization.py --iterations 1000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+sys.path.append(str(Path(__file__).parents[3]))
+from src.apps.tasks.repository import TASK_ROW_FIELDS, TaskRepository
+from src.apps.tasks.schemas import TaskOut
+from src.apps.users.models import User
+from src.core.db import engine
+from src.core.utils.serialization import dumps_rows
+
+BENCHMARK_EMAIL = "benchmark@example.com"
+PER_PAGE = 100
+
+local_session = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+tasks_adapter: TypeAdapter[list[TaskOut]] = TypeAdapter(list[TaskOut])
+
+
+def dumps_models(tasks: list) -> bytes:
+    # The service validated every task and FastAPI validated and dumped the list for ORJSONResponse.
+    tasks_out: list[TaskOut] = tasks_adapter.validate_python([TaskOut.model_validate(task) for task in tasks])
+    return orjson.dumps(tasks_adapter.dump_python(tasks_out, mode="json", by_alias=True))
+
+
+async def measure(name: str, call: Callable[[], Awaitable[bytes]], iterations: int) -> None:
+    timings: list[float] = []
+    for _ in range(iterations):
+        started: float = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - started) * 1000)
+    print(
+        f"\x1b[35m{name}: median {statistics.median(timings):.3f} ms, "
+        f"p95 {statistics.quantiles(timings, n=20)[-1]:.3f} ms\x1b[0m"
+    )
+
+
+async def main(iterations: int) -> None:
+    async with local_session() as session:
+        user_id = await session.scalar(select(User.id).where(User.email == BENCHMARK_EMAIL))
+        if user_id is None:
+            print(f"Run listing_queries.py first to create {BENCHMARK_EMAIL}")
+            return
+        repository = TaskRepository(session=session)
+        page: dict = {"user_id": user_id, "order": desc, "page": 1, "per_page": PER_PAGE}
+        tasks: list = await repository.get_all(**page)
+        rows = await repository.get_all_rows(**page)
+        if dumps_models(tasks) != dumps_rows(rows, TASK_ROW_FIELDS):
+            print("\x1b[31mThe paths give different JSON\x1b[0m")
+            return
+
+        async def encode_models() -> bytes:
+            return dumps_models(tasks)
+
+        async def encode_rows() -> bytes:
+            return dumps_rows(rows, TASK_ROW_FIELDS)
+
+        async def query_and_encode_models() -> bytes:
+            return dumps_models(await repository.get_all(**page))
+
+        async def query_and_encode_rows() -> bytes:
+            return dumps_rows(await repository.get_all_rows(**page), TASK_ROW_FIELDS)
+
+        print(f"{PER_PAGE} tasks per page, {iterations} iterations")
+        await measure("encode, TaskOut", encode_models, iterations)
+        await measure("encode, rows", encode_rows, iterations)
+        await measure("query and encode, TaskOut", query_and_encode_models, iterations)
+        await measure("query and encode, rows", query_and_encode_rows, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,163 @@
+"""
+Benchmark of the tasks and projects listing queries.
+
+Fills the database with one large account (1M tasks by default) and prints
+the plan and the latency of the hot listing queries. Run it before and after
+`alembic upgrade head` to compare plans with and without the listing indexes:
+
+    python3 src/management/benchmarks/listing_queries.py --tasks 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+sys.path.append(str(Path(__file__).parents[3]))
+from src.core.db import engine
+
+BENCHMARK_EMAIL = "benchmark@example.com"
+
+local_session = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+QUERIES: dict[str, str] = {
+    "tasks, first page": """
+        SELECT * FROM tasks WHERE user_id = :user_id
+        ORDER BY created_at DESC, id DESC LIMIT 100
+    """,
+    "tasks, page 5000 (offset)": """
+        SELECT * FROM tasks WHERE user_id = :user_id
+        ORDER BY created_at DESC, id DESC LIMIT 100 OFFSET 499900
+    """,
+    "tasks, page after cursor": """
+        SELECT * FROM tasks WHERE user_id = :user_id
+        AND (created_at, id) < (now() - interval '500000 seconds', '00000000-0000-0000-0000-000000000000')
+        ORDER BY created_at DESC, id DESC LIMIT 100
+    """,
+    "tasks of project, first page": """
+        SELECT * FROM tasks WHERE project_id = :project_id
+        ORDER BY created_at DESC LIMIT 100
+    """,
+    "tasks by status, first page": """
+        SELECT * FROM tasks WHERE user_id = :user_id AND status = 'progress'
+        ORDER BY created_at DESC LIMIT 100
+    """,
+    "tasks by priority, first page": """
+        SELECT * FROM tasks WHERE user_id = :user_id AND priority = 'high'
+        ORDER BY created_at DESC LIMIT 100
+    """,
+    "tasks by statuses, first page": """
+        SELECT * FROM tasks WHERE user_id = :user_id AND status IN ('pending', 'progress')
+        ORDER BY created_at DESC, id DESC LIMIT 100
+    """,
+    "tasks sorted by updated_at, first page": """
+        SELECT * FROM tasks WHERE user_id = :user_id
+        ORDER BY updated_at DESC, created_at DESC, id DESC LIMIT 100
+    """,
+    "tasks sorted by deadline, first page": """
+        SELECT * FROM tasks WHERE user_id = :user_id
+        ORDER BY deadline, created_at, id LIMIT 100
+    """,
+    "overdue tasks sorted by deadline, first page": """
+        SELECT * FROM tasks WHERE user_id = :user_id
+        AND status IN ('pending', 'progress') AND deadline < timezone('UTC', now())
+        ORDER BY deadline, created_at, id LIMIT 100
+    """,
+    "projects, first page": """
+        SELECT * FROM projects WHERE user_id = :user_id
+        ORDER BY created_at DESC, id DESC LIMIT 100
+    """,
+}
+
+
+async def create_dataset(*, session: AsyncSession, count_tasks: int, count_projects: int) -> uuid.UUID:
+    user_id: uuid.UUID | None = await session.scalar(
+        text("SELECT id FROM users WHERE email = :email"),
+        {"email": BENCHMARK_EMAIL},
+    )
+    if user_id is not None:
+        return user_id
+    user_id = await session.scalar(
+        text(
+            "INSERT INTO users (email, is_active, is_staff, is_super_user) "
+            "VALUES (:email, true, false, false) RETURNING id"
+        ),
+        {"email": BENCHMARK_EMAIL},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO projects (name, user_id, created_at) "
+            "SELECT 'Benchmark project ' || i, :user_id, now() - i * interval '1 hour' "
+            "FROM generate_series(1, :count_projects) AS i"
+        ),
+        {"user_id": user_id, "count_projects": count_projects},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO tasks (name, user_id, project_id, priority, status, created_at, deadline) "
+            "SELECT 'Benchmark task ' || i, :user_id, project_ids[1 + i % array_length(project_ids, 1)], "
+            "(ARRAY['low', 'medium', 'high'])[1 + i % 3]::priority, "
+            "(ARRAY['pending', 'progress', 'completed', 'expired'])[1 + i % 4]::status, "
+            "now() - i * interval '1 second', "
+            "CASE WHEN i % 5 > 0 THEN timezone('UTC', now()) + (i % 30 - 10) * interval '1 day' END "
+            "FROM generate_series(1, :count_tasks) AS i, "
+            "(SELECT array_agg(id) AS project_ids FROM projects WHERE user_id = :user_id) AS p"
+        ),
+        {"user_id": user_id, "count_tasks": count_tasks},
+    )
+    await session.commit()
+    return user_id
+
+
+async def run_query(*, session: AsyncSession, name: str, query: str, params: dict, repeat: int) -> None:
+    plan: list[str] = list((await session.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"), params)).scalars())
+    latencies: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        await session.execute(text(query), params)
+        latencies.append((time.perf_counter() - start) * 1000)
+    print(f"\x1b[35m{name}: median {statistics.median(latencies):.2f} ms, max {max(latencies):.2f} ms\x1b[0m")
+    print("\n".join(f"    {line}" for line in plan), end="\n\n")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="count of tasks of the account")
+    parser.add_argument("--projects", type=int, default=100, help="count of projects of the account")
+    parser.add_argument("--repeat", type=int, default=20, help="count of runs of each query")
+    args = parser.parse_args()
+
+    async with local_session() as session:
+        user_id: uuid.UUID = await create_dataset(
+            session=session,
+            count_tasks=args.tasks,
+            count_projects=args.projects,
+        )
+        await session.execute(text("ANALYZE users, projects, tasks"))
+        await session.commit()
+        project_id: uuid.UUID | None = await session.scalar(
+            text("SELECT id FROM projects WHERE user_id = :user_id LIMIT 1"),
+            {"user_id": user_id},
+        )
+        for name, query in QUERIES.items():
+            await run_query(
+                session=session,
+                name=name,
+                query=query,
+                params={"user_id": user_id, "project_id": project_id},
+                repeat=args.repeat,
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
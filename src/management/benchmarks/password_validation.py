@@ -0,0 +1,46 @@
+"""
+Microbenchmark of the common password validation.
+
+Compares the validation with the list of common passwords read from the gzip
+file on every call (as it was before) with the validation against the list
+shared by the process:
+
+    python3 src/management/benchmarks/password_validation.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parents[3]))
+from src.core.utils.auth.password_validation import (
+    DEFAULT_PASSWORD_LIST_PATH,
+    CommonPasswordValidator,
+    _read_common_passwords,
+    get_common_passwords,
+)
+
+PASSWORD = "Str0ngP@ssw0rd!"
+
+
+def validate_with_reading_list() -> None:
+    passwords: frozenset[str] = _read_common_passwords.__wrapped__(DEFAULT_PASSWORD_LIST_PATH)
+    assert PASSWORD.lower().strip() not in passwords
+
+
+def validate_with_shared_list(validator: CommonPasswordValidator = CommonPasswordValidator()) -> None:
+    validator.validate(password=PASSWORD)
+
+
+def main() -> None:
+    get_common_passwords()
+    for name, func, number in (
+        ("read list per validation", validate_with_reading_list, 20),
+        ("shared list", validate_with_shared_list, 1_000_000),
+    ):
+        seconds: float = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"\x1b[35m{name}: {seconds * 1_000_000:.3f} µs per validation\x1b[0m")
+
+
+if __name__ == "__main__":
+    main()
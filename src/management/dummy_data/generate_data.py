@@ -8,7 +8,7 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 sys.path.append(str(Path(__file__).parents[3]))
-from src.apps.auth.security import bcrypt_context
+from src.apps.auth.security import password_hasher
 from src.apps.projects.models import Project
 from src.apps.tasks.models import Task
 from src.apps.users.models import User
@@ -33,7 +33,7 @@ async def create_user(*, session: AsyncSession) -> int:
     if user is None:
         user = User(
             email="beazley@example.com",
-            password=bcrypt_context.hash("Str0ngP@ssw0rd!"),
+            password=await password_hasher.hash("Str0ngP@ssw0rd!"),
             first_name="David",
             last_name="Beazly",
         )
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.core.pagination import NEXT_CURSOR_HEADER
 from src.core.settings import settings
 
 
@@ -15,4 +16,5 @@ def init_corse_middleware(_app: FastAPI) -> None:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
@@ -0,0 +1,38 @@
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.services.cache import PrimaryPins, get_redis_connection
+from src.core.settings import db
+
+READ_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins the user of a successful write request to the primary database before the response is sent,
+    so the next reads of the user do not go to a replica which has not received the write yet.
+
+    The user is the one authenticated by ``get_request_user_id``, requests without a user are not pinned.
+    Signup and the OAuth callbacks create the user without authenticating it and pin it themselves.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in READ_METHODS or not db.POSTGRES_REPLICA_HOST:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_after_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                user_id = scope.get("state", {}).get("user_id")
+                if user_id is not None:
+                    await PrimaryPins(redis=get_redis_connection()).pin(user_id=user_id)  # type: ignore
+            await send(message)
+
+        await self.app(scope, receive, send_after_pin)
+
+
+def init_read_your_writes_middleware(_app: FastAPI) -> None:
+    _app.add_middleware(ReadYourWritesMiddleware)
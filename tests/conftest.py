@@ -1,8 +1,20 @@
+import pytest
+from pytest_asyncio import is_async_test
+
 pytest_plugins: list[str] = [
     "tests.db_connector",
     "tests.fixtures.infrastructure",
     "tests.fixtures.alembic",
+    "tests.fixtures.auth.auth_fixtures",
     "tests.fixtures.users.user_fixtures",
     "tests.fixtures.projects.project_fixtures",
     "tests.fixtures.tasks.task_fixtures",
 ]
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Tests share the event loop of the fixtures, so the connection pools of the app are bound to one loop.
+    session_loop_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop_marker, append=False)
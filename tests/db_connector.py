@@ -2,7 +2,7 @@ from sqlalchemy import NullPool
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from src.bootstrap import app
-from src.core.db import get_async_session
+from src.core.db import get_async_session, get_async_session_factory
 from src.core.settings import db
 
 test_engine: AsyncEngine = create_async_engine(
@@ -26,3 +26,4 @@ async def override_get_async_session():
 
 
 app.dependency_overrides[get_async_session] = override_get_async_session
+app.dependency_overrides[get_async_session_factory] = lambda: TestingSessionLocal
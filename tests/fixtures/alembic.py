@@ -1,9 +1,14 @@
+import asyncio
 import os
 
 import pytest
 
 
 @pytest.fixture(scope="function")
-def alembic_config() -> None:
+def alembic_config():
     """Change ENVIRONMENT to tests for ALEMBIC .ENV"""
     os.environ["ENVIRONMENT"] = "tests"
+    # Migrations are run by asyncio.run, which unsets the event loop shared by the tests.
+    loop: asyncio.AbstractEventLoop = asyncio.get_event_loop_policy().get_event_loop()
+    yield
+    asyncio.set_event_loop(loop)
@@ -0,0 +1,37 @@
+import httpx
+import pytest
+
+from src.core.services.clients.http import get_http_client
+from src.core.settings import settings
+from tests.db_connector import app
+
+OAUTH_USER_INFO: dict[str, dict] = {
+    settings.GOOGLE_USER_INFO_URL: {"id": 1, "email": "google@example.com", "name": "Google"},
+    settings.YANDEX_USER_INFO_URL: {
+        "id": 1,
+        "login": "yandex",
+        "default_email": "yandex@example.com",
+        "real_name": "Yandex",
+    },
+}
+
+
+@pytest.fixture
+async def oauth_requests():
+    """
+    Answers the requests of the OAuth clients instead of Google and Yandex and returns the received requests.
+    """
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if str(request.url) in (settings.GOOGLE_TOKEN_URL, settings.YANDEX_TOKEN_URL):
+            return httpx.Response(200, json={"access_token": "oauth_access_token"})
+        if request.headers.get("Authorization", "").endswith("oauth_access_token"):
+            return httpx.Response(200, json=OAUTH_USER_INFO[str(request.url)])
+        return httpx.Response(401)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        app.dependency_overrides[get_http_client] = lambda: http_client
+        yield requests
+    del app.dependency_overrides[get_http_client]
@@ -1,8 +1,12 @@
+from collections.abc import Iterator
+
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from src.core.db import Base
+from src.core.services.cache import close_redis_pool
 from src.core.settings import db
 from tests.db_connector import TestingSessionLocal, app, test_engine
 
@@ -34,6 +38,12 @@ async def init_tables():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(scope="session", autouse=True)
+async def redis_pool():
+    yield
+    await close_redis_pool()
+
+
 @pytest.fixture(scope="function")
 async def session():
     async with TestingSessionLocal() as session:
@@ -47,3 +57,18 @@ async def async_client():
         base_url="http://test",
     ) as async_client:
         yield async_client
+
+
+@pytest.fixture(scope="function")
+def sql_statements() -> Iterator[list[str]]:
+    """
+    Collects the SQL statements executed by the app while the test runs.
+    """
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
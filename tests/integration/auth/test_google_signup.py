@@ -1,3 +1,4 @@
+import httpx
 import pytest
 from fastapi import status
 from httpx import AsyncClient, Response
@@ -22,3 +23,20 @@ async def test_redirect_google_signup__success(
         follow_redirects=True,
     )
     assert response.url == settings.GOOGLE_REDIRECT_URL
+
+
+@pytest.mark.integration
+async def test_google_auth__success(
+    oauth_requests: list[httpx.Request],
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get("/api/v1/auth/google", params={"code": "code"})
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == {"id", "accessToken"}
+
+    login_response: Response = await async_client.get("/api/v1/auth/google", params={"code": "code"})
+    assert login_response.json()["id"] == response.json()["id"]
+    assert [str(request.url) for request in oauth_requests] == [
+        settings.GOOGLE_TOKEN_URL,
+        settings.GOOGLE_USER_INFO_URL,
+    ] * 2
@@ -2,6 +2,7 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient, Response
 
+from src.apps.auth.security import password_hasher
 from src.apps.users.schemas import UserLoginOut, UserSignUpIn
 
 
@@ -78,3 +79,23 @@ async def test_login_no_valid_payload__fail(
     )
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+async def test_login_password_hasher_overloaded__fail(
+    get_user: UserSignUpIn,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(password_hasher, "max_workers", 0)
+    monkeypatch.setattr(password_hasher, "queue_size", 0)
+    response: Response = await async_client.post(
+        "/api/v1/auth/login",
+        json={
+            "email": get_user.email,
+            "password": get_user.password,
+        },
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {"detail": "Too many requests, try again later"}
@@ -4,6 +4,8 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient, Response
 
+from src.apps.tasks.schemas import TaskIn
+
 
 @pytest.mark.integration
 async def test_delete_projects__success(
@@ -19,6 +21,30 @@ async def test_delete_projects__success(
     assert response.status_code == status.HTTP_204_NO_CONTENT
 
 
+@pytest.mark.integration
+async def test_delete_projects_with_cached_tasks__success(
+    get_access_token: str,
+    get_project: dict,
+    get_project_tasks: list[TaskIn],
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert len(response.json()) == len(get_project_tasks)
+
+    await async_client.delete(
+        f"/api/v1/projects/{get_project['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert response.json() == []
+
+
 @pytest.mark.integration
 async def test_delete_not_exists_projects__success(
     get_access_token: str,
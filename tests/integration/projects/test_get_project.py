@@ -5,6 +5,7 @@ from fastapi import status
 from httpx import AsyncClient, Response
 
 from src.apps.projects.schemas import ProjectIn, ProjectOut
+from src.apps.tasks.schemas import TaskIn
 
 
 @pytest.mark.integration
@@ -77,3 +78,107 @@ async def test_get_projects_not_authorized__fail(
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
     assert response.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.integration
+async def test_get_projects_by_cursor__success(
+    get_access_token: str,
+    get_projects: list[ProjectIn],
+    async_client: AsyncClient,
+) -> None:
+    names: list[str] = []
+    params: dict[str, str | int] = {"perPage": 2, "order": "asc"}
+    while True:
+        response: Response = await async_client.get(
+            "/api/v1/projects",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            params=params,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        names.extend(project["name"] for project in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    assert names == [project.name for project in get_projects]
+
+
+@pytest.mark.integration
+async def test_get_projects_same_as_project__success(
+    get_project: dict,
+    get_project_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    params: dict = {"include": ["tasks", "taskCounts"]}
+    response: Response = await async_client.get(
+        "/api/v1/projects",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params=params,
+    )
+    project_response: Response = await async_client.get(
+        f"/api/v1/projects/{get_project['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params=params,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()[0]["tasks"]) == len(get_project_tasks)
+    assert response.content == b"[" + project_response.content + b"]"
+
+
+@pytest.mark.integration
+async def test_get_projects_without_tasks__success(
+    get_project: dict,
+    get_project_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/projects",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    project_response: Response = await async_client.get(
+        f"/api/v1/projects/{get_project['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [project["tasks"] for project in response.json()] == [None]
+    assert [project["taskCounts"] for project in response.json()] == [None]
+    assert project_response.json()["tasks"] is None
+    assert project_response.json()["taskCounts"] is None
+
+
+@pytest.mark.integration
+async def test_get_projects_with_tasks_limit__success(
+    get_project: dict,
+    get_project_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/projects",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"include": ["tasks", "taskCounts"], "tasksLimit": 2},
+    )
+    [project] = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [task["name"] for task in project["tasks"]] == [task.name for task in get_project_tasks[:1:-1]]
+    assert project["taskCounts"] == {"pending": len(get_project_tasks), "progress": 0, "completed": 0, "expired": 0}
+
+
+@pytest.mark.parametrize("params", [{"include": "project"}, {"tasksLimit": 0}, {"tasksLimit": 101}])
+@pytest.mark.integration
+async def test_get_projects_not_valid_include__fail(
+    params: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/projects",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params=params,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,37 @@
+import pytest
+from httpx import AsyncClient, Response
+
+
+@pytest.mark.parametrize(
+    "method,path,payload,count_queries",
+    [
+        ("POST", "/api/v1/projects", {"name": "Read books"}, 1),
+        ("POST", "/api/v1/projects", {"name": "TaskMania"}, 1),
+        ("PUT", "/api/v1/projects/{project_id}", {"name": "Read books"}, 1),
+        ("PUT", "/api/v1/projects/{project_id}", {"name": "TaskMania"}, 1),
+        ("DELETE", "/api/v1/projects/{project_id}", None, 1),
+    ],
+)
+@pytest.mark.integration
+async def test_project_write_endpoints_queries__success(
+    method: str,
+    path: str,
+    payload: dict | None,
+    count_queries: int,
+    get_project: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+    sql_statements: list[str],
+) -> None:
+    sql_statements.clear()
+    response: Response = await async_client.request(
+        method,
+        path.format(project_id=get_project["id"]),
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json=payload,
+    )
+
+    assert response.status_code < 500
+    assert len(sql_statements) == count_queries, sql_statements
+    # Projects are written without reading them or their tasks first.
+    assert not [statement for statement in sql_statements if statement.lstrip().startswith("SELECT")]
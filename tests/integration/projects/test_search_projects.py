@@ -0,0 +1,64 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.apps.projects.schemas import ProjectIn, ProjectOut
+
+
+@pytest.mark.integration
+async def test_search_projects__success(
+    get_access_token: str,
+    get_projects: list[ProjectIn],
+    async_client: AsyncClient,
+) -> None:
+    await async_client.post(
+        "/api/v1/projects",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": "Home renovation"},
+    )
+    response: Response = await async_client.get(
+        "/api/v1/projects/search",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"q": "renovaton"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [project["name"] for project in response.json()] == ["Home renovation"]
+    project: ProjectOut = ProjectOut.model_validate(response.json()[0])
+    assert project.tasks is None
+    assert project.task_counts is None
+
+
+@pytest.mark.integration
+async def test_search_projects_pages__success(
+    get_access_token: str,
+    get_projects: list[ProjectIn],
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/projects/search",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"q": "taskmania", "page": 2, "perPage": 2},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 2
+
+
+@pytest.mark.integration
+async def test_search_projects_of_other_user__success(
+    get_projects: list[ProjectIn],
+    async_client: AsyncClient,
+) -> None:
+    signup_response: Response = await async_client.post(
+        "/api/v1/users/signup",
+        json={"email": "other@example.com", "password": "strong_password"},
+    )
+    response: Response = await async_client.get(
+        "/api/v1/projects/search",
+        headers={"Authorization": f"Bearer {signup_response.json()['accessToken']}"},
+        params={"q": "taskmania"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
@@ -25,6 +25,43 @@ async def test_update_project__success(
     assert ProjectOut.model_validate(response.json())
 
 
+@pytest.mark.integration
+async def test_update_project_same_name__success(
+    get_access_token: str,
+    get_project: dict,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.put(
+        f"/api/v1/projects/{get_project['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": get_project["name"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == get_project
+
+
+@pytest.mark.integration
+async def test_update_project_exists_name__fail(
+    get_access_token: str,
+    get_project: dict,
+    async_client: AsyncClient,
+) -> None:
+    await async_client.post(
+        "/api/v1/projects",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": "TaskMania v2.0"},
+    )
+    response: Response = await async_client.put(
+        f"/api/v1/projects/{get_project['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": "TaskMania v2.0"},
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert response.json() == {"detail": "Project already exists"}
+
+
 @pytest.mark.integration
 async def test_update_not_exists_project__fail(
     get_access_token: str,
@@ -64,3 +64,22 @@ async def test_create_project_task_not_exists_project__fail(
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json() == {"detail": "Project not found"}
+
+
+@pytest.mark.integration
+async def test_create_project_task_other_user_project__fail(
+    get_project: dict,
+    async_client: AsyncClient,
+) -> None:
+    signup_response: Response = await async_client.post(
+        "/api/v1/users/signup",
+        json={"email": "other@example.com", "password": "strong_password"},
+    )
+    response: Response = await async_client.post(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {signup_response.json()['accessToken']}"},
+        json={"name": "Read a book", "projectId": get_project["id"]},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Project not found"}
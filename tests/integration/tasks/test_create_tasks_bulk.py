@@ -0,0 +1,140 @@
+import uuid
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.apps.projects.repository import ProjectRepository
+from src.apps.tasks.schemas import TasksBulkOut
+
+
+@pytest.mark.integration
+async def test_create_tasks_bulk__success(
+    get_access_token: str,
+    get_project: dict,
+    async_client: AsyncClient,
+) -> None:
+    tasks: list[dict] = [
+        {"name": "Meditaion"},
+        {"name": "Meditaion1", "priority": "high", "status": "progress"},
+        {"name": "Meditaion2", "projectId": get_project["id"]},
+    ]
+    response: Response = await async_client.post(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"tasks": tasks},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert TasksBulkOut.model_validate(response.json())
+    assert [task["name"] for task in response.json()["created"]] == [task["name"] for task in tasks]
+    assert response.json()["created"][2]["projectId"] == get_project["id"]
+    assert response.json()["errors"] == []
+
+
+@pytest.mark.integration
+async def test_create_tasks_bulk_with_errors__success(
+    get_access_token: str,
+    get_task: dict,
+    async_client: AsyncClient,
+) -> None:
+    tasks: list[dict] = [
+        {"name": get_task["name"]},
+        {"name": "Meditaion"},
+        {"name": "Meditaion"},
+        {"name": "Meditaion1", "projectId": str(uuid.uuid4())},
+    ]
+    response: Response = await async_client.post(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"tasks": tasks},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [task["name"] for task in response.json()["created"]] == ["Meditaion"]
+    assert response.json()["errors"] == [
+        {"index": 0, "detail": "Task already exists"},
+        {"index": 2, "detail": "Task already exists"},
+        {"index": 3, "detail": "Project not found"},
+    ]
+
+
+@pytest.mark.integration
+async def test_create_tasks_bulk_project_deleted_meanwhile__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    get_ids = ProjectRepository.get_ids
+    calls: list[set[uuid.UUID]] = []
+
+    async def get_ids_before_delete(self, *, user_id: uuid.UUID, project_ids: set[uuid.UUID]) -> set[uuid.UUID]:
+        # The first check sees the project, which is deleted before the insert.
+        calls.append(project_ids)
+        if len(calls) == 1:
+            return project_ids
+        return await get_ids(self, user_id=user_id, project_ids=project_ids)
+
+    monkeypatch.setattr(ProjectRepository, "get_ids", get_ids_before_delete)
+    tasks: list[dict] = [
+        {"name": "Meditaion"},
+        {"name": "Meditaion1", "projectId": str(uuid.uuid4())},
+    ]
+    response: Response = await async_client.post(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"tasks": tasks},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [task["name"] for task in response.json()["created"]] == ["Meditaion"]
+    assert response.json()["errors"] == [{"index": 1, "detail": "Project not found"}]
+    assert len(calls) == 2
+
+
+@pytest.mark.integration
+async def test_create_many_tasks_bulk__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"tasks": [{"name": f"Meditaion{i}"} for i in range(2500)]},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(response.json()["created"]) == 2500
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"perPage": 100, "page": 25},
+    )
+    assert len(response.json()) == 100
+
+
+@pytest.mark.integration
+async def test_create_empty_tasks_bulk__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"tasks": []},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+async def test_create_tasks_bulk_not_authorized__fail(
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/tasks/bulk",
+        json={"tasks": [{"name": "Meditaion"}]},
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.json() == {"detail": "Not authenticated"}
@@ -0,0 +1,72 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.apps.tasks.schemas import TaskIn
+
+
+@pytest.mark.integration
+async def test_delete_tasks_bulk_by_ids__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    ids: list[str] = [task["id"] for task in response.json()[:3]]
+
+    response = await async_client.request(
+        "DELETE",
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"filter": {"ids": ids}},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(response.json()["ids"]) == sorted(ids)
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert len(response.json()) == len(get_tasks) - len(ids)
+
+
+@pytest.mark.integration
+async def test_delete_tasks_bulk_by_project__success(
+    get_task: dict,
+    get_project: dict,
+    get_project_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.request(
+        "DELETE",
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"filter": {"projectId": get_project["id"]}},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["ids"]) == len(get_project_tasks)
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert [task["id"] for task in response.json()] == [get_task["id"]]
+
+
+@pytest.mark.integration
+async def test_delete_tasks_bulk_empty_filter__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.request(
+        "DELETE",
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"filter": {}},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,109 @@
+import csv
+import io
+
+import orjson
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.apps.tasks.schemas import TaskIn
+
+
+@pytest.mark.integration
+async def test_export_tasks_ndjson__success(
+    get_tasks: list[TaskIn],
+    get_project_task: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/export",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="tasks.ndjson"'
+    tasks: list[dict] = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [task["name"] for task in tasks] == [*(task.name for task in get_tasks), get_project_task["name"]]
+    assert tasks[-1]["id"] == get_project_task["id"]
+    assert tasks[-1]["projectId"] == get_project_task["projectId"]
+    assert set(tasks[-1]) == {"id", "name", "projectId", "priority", "status", "createdAt", "updatedAt"}
+
+
+@pytest.mark.integration
+async def test_export_tasks_csv__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/export",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"format": "csv"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    tasks: list[dict] = list(csv.DictReader(io.StringIO(response.text)))
+    assert [task["name"] for task in tasks] == [task.name for task in get_tasks]
+    assert tasks[0]["priority"] == "high"
+    assert tasks[0]["projectId"] == ""
+
+
+@pytest.mark.integration
+async def test_export_many_tasks__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    await async_client.post(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"tasks": [{"name": f"Meditaion{i}"} for i in range(2500)]},
+    )
+
+    response: Response = await async_client.get(
+        "/api/v1/tasks/export",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.text.splitlines()) == 2500
+
+
+@pytest.mark.integration
+async def test_export_empty_tasks__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/export",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"format": "csv"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == "id,name,projectId,priority,status,createdAt,updatedAt\r\n"
+
+
+@pytest.mark.integration
+async def test_export_tasks_not_valid_format__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/export",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"format": "xml"},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+async def test_export_tasks_not_authorized__fail(
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get("/api/v1/tasks/export")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,141 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.tasks.enums import Priority, Status
+from src.apps.tasks.models import Task
+from src.core.pagination import encode_cursor
+
+TASKS: list[dict] = [
+    {"name": "Meditaion", "priority": "low", "status": "pending", "deadline": -2},
+    {"name": "Meditaion1", "priority": "high", "status": "progress", "deadline": -1},
+    {"name": "Meditaion2", "priority": "medium", "status": "completed", "deadline": -1},
+    {"name": "Meditaion3", "priority": "high", "status": "pending", "deadline": 1},
+    {"name": "Meditaion4", "priority": "low", "status": "progress", "deadline": None},
+]
+
+
+@pytest.fixture
+async def get_filter_tasks(
+    get_project: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+    session: AsyncSession,
+) -> list[dict]:
+    for task in TASKS:
+        await async_client.post(
+            "/api/v1/tasks",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            json={
+                "name": task["name"],
+                "priority": task["priority"],
+                "status": task["status"],
+                "projectId": get_project["id"] if task["priority"] == Priority.high else None,
+            },
+        )
+    # Deadlines are set by days from now, they are stored in UTC without the time zone.
+    now: datetime = datetime.now(UTC).replace(tzinfo=None)
+    for task in TASKS:
+        if task["deadline"] is not None:
+            await session.execute(
+                update(Task).where(Task.name == task["name"]).values(deadline=now + timedelta(days=task["deadline"]))
+            )
+    await session.commit()
+    return TASKS
+
+
+@pytest.mark.parametrize(
+    "params,names",
+    [
+        ({"status": "pending"}, ["Meditaion3", "Meditaion"]),
+        ({"status": ["pending", "completed"]}, ["Meditaion3", "Meditaion2", "Meditaion"]),
+        ({"priority": "high", "status": "pending"}, ["Meditaion3"]),
+        ({"overdue": True}, ["Meditaion1", "Meditaion"]),
+        ({"overdue": False}, ["Meditaion4", "Meditaion3", "Meditaion2"]),
+        ({"sort": "priority", "order": "asc"}, ["Meditaion", "Meditaion4", "Meditaion2", "Meditaion1", "Meditaion3"]),
+        ({"sort": "deadline", "order": "asc"}, ["Meditaion", "Meditaion1", "Meditaion2", "Meditaion3", "Meditaion4"]),
+        ({"sort": "deadline", "order": "desc"}, ["Meditaion4", "Meditaion3", "Meditaion2", "Meditaion1", "Meditaion"]),
+        ({"sort": "deadline", "status": "progress", "perPage": 1, "page": 2}, ["Meditaion1"]),
+    ],
+)
+@pytest.mark.integration
+async def test_get_filtered_tasks__success(
+    params: dict,
+    names: list[str],
+    get_filter_tasks: list[dict],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params=params,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [task["name"] for task in response.json()] == names
+
+
+@pytest.mark.integration
+async def test_get_tasks_by_project_and_deadline__success(
+    get_project: dict,
+    get_filter_tasks: list[dict],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    now: datetime = datetime.now(UTC)
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={
+            "projectId": get_project["id"],
+            "deadlineFrom": (now - timedelta(hours=36)).isoformat(),
+            "deadlineTo": now.isoformat(),
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [task["name"] for task in response.json()] == ["Meditaion1"]
+
+
+@pytest.mark.integration
+async def test_get_filtered_tasks_from_cache__success(
+    get_filter_tasks: list[dict],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    headers: dict[str, str] = {"Authorization": f"Bearer {get_access_token}"}
+    all_response: Response = await async_client.get("/api/v1/tasks", headers=headers)
+    completed_response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers=headers,
+        params={"status": Status.completed.value},
+    )
+
+    assert len(all_response.json()) == len(TASKS)
+    assert [task["name"] for task in completed_response.json()] == ["Meditaion2"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort": "deadline", "cursor": encode_cursor(created_at=datetime.now(UTC), id=uuid.uuid4())},
+        {"deadlineFrom": "2026-10-18T00:00:00", "deadlineTo": "2026-10-17T00:00:00"},
+        {"deadlineFrom": "2026-10-18T00:00:00", "deadlineTo": "2026-10-18T00:00:00"},
+    ],
+)
+@pytest.mark.integration
+async def test_get_filtered_tasks_not_valid__fail(
+    params: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params=params,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -3,9 +3,14 @@ import uuid
 import pytest
 from fastapi import status
 from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.projects.schemas import ProjectOut
+from src.apps.tasks.enums import Status
+from src.apps.tasks.models import Task
 from src.apps.tasks.schemas import TaskIn
+from src.core.settings import cache
 
 
 @pytest.mark.integration
@@ -94,3 +99,151 @@ async def test_get_projects_not_authorized__fail(
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
     assert response.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.integration
+async def test_get_tasks_by_cursor__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    names: list[str] = []
+    params: dict[str, str | int] = {"perPage": 3}
+    while True:
+        response: Response = await async_client.get(
+            "/api/v1/tasks",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            params=params,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        names.extend(task["name"] for task in response.json())
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+
+    assert names == [task.name for task in get_tasks[::-1]]
+
+
+@pytest.mark.integration
+async def test_get_tasks_first_page_next_cursor__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    await async_client.post(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"tasks": [{"name": f"Meditaion{i}"} for i in range(11)]},
+    )
+    # The default request is the first page of the keyset pagination.
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    next_response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"cursor": response.headers["X-Next-Cursor"]},
+    )
+
+    assert len(response.json()) == 10
+    assert [task["name"] for task in next_response.json()] == ["Meditaion0"]
+    assert "X-Next-Cursor" not in next_response.headers
+
+
+@pytest.mark.integration
+async def test_get_tasks_by_not_valid_cursor__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"cursor": "not valid cursor"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+@pytest.mark.integration
+async def test_get_tasks_from_cache__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+    session: AsyncSession,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    await session.execute(update(Task).values(status=Status.completed))
+    await session.commit()
+    cached_response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert cached_response.json() == response.json()
+
+    await async_client.post(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json=TaskIn(name="Meditaion4").model_dump(),
+    )
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert response.json()[0]["name"] == "Meditaion4"
+    assert [task["status"] for task in response.json()[1:]] == [Status.completed] * len(get_tasks)
+
+
+@pytest.mark.integration
+async def test_get_tasks_cache_disabled__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cache, "TASKS_CACHE_ENABLED", False)
+    await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+
+    await session.execute(update(Task).values(status=Status.completed))
+    await session.commit()
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert [task["status"] for task in response.json()] == [Status.completed] * len(get_tasks)
+
+
+@pytest.mark.integration
+async def test_get_tasks_same_as_task__success(
+    get_task: dict,
+    get_project_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    tasks_content: list[bytes] = [
+        (
+            await async_client.get(
+                f"/api/v1/tasks/{task['id']}",
+                headers={"Authorization": f"Bearer {get_access_token}"},
+            )
+        ).content
+        for task in response.json()
+    ]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"] == "application/json"
+    assert len(tasks_content) == len(get_project_tasks) + 1
+    assert response.content == b"[" + b",".join(tasks_content) + b"]"
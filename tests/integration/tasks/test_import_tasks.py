@@ -0,0 +1,182 @@
+import uuid
+
+import orjson
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.apps.tasks import services
+
+
+@pytest.mark.integration
+async def test_import_tasks_ndjson__success(
+    get_project: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    tasks: list[dict] = [
+        {"name": "Meditaion"},
+        {"name": "Meditaion1", "priority": "high", "status": "progress"},
+        {"name": "Meditaion2", "projectId": get_project["id"]},
+    ]
+    response: Response = await async_client.post(
+        "/api/v1/tasks/import",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        files={"file": ("tasks.ndjson", b"\n".join(orjson.dumps(task) for task in tasks))},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"total": 3, "created": 3, "rejectedCount": 0, "rejected": []}
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"order": "asc"},
+    )
+    assert [(task["name"], task["priority"], task["status"]) for task in response.json()] == [
+        ("Meditaion", "low", "pending"),
+        ("Meditaion1", "high", "progress"),
+        ("Meditaion2", "low", "pending"),
+    ]
+    assert response.json()[2]["projectId"] == get_project["id"]
+
+
+@pytest.mark.integration
+async def test_import_tasks_with_rejected_rows__success(
+    get_task: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    lines: list[bytes] = [
+        orjson.dumps({"name": get_task["name"]}),
+        orjson.dumps({"name": "Meditaion"}),
+        b"",
+        orjson.dumps({"name": "Meditaion"}),
+        b"not json",
+        orjson.dumps({"name": "M"}),
+        orjson.dumps({"name": "Meditaion1", "status": "expired"}),
+        orjson.dumps({"name": "Meditaion2", "projectId": str(uuid.uuid4())}),
+    ]
+    response: Response = await async_client.post(
+        "/api/v1/tasks/import",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        files={"file": ("tasks.ndjson", b"\n".join(lines))},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == 7
+    assert response.json()["created"] == 1
+    assert response.json()["rejectedCount"] == 6
+    assert [(error["line"], error["detail"]) for error in response.json()["rejected"]] == [
+        (1, "Task already exists"),
+        (4, "Task already exists"),
+        (5, "Not valid JSON"),
+        (6, "name: String should have at least 2 characters"),
+        (7, "status: Value error, Status 'expired' is not allowed."),
+        (8, "Project not found"),
+    ]
+
+
+@pytest.mark.integration
+async def test_import_tasks_with_nul_name__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    lines: list[bytes] = [orjson.dumps({"name": "Medit\x00aion"}), orjson.dumps({"name": "Meditaion"})]
+    response: Response = await async_client.post(
+        "/api/v1/tasks/import",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        files={"file": ("tasks.ndjson", b"\n".join(lines))},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["created"] == 1
+    assert response.json()["rejected"] == [
+        {"line": 1, "detail": "name: Value error, Name must not contain NUL characters."},
+    ]
+
+
+@pytest.mark.integration
+async def test_import_tasks_rejected_limit__success(
+    get_task: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(services, "IMPORT_REJECTED_LIMIT", 2)
+    lines: list[bytes] = [b"not json"] * 3 + [orjson.dumps({"name": get_task["name"]})] * 2
+    response: Response = await async_client.post(
+        "/api/v1/tasks/import",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        files={"file": ("tasks.ndjson", b"\n".join(lines))},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["rejectedCount"] == 5
+    assert response.json()["rejected"] == [
+        {"line": 1, "detail": "Not valid JSON"},
+        {"line": 2, "detail": "Not valid JSON"},
+    ]
+
+
+@pytest.mark.integration
+async def test_import_exported_tasks_csv__success(
+    get_project_task: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    for start in (0, 3000):
+        await async_client.post(
+            "/api/v1/tasks/bulk",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            json={"tasks": [{"name": f"Meditaion{i}", "priority": "medium"} for i in range(start, start + 3000)]},
+        )
+    export: Response = await async_client.get(
+        "/api/v1/tasks/export",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"format": "csv"},
+    )
+    await async_client.request(
+        "DELETE",
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"filter": {"priority": "medium"}},
+    )
+
+    response: Response = await async_client.post(
+        "/api/v1/tasks/import",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        files={"file": ("tasks.csv", export.content)},
+        params={"format": "csv"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] == 6001
+    assert response.json()["created"] == 6000
+    assert response.json()["rejected"] == [{"line": 2, "detail": "Task already exists"}]
+
+
+@pytest.mark.integration
+async def test_import_tasks_not_valid_file__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/tasks/import",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        files={"file": ("tasks.ndjson", "{}".encode("utf-16"))},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "File is not valid"}
+
+
+@pytest.mark.integration
+async def test_import_tasks_not_authorized__fail(
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/tasks/import",
+        files={"file": ("tasks.ndjson", b"")},
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,130 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.apps.tasks.schemas import TaskOut
+
+NAMES: list[str] = [
+    "Morning meditation",
+    "Evening meditation",
+    "Buy groceries",
+    "Read a book",
+]
+
+
+@pytest.fixture
+async def get_search_tasks(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> list[str]:
+    for name in NAMES:
+        await async_client.post(
+            "/api/v1/tasks",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            json={"name": name},
+        )
+    return NAMES
+
+
+@pytest.mark.parametrize(
+    "q,names",
+    [
+        ("meditation", {"Morning meditation", "Evening meditation"}),
+        ("medit", {"Morning meditation", "Evening meditation"}),
+        ("MORN med", {"Morning meditation"}),
+        ("grocries", {"Buy groceries"}),
+        ("swimming", set()),
+    ],
+)
+@pytest.mark.integration
+async def test_search_tasks__success(
+    q: str,
+    names: set[str],
+    get_search_tasks: list[str],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/search",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"q": q},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {task["name"] for task in response.json()} == names
+    for task in response.json():
+        TaskOut.model_validate(task)
+
+
+@pytest.mark.integration
+async def test_search_tasks_most_relevant_first__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    for name in ("Book a table", "Book"):
+        await async_client.post(
+            "/api/v1/tasks",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            json={"name": name},
+        )
+    response: Response = await async_client.get(
+        "/api/v1/tasks/search",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params={"q": "book"},
+    )
+
+    assert [task["name"] for task in response.json()] == ["Book", "Book a table"]
+
+
+@pytest.mark.integration
+async def test_search_tasks_pages__success(
+    get_search_tasks: list[str],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    names: list[str] = []
+    for page in (1, 2, 3):
+        response: Response = await async_client.get(
+            "/api/v1/tasks/search",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            params={"q": "meditation", "page": page, "perPage": 1},
+        )
+        names.extend(task["name"] for task in response.json())
+
+    # Equally relevant tasks are ordered from the newest one.
+    assert names == ["Evening meditation", "Morning meditation"]
+
+
+@pytest.mark.integration
+async def test_search_tasks_of_other_user__success(
+    get_search_tasks: list[str],
+    async_client: AsyncClient,
+) -> None:
+    signup_response: Response = await async_client.post(
+        "/api/v1/users/signup",
+        json={"email": "other@example.com", "password": "strong_password"},
+    )
+    response: Response = await async_client.get(
+        "/api/v1/tasks/search",
+        headers={"Authorization": f"Bearer {signup_response.json()['accessToken']}"},
+        params={"q": "meditation"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+@pytest.mark.parametrize("params", [{}, {"q": ""}, {"q": "book", "perPage": 101}])
+@pytest.mark.integration
+async def test_search_tasks__fail(
+    params: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/search",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        params=params,
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
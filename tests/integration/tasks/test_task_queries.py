@@ -0,0 +1,42 @@
+import pytest
+from httpx import AsyncClient, Response
+
+from src.core.settings import cache
+
+
+@pytest.mark.parametrize(
+    "method,path,payload,count_queries",
+    [
+        ("GET", "/api/v1/tasks", None, 1),
+        ("GET", "/api/v1/tasks/{task_id}", None, 1),
+        ("POST", "/api/v1/tasks", {"name": "Read a book"}, 1),
+        ("PUT", "/api/v1/tasks/{task_id}", {"name": "Read a book", "projectId": "{project_id}"}, 1),
+        ("DELETE", "/api/v1/tasks/{task_id}", None, 1),
+    ],
+)
+@pytest.mark.integration
+async def test_task_endpoints_queries__success(
+    method: str,
+    path: str,
+    payload: dict | None,
+    count_queries: int,
+    get_project_task: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+    sql_statements: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cache, "TASKS_CACHE_ENABLED", False)
+    ids: dict[str, str] = {"task_id": get_project_task["id"], "project_id": get_project_task["projectId"]}
+    sql_statements.clear()
+    response: Response = await async_client.request(
+        method,
+        path.format(**ids),
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={key: value.format(**ids) for key, value in payload.items()} if payload else None,
+    )
+
+    assert response.is_success
+    assert len(sql_statements) == count_queries, sql_statements
+    # Tasks are read without their projects.
+    assert not [statement for statement in sql_statements if "JOIN" in statement]
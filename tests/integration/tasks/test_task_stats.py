@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.tasks.models import Task
+
+TASKS: list[dict] = [
+    {"name": "Meditaion", "priority": "low", "status": "pending", "deadline": -1, "project": False},
+    {"name": "Meditaion1", "priority": "high", "status": "progress", "deadline": -1, "project": True},
+    {"name": "Meditaion2", "priority": "medium", "status": "completed", "deadline": -1, "project": True},
+    {"name": "Meditaion3", "priority": "high", "status": "pending", "deadline": 1, "project": True},
+]
+
+
+@pytest.fixture
+async def get_stats_tasks(
+    get_project: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+    session: AsyncSession,
+) -> list[dict]:
+    for task in TASKS:
+        await async_client.post(
+            "/api/v1/tasks",
+            headers={"Authorization": f"Bearer {get_access_token}"},
+            json={
+                "name": task["name"],
+                "priority": task["priority"],
+                "status": task["status"],
+                "projectId": get_project["id"] if task["project"] else None,
+            },
+        )
+    now: datetime = datetime.now(UTC).replace(tzinfo=None)
+    for task in TASKS:
+        await session.execute(
+            update(Task).where(Task.name == task["name"]).values(deadline=now + timedelta(days=task["deadline"]))
+        )
+    await session.commit()
+    return TASKS
+
+
+@pytest.mark.integration
+async def test_get_empty_tasks_stats__success(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/stats",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "total": 0,
+        "status": {"pending": 0, "progress": 0, "completed": 0, "expired": 0},
+        "priority": {"low": 0, "medium": 0, "high": 0},
+        "overdue": 0,
+        "completionRate": 0.0,
+        "projects": [],
+    }
+
+
+@pytest.mark.integration
+async def test_get_tasks_stats__success(
+    get_stats_tasks: list[dict],
+    get_project: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks/stats",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    stats: dict = response.json()
+    projects: dict = {project["projectId"]: project for project in stats.pop("projects")}
+
+    assert response.status_code == status.HTTP_200_OK
+    assert stats == {
+        "total": 4,
+        "status": {"pending": 2, "progress": 1, "completed": 1, "expired": 0},
+        "priority": {"low": 1, "medium": 1, "high": 2},
+        "overdue": 2,
+        "completionRate": 0.25,
+    }
+    assert projects[get_project["id"]] == {
+        "projectId": get_project["id"],
+        "total": 3,
+        "status": {"pending": 1, "progress": 1, "completed": 1, "expired": 0},
+        "priority": {"low": 0, "medium": 1, "high": 2},
+        "overdue": 1,
+        "completionRate": 0.3333,
+    }
+    assert projects[None]["total"] == 1
+    assert projects[None]["overdue"] == 1
+
+
+@pytest.mark.integration
+async def test_get_tasks_stats_after_write__success(
+    get_stats_tasks: list[dict],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    await async_client.get(
+        "/api/v1/tasks/stats",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    await async_client.post(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": "Meditaion4", "status": "completed"},
+    )
+    response: Response = await async_client.get(
+        "/api/v1/tasks/stats",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+
+    assert response.json()["total"] == 5
+    assert response.json()["completionRate"] == 0.4
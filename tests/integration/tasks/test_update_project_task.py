@@ -49,3 +49,19 @@ async def test_update_not_task_not_exists_project__fail(
     )
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json() == {"detail": "Project not found"}
+
+
+@pytest.mark.integration
+async def test_update_task_not_exists_project__fail(
+    get_access_token: str,
+    get_task: dict,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.put(
+        f"/api/v1/tasks/{get_task['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": get_task["name"], "projectId": str(uuid.uuid4())},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Project not found"}
@@ -98,3 +98,40 @@ async def test_update_task_no_valid_payload__success(
     )
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+async def test_update_task_same_data__success(
+    get_access_token: str,
+    get_task: dict,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.put(
+        f"/api/v1/tasks/{get_task['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": get_task["name"], "priority": get_task["priority"], "status": get_task["status"]},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == get_task
+
+
+@pytest.mark.integration
+async def test_update_task_taken_name__fail(
+    get_access_token: str,
+    get_task: dict,
+    async_client: AsyncClient,
+) -> None:
+    await async_client.post(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": "Read a book"},
+    )
+    response: Response = await async_client.put(
+        f"/api/v1/tasks/{get_task['id']}",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": "Read a book"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Task already exists"}
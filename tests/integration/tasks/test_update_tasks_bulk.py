@@ -0,0 +1,104 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+
+from src.apps.tasks.schemas import TaskIn, TasksBulkUpdateOut
+
+
+@pytest.mark.integration
+async def test_update_tasks_bulk_by_filter__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    updated_at: dict[str, str] = {task["id"]: task["updatedAt"] for task in response.json()}
+    started_at: str = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+
+    response = await async_client.patch(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"filter": {"status": "pending", "priority": "high"}, "status": "completed"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(map(str, TasksBulkUpdateOut.model_validate(response.json()).ids)) == sorted(updated_at)
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert [task["status"] for task in response.json()] == ["completed"] * len(get_tasks)
+    assert all(task["updatedAt"] >= max(started_at, updated_at[task["id"]]) for task in response.json())
+
+
+@pytest.mark.integration
+async def test_update_tasks_bulk_by_ids__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    ids: list[str] = [task["id"] for task in response.json()[:2]]
+
+    response = await async_client.patch(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"filter": {"ids": [*ids, str(uuid.uuid4())]}, "priority": "low"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(response.json()["ids"]) == sorted(ids)
+    response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert {task["id"]: task["priority"] for task in response.json() if task["id"] in ids} == dict.fromkeys(ids, "low")
+
+
+@pytest.mark.integration
+async def test_update_tasks_bulk_nothing_matches__success(
+    get_tasks: list[TaskIn],
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.patch(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"filter": {"projectId": str(uuid.uuid4())}, "status": "completed"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"ids": []}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"filter": {}, "status": "completed"},
+        {"filter": {"status": "pending"}},
+        {"filter": {"status": "pending"}, "status": "expired"},
+        {"filter": {"ids": []}, "status": "completed"},
+    ],
+)
+@pytest.mark.integration
+async def test_update_tasks_bulk_no_valid_payload__fail(
+    payload: dict,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.patch(
+        "/api/v1/tasks/bulk",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json=payload,
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
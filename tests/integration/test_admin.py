@@ -0,0 +1,68 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import status
+from httpx import ASGITransport, AsyncClient, Response
+
+from src.apps.auth import admin
+from src.apps.projects.admin import ProjectAdmin
+from src.apps.tasks.admin import TaskAdmin
+from src.apps.users.schemas import UserSignUpIn
+from tests.db_connector import TestingSessionLocal, app
+
+
+@pytest.fixture
+async def admin_client(
+    get_user_staff: UserSignUpIn,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[AsyncClient]:
+    """
+    Returns a client logged in to the admin, which works with the test database.
+    """
+    monkeypatch.setattr(admin, "AsyncSessionFactory", TestingSessionLocal)
+    monkeypatch.setattr(ProjectAdmin, "session_maker", TestingSessionLocal)
+    monkeypatch.setattr(TaskAdmin, "session_maker", TestingSessionLocal)
+    # The admin session is kept in a cookie, so the client is not shared with the other tests.
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as admin_client:
+        response: Response = await admin_client.post(
+            "/admin/login",
+            data={"email": get_user_staff.email, "password": get_user_staff.password},
+        )
+        assert response.status_code == status.HTTP_302_FOUND
+        yield admin_client
+
+
+@pytest.mark.parametrize("identity", ["project", "task"])
+@pytest.mark.integration
+async def test_admin_create_page__success(identity: str, admin_client: AsyncClient) -> None:
+    response: Response = await admin_client.get(f"/admin/{identity}/create")
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.integration
+async def test_admin_edit_pages__success(
+    get_access_token_staff: str,
+    async_client: AsyncClient,
+    admin_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/projects",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+        json={"name": "TaskMania"},
+    )
+    project_id: str = response.json()["id"]
+    response = await async_client.post(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+        json={"name": "Meditation", "projectId": project_id},
+    )
+    task_id: str = response.json()["id"]
+
+    response = await admin_client.get(f"/admin/project/edit/{project_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert "TaskMania" in response.text
+
+    response = await admin_client.get(f"/admin/task/edit/{task_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert "Meditation" in response.text
@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.settings import db
+from src.core.utils.db import MeteredAsyncQueuePool
+
+
+@pytest.fixture
+async def metered_engine():
+    engine: AsyncEngine = create_async_engine(
+        url=db.DNS_TEST_DB,
+        poolclass=MeteredAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.integration
+async def test_metered_pool_counts_checkouts__success(metered_engine: AsyncEngine) -> None:
+    for _ in range(3):
+        async with metered_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    metrics = metered_engine.pool.metrics  # type: ignore
+    assert metrics.checkouts == 3
+    assert metrics.timeouts == 0
+    assert 0 < metrics.wait_max <= metrics.wait_total
+
+
+@pytest.mark.integration
+async def test_metered_pool_counts_timeouts__success(metered_engine: AsyncEngine) -> None:
+    async with metered_engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            async with metered_engine.connect():
+                pass
+
+    assert metered_engine.pool.metrics.timeouts == 1  # type: ignore
@@ -1,6 +1,13 @@
 import pytest
 from fastapi import status
 from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.users.admin import UserAdmin
+from src.apps.users.models import User
+from src.core.db import get_engine_pool_options
+from src.core.settings import cache, settings
 
 
 @pytest.mark.integration
@@ -103,3 +110,125 @@ async def test_healthcheck_db_unauthorized__fail(
     )
     assert response.status_code == status.HTTP_403_FORBIDDEN
     assert response.json() == {"detail": "Not authenticated"}
+
+
+@pytest.mark.integration
+async def test_healthcheck_redis_staff__success(
+    get_access_token_staff: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/healthcheck/redis",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["maxConnections"] == cache.REDIS_MAX_CONNECTIONS
+    assert response.json()["createdConnections"] >= 1
+    assert response.json()["createdConnections"] == (
+        response.json()["inUseConnections"] + response.json()["availableConnections"]
+    )
+
+
+@pytest.mark.integration
+async def test_healthcheck_redis_without_permissions__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/healthcheck/redis",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {"detail": "Permission denied"}
+
+
+@pytest.mark.integration
+async def test_healthcheck_token_cache_staff__success(
+    get_access_token_staff: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/healthcheck/token-cache",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert set(response.json()) == {"hits", "misses", "size", "maxSize"}
+
+
+@pytest.mark.integration
+async def test_healthcheck_token_cache_without_permissions__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/healthcheck/token-cache",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {"detail": "Permission denied"}
+
+
+@pytest.mark.integration
+async def test_healthcheck_api_staff_removed_by_admin__fail(
+    get_access_token_staff: str,
+    async_client: AsyncClient,
+    session: AsyncSession,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/healthcheck",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    user: User = (await session.execute(update(User).values(is_staff=False).returning(User))).scalar_one()
+    await session.commit()
+    response = await async_client.get(
+        "/api/v1/healthcheck",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    await UserAdmin().after_model_change(data={}, model=user, is_created=False, request=None)
+    response = await async_client.get(
+        "/api/v1/healthcheck",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {"detail": "Permission denied"}
+
+
+@pytest.mark.integration
+async def test_healthcheck_db_pool_staff__success(
+    get_access_token_staff: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/healthcheck/db/pool",
+        headers={"Authorization": f"Bearer {get_access_token_staff}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["poolSize"] == get_engine_pool_options(workers=settings.APP_WORKERS)["pool_size"]
+    assert set(response.json()) == {
+        "poolSize",
+        "maxOverflow",
+        "checkedOutConnections",
+        "idleConnections",
+        "overflowConnections",
+        "checkouts",
+        "timeouts",
+        "waitAvgMs",
+        "waitMaxMs",
+    }
+
+
+@pytest.mark.integration
+async def test_healthcheck_db_pool_without_permissions__fail(
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get(
+        "/api/v1/healthcheck/db/pool",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json() == {"detail": "Permission denied"}
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from src.apps.users.models import User
+from src.core.db import get_engine_connect_args
+from src.core.settings import db
+
+
+@pytest.fixture
+async def pgbouncer_engine():
+    engine: AsyncEngine = create_async_engine(
+        url=db.DNS_TEST_PGBOUNCER_DB,
+        connect_args=get_engine_connect_args(pgbouncer=True),
+        pool_size=10,
+    )
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except OSError:
+        await engine.dispose()
+        pytest.skip(f"PgBouncer is not running on {db.PGBOUNCER_HOST}:{db.PGBOUNCER_PORT}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.integration
+async def test_pgbouncer_transaction_mode__success(pgbouncer_engine: AsyncEngine) -> None:
+    # Many client connections take turns on a few server connections of PgBouncer,
+    # so every parametrized statement runs where another client prepared statements before.
+    session_factory = async_sessionmaker(bind=pgbouncer_engine, expire_on_commit=False)
+
+    async def run_transactions(client: int) -> list[int]:
+        results: list[int] = []
+        async with session_factory() as session:
+            for number in range(10):
+                results.append(
+                    await session.scalar(
+                        text("SELECT CAST(:number AS integer) + CAST(:client AS integer)"),
+                        {"number": number, "client": client},
+                    )
+                )
+                await session.scalar(User.__table__.select().where(User.email == f"{client}@example.com"))
+                await session.commit()
+        return results
+
+    results: list[list[int]] = await asyncio.gather(*(run_transactions(client) for client in range(20)))
+
+    assert results == [[number + client for number in range(10)] for client in range(20)]
+
+
+@pytest.mark.integration
+async def test_pgbouncer_null_pool__success(pgbouncer_engine: AsyncEngine) -> None:
+    engine: AsyncEngine = create_async_engine(
+        url=db.DNS_TEST_PGBOUNCER_DB,
+        connect_args=get_engine_connect_args(pgbouncer=True),
+        poolclass=NullPool,
+    )
+    for _ in range(3):
+        async with engine.connect() as connection:
+            assert await connection.scalar(text("SELECT CAST(:value AS integer)"), {"value": 1}) == 1
+    await engine.dispose()
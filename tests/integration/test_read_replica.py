@@ -0,0 +1,183 @@
+import httpx
+import pytest
+from fastapi import status
+from httpx import AsyncClient, Response
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from src.core.db import Base, get_async_read_session
+from src.core.services.cache import get_redis_connection
+from src.core.settings import cache, db
+from tests.db_connector import app
+from tests.fixtures.infrastructure import engine
+
+
+@pytest.fixture
+async def replica(monkeypatch: pytest.MonkeyPatch):
+    """
+    Routes the reads to a second empty database, so the reads which went to the replica return nothing.
+    """
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(f"DROP DATABASE IF EXISTS TEST_{db.POSTGRES_DB}_REPLICA WITH (FORCE)")
+        await conn.exec_driver_sql(f"CREATE DATABASE TEST_{db.POSTGRES_DB}_REPLICA")
+    replica_engine: AsyncEngine = create_async_engine(url=db.DNS_TEST_REPLICA_DB, poolclass=NullPool)
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    replica_session_factory = async_sessionmaker(bind=replica_engine, expire_on_commit=False)
+
+    async def override_get_async_read_session():
+        async with replica_session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_async_read_session] = override_get_async_read_session
+    monkeypatch.setattr(db, "POSTGRES_REPLICA_HOST", "replica")
+    monkeypatch.setattr(cache, "TASKS_CACHE_ENABLED", False)
+    yield
+    app.dependency_overrides.pop(get_async_read_session)
+    await replica_engine.dispose()
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(f"DROP DATABASE IF EXISTS TEST_{db.POSTGRES_DB}_REPLICA WITH (FORCE)")
+
+
+async def create_task(async_client: AsyncClient, access_token: str, name: str) -> Response:
+    return await async_client.post(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"name": name},
+    )
+
+
+async def unpin_users() -> None:
+    redis = get_redis_connection()
+    for key in await redis.keys("db:primary:*"):
+        await redis.delete(key)
+
+
+async def get_task_names(async_client: AsyncClient, access_token: str) -> list[str]:
+    response: Response = await async_client.get(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    return [task["name"] for task in response.json()]
+
+
+@pytest.mark.integration
+async def test_read_replica_reads_own_writes__success(
+    replica: None,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await create_task(async_client, get_access_token, "Meditation")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert await get_task_names(async_client, get_access_token) == ["Meditation"]
+
+
+@pytest.mark.integration
+async def test_read_replica_reads_after_pin__success(
+    replica: None,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    await create_task(async_client, get_access_token, "Meditation")
+    await unpin_users()
+
+    assert await get_task_names(async_client, get_access_token) == []
+
+
+@pytest.mark.integration
+async def test_read_replica_failed_write_does_not_pin__success(
+    replica: None,
+    get_access_token: str,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/tasks",
+        headers={"Authorization": f"Bearer {get_access_token}"},
+        json={"name": "Meditation", "projectId": "00000000-0000-0000-0000-000000000000"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert await get_task_names(async_client, get_access_token) == []
+
+
+@pytest.mark.integration
+async def test_read_replica_not_configured__success(
+    replica: None,
+    get_access_token: str,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(db, "POSTGRES_REPLICA_HOST", "")
+    await create_task(async_client, get_access_token, "Meditation")
+    await unpin_users()
+
+    assert await get_task_names(async_client, get_access_token) == ["Meditation"]
+
+
+@pytest.mark.integration
+async def test_read_replica_does_not_fill_cache__success(
+    replica: None,
+    get_access_token: str,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cache, "TASKS_CACHE_ENABLED", True)
+    await create_task(async_client, get_access_token, "Meditation")
+    await unpin_users()
+
+    assert await get_task_names(async_client, get_access_token) == []
+    # The replica caught up, the page read from it before must not be served from the cache.
+    monkeypatch.setattr(db, "POSTGRES_REPLICA_HOST", "")
+    assert await get_task_names(async_client, get_access_token) == ["Meditation"]
+
+
+@pytest.mark.integration
+async def test_read_replica_skips_cache__success(
+    replica: None,
+    get_access_token: str,
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cache, "TASKS_CACHE_ENABLED", True)
+    await create_task(async_client, get_access_token, "Meditation")
+
+    assert await get_task_names(async_client, get_access_token) == ["Meditation"]
+    await unpin_users()
+    # The page cached by the read from the primary is not looked up for the reads from the replica.
+    assert await get_task_names(async_client, get_access_token) == []
+    monkeypatch.setattr(db, "POSTGRES_REPLICA_HOST", "")
+    assert await get_task_names(async_client, get_access_token) == ["Meditation"]
+
+
+@pytest.mark.integration
+async def test_read_replica_reads_user_after_signup__success(
+    replica: None,
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.post(
+        "/api/v1/users/signup",
+        json={"email": "beazley@example.com", "password": "Str0ngP@ssw0rd!"},
+    )
+    me_response: Response = await async_client.get(
+        "/api/v1/users/me",
+        headers={"Authorization": f"Bearer {response.json()['accessToken']}"},
+    )
+
+    assert me_response.status_code == status.HTTP_200_OK
+    assert me_response.json()["email"] == "beazley@example.com"
+
+
+@pytest.mark.integration
+async def test_read_replica_reads_user_after_oauth_signup__success(
+    replica: None,
+    oauth_requests: list[httpx.Request],
+    async_client: AsyncClient,
+) -> None:
+    response: Response = await async_client.get("/api/v1/auth/yandex", params={"code": "code"})
+    me_response: Response = await async_client.get(
+        "/api/v1/users/me",
+        headers={"Authorization": f"Bearer {response.json()['accessToken']}"},
+    )
+
+    assert me_response.status_code == status.HTTP_200_OK
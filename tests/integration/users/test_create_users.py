@@ -2,6 +2,7 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient, Response
 
+from src.apps.auth.security import password_hasher
 from src.apps.users.schemas import UserLoginOut
 
 
@@ -83,6 +84,22 @@ async def test_create_exists_user__fail(async_client: AsyncClient) -> None:
     assert response.json() == {"detail": "User already exists"}
 
 
+@pytest.mark.integration
+async def test_create_user_queries__success(
+    async_client: AsyncClient,
+    sql_statements: list[str],
+) -> None:
+    payload: dict[str, str] = {"email": "beazley@example.com", "password": "Str0ngP@ssw0rd!"}
+    sql_statements.clear()
+    response: Response = await async_client.post("/api/v1/users/signup", json=payload)
+    exists_response: Response = await async_client.post("/api/v1/users/signup", json=payload)
+
+    assert [response.status_code, exists_response.status_code] == [status.HTTP_201_CREATED, status.HTTP_409_CONFLICT]
+    # The taken email is found by the lookup before the password is hashed and inserted.
+    assert len(sql_statements) == 3, sql_statements
+    assert not sql_statements[2].lstrip().startswith("INSERT")
+
+
 @pytest.mark.parametrize(
     "email,password,first_name,last_name",
     [
@@ -154,3 +171,36 @@ async def test_create_user_no_valid_password__fail(
         },
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.integration
+async def test_create_user_password_hasher_overloaded__fail(
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(password_hasher, "max_workers", 0)
+    monkeypatch.setattr(password_hasher, "queue_size", 0)
+    response: Response = await async_client.post(
+        "/api/v1/users/signup",
+        json={
+            "email": "valid@domain.com",
+            "password": "strongPassword12d",
+        },
+    )
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {"detail": "Too many requests, try again later"}
+
+
+@pytest.mark.integration
+async def test_create_exists_user_password_hasher_overloaded__fail(
+    async_client: AsyncClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    payload: dict[str, str] = {"email": "valid@domain.com", "password": "strongPassword12d"}
+    await async_client.post("/api/v1/users/signup", json=payload)
+    monkeypatch.setattr(password_hasher, "max_workers", 0)
+    monkeypatch.setattr(password_hasher, "queue_size", 0)
+    response: Response = await async_client.post("/api/v1/users/signup", json=payload)
+
+    # The taken email is reported without waiting for the password hasher.
+    assert response.status_code == status.HTTP_409_CONFLICT
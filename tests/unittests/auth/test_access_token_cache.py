@@ -0,0 +1,87 @@
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from jose import jwt
+
+from src.apps.auth.services import AuthService
+from src.apps.auth.token_cache import AccessTokenCache, VerifiedAccessToken, access_token_cache
+from src.core.settings import settings
+from src.exceptions import TokenExpiredException, TokenHasNotValidSignatureException
+
+
+@pytest.fixture
+def clear_access_token_cache():
+    access_token_cache.clear()
+    yield
+    access_token_cache.clear()
+
+
+@pytest.mark.unittest
+def test_access_token_cache_hits_and_misses() -> None:
+    cache = AccessTokenCache(max_size=10)
+    token = VerifiedAccessToken(user_id=str(uuid.uuid4()), expire=time.time() + 60)
+
+    assert cache.get("token") is None
+    cache.set("token", token)
+
+    assert cache.get("token") == token
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "max_size": 10}
+
+
+@pytest.mark.unittest
+def test_access_token_cache_evicts_least_recently_used() -> None:
+    cache = AccessTokenCache(max_size=2)
+    token = VerifiedAccessToken(user_id=str(uuid.uuid4()), expire=time.time() + 60)
+    cache.set("first", token)
+    cache.set("second", token)
+    cache.get("first")
+
+    cache.set("third", token)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == token
+    assert cache.get("third") == token
+
+
+@pytest.mark.unittest
+def test_access_token_cache_expired_token_is_miss() -> None:
+    cache = AccessTokenCache(max_size=10)
+    cache.set("token", VerifiedAccessToken(user_id=str(uuid.uuid4()), expire=time.time() - 1))
+
+    assert cache.get("token") is None
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.unittest
+def test_get_user_id_from_cached_access_token(clear_access_token_cache) -> None:
+    user_id: uuid.UUID = uuid.uuid4()
+    access_token: str = AuthService.generate_access_token(user_id=user_id)
+
+    assert AuthService.get_user_id_from_access_token(access_token=access_token) == str(user_id)
+    assert AuthService.get_user_id_from_access_token(access_token=access_token) == str(user_id)
+    assert access_token_cache.stats()["hits"] == 1
+    assert access_token_cache.stats()["misses"] == 1
+
+
+@pytest.mark.unittest
+def test_get_user_id_from_expired_access_token(clear_access_token_cache) -> None:
+    access_token: str = jwt.encode(
+        {"id": str(uuid.uuid4()), "expire": int((datetime.now(UTC) - timedelta(seconds=1)).timestamp())},
+        settings.JWT_SECRET_KEY,
+        settings.JWT_ALGORITHM,
+    )
+
+    for _ in range(2):
+        with pytest.raises(TokenExpiredException):
+            AuthService.get_user_id_from_access_token(access_token=access_token)
+    assert access_token_cache.stats()["size"] == 0
+
+
+@pytest.mark.unittest
+def test_get_user_id_from_not_valid_access_token(clear_access_token_cache) -> None:
+    for _ in range(2):
+        with pytest.raises(TokenHasNotValidSignatureException):
+            AuthService.get_user_id_from_access_token(access_token="not valid token")
+    assert access_token_cache.stats()["size"] == 0
@@ -0,0 +1,43 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.apps.auth.security import PasswordHasher, bcrypt_context
+from src.exceptions import PasswordHasherOverloadedException
+
+
+class BlockingContext:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.release.wait(timeout=5)
+        return password
+
+
+@pytest.mark.unittest
+async def test_hash_and_verify_password__success() -> None:
+    password_hasher = PasswordHasher(context=bcrypt_context, max_workers=1, queue_size=0)
+
+    hashed_password: str = await password_hasher.hash("strong_password")
+
+    assert await password_hasher.verify("strong_password", hashed_password)
+    assert not await password_hasher.verify("not_strong_password", hashed_password)
+    password_hasher.shutdown()
+
+
+@pytest.mark.unittest
+async def test_hash_password_overloaded__fail() -> None:
+    context = BlockingContext()
+    password_hasher = PasswordHasher(context=context, max_workers=1, queue_size=1)  # type: ignore
+    pending = [asyncio.create_task(password_hasher.hash("strong_password")) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHasherOverloadedException):
+        await password_hasher.hash("strong_password")
+
+    context.release.set()
+    assert await asyncio.gather(*pending) == ["strong_password", "strong_password"]
+    assert await password_hasher.hash("strong_password") == "strong_password"
+    password_hasher.shutdown()
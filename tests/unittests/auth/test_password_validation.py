@@ -0,0 +1,30 @@
+import pytest
+
+from src.core.utils.auth.password_validation import CommonPasswordValidator, get_common_passwords
+
+
+@pytest.mark.parametrize(
+    "password",
+    [
+        "password",
+        "Password",
+        " qwerty ",
+        "123456",
+    ],
+)
+@pytest.mark.unittest
+def test_common_password__fail(password: str) -> None:
+    with pytest.raises(ValueError, match="password_too_common"):
+        CommonPasswordValidator().validate(password=password)
+
+
+@pytest.mark.unittest
+def test_not_common_password__success() -> None:
+    CommonPasswordValidator().validate(password="Str0ngP@ssw0rd!")
+
+
+@pytest.mark.unittest
+def test_common_passwords_are_shared() -> None:
+    assert CommonPasswordValidator().passwords is CommonPasswordValidator().passwords
+    assert CommonPasswordValidator().passwords is get_common_passwords()
+    assert isinstance(get_common_passwords(), frozenset)
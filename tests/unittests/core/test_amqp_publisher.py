@@ -0,0 +1,128 @@
+import asyncio
+
+import aio_pika
+import pytest
+from aio_pika.exceptions import DeliveryError
+
+from src.core.services.broker import publisher as publisher_module
+from src.core.services.broker.publisher import AmqpPublisher
+
+
+class FakeExchange:
+    def __init__(self) -> None:
+        self.published: list[str] = []
+
+    async def publish(self, *, message: aio_pika.Message, routing_key: str) -> None:
+        if routing_key == "unroutable":
+            raise DeliveryError(None, None)  # type: ignore
+        self.published.append(routing_key)
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.default_exchange = FakeExchange()
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.channels: list[FakeChannel] = []
+        self.closed: bool = False
+
+    async def channel(self, *, publisher_confirms: bool) -> FakeChannel:
+        assert publisher_confirms
+        self.channels.append(FakeChannel())
+        return self.channels[-1]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_connection(monkeypatch: pytest.MonkeyPatch) -> FakeConnection:
+    connection = FakeConnection()
+
+    async def get_broker_connection() -> FakeConnection:
+        return connection
+
+    monkeypatch.setattr(publisher_module, "get_broker_connection", get_broker_connection)
+    return connection
+
+
+@pytest.mark.unittest
+async def test_publish_messages_in_batch__success(fake_connection: FakeConnection) -> None:
+    publisher = AmqpPublisher(pool_size=2, batch_size=10, batch_timeout=0.01)
+    await publisher.start()
+
+    await asyncio.gather(
+        *(publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="email_queue") for _ in range(10))
+    )
+    await publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="email_queue")
+    await publisher.close()
+
+    assert len(fake_connection.channels) == 1
+    assert fake_connection.channels[0].default_exchange.published == ["email_queue"] * 11
+    assert fake_connection.closed
+
+
+@pytest.mark.unittest
+async def test_close_publisher_while_collecting_batch__success(fake_connection: FakeConnection) -> None:
+    publisher = AmqpPublisher(pool_size=1, batch_size=10, batch_timeout=60)
+    await publisher.start()
+    published = [
+        asyncio.create_task(publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="email_queue"))
+        for _ in range(3)
+    ]
+    # The flusher takes the messages off the queue and waits for the rest of the batch.
+    await asyncio.sleep(0.01)
+    assert publisher._queue.empty()  # type: ignore
+
+    await asyncio.wait_for(publisher.close(), timeout=1)
+
+    assert await asyncio.wait_for(asyncio.gather(*published), timeout=1) == [None] * 3
+    assert fake_connection.channels[0].default_exchange.published == ["email_queue"] * 3
+
+
+@pytest.mark.unittest
+async def test_publish_not_confirmed_message__fail(fake_connection: FakeConnection) -> None:
+    publisher = AmqpPublisher(pool_size=1, batch_size=10, batch_timeout=0.01)
+    await publisher.start()
+
+    results = await asyncio.gather(
+        publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="unroutable"),
+        publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="email_queue"),
+        return_exceptions=True,
+    )
+    await publisher.close()
+
+    assert isinstance(results[0], DeliveryError)
+    assert results[1] is None
+
+
+@pytest.mark.unittest
+async def test_publish_not_started__fail() -> None:
+    publisher = AmqpPublisher(pool_size=1, batch_size=10, batch_timeout=0.01)
+
+    with pytest.raises(RuntimeError):
+        await publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="email_queue")
+
+
+@pytest.mark.unittest
+async def test_publish_while_closing__fail(fake_connection: FakeConnection) -> None:
+    publisher = AmqpPublisher(pool_size=1, batch_size=10, batch_timeout=60)
+    await publisher.start()
+    published = asyncio.create_task(
+        publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="email_queue"),
+    )
+    await asyncio.sleep(0.01)
+    closed = asyncio.create_task(publisher.close())
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError):
+        await publisher.publish(message=aio_pika.Message(body=b"{}"), routing_key="email_queue")
+    await asyncio.wait_for(closed, timeout=1)
+
+    assert await asyncio.wait_for(published, timeout=1) is None
+    assert fake_connection.channels[0].default_exchange.published == ["email_queue"]
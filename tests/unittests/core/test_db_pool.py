@@ -0,0 +1,33 @@
+import pytest
+
+from src.core.db import get_engine_pool_options
+from src.core.settings import db
+
+
+@pytest.mark.parametrize(
+    "budget,pool_size,max_overflow,workers,expected",
+    [
+        (40, None, 0, 4, (10, 0)),
+        (40, 5, 5, 4, (5, 5)),
+        (40, 5, 20, 4, (5, 5)),
+        (40, 20, 0, 4, (10, 0)),
+        (10, None, 0, 1, (10, 0)),
+        (2, None, 0, 4, (1, 0)),
+    ],
+)
+@pytest.mark.unittest
+def test_engine_pool_options_per_worker_budget(
+    budget: int,
+    pool_size: int | None,
+    max_overflow: int,
+    workers: int,
+    expected: tuple[int, int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(db, "DB_CONNECTIONS_BUDGET", budget)
+    monkeypatch.setattr(db, "DB_POOL_SIZE", pool_size)
+    monkeypatch.setattr(db, "DB_MAX_OVERFLOW", max_overflow)
+
+    options: dict = get_engine_pool_options(workers=workers)
+
+    assert (options["pool_size"], options["max_overflow"]) == expected
@@ -0,0 +1,37 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from src.core.pagination import Cursor, Pagination, SortEnum, decode_cursor, encode_cursor, get_next_cursor
+
+
+@pytest.mark.unittest
+def test_encode_decode_cursor() -> None:
+    cursor = Cursor(created_at=datetime(2025, 3, 2, 8, 24, 51, 400617, tzinfo=UTC), id=uuid.uuid4())
+
+    assert decode_cursor(encode_cursor(created_at=cursor.created_at, id=cursor.id)) == cursor
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "not a cursor",
+        "bm90IGEgY3Vyc29y",
+        encode_cursor(created_at=datetime.now(UTC), id=uuid.uuid4())[:-5],
+    ],
+)
+@pytest.mark.unittest
+def test_decode_invalid_cursor(value: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(value)
+
+
+@pytest.mark.unittest
+def test_get_next_cursor() -> None:
+    items: list[Cursor] = [Cursor(created_at=datetime.now(UTC), id=uuid.uuid4()) for _ in range(3)]
+    pagination = Pagination(perPage=3, page=1, order=SortEnum.DESC)
+
+    assert decode_cursor(get_next_cursor(items=items, pagination=pagination)) == items[-1]  # type: ignore
+    assert get_next_cursor(items=items[:2], pagination=pagination) is None
@@ -0,0 +1,32 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import Request
+
+from src.apps.projects import admin
+from src.apps.projects.admin import ProjectAdmin
+
+
+class FakeCacheTasks:
+    def __init__(self) -> None:
+        self.invalidated: list[uuid.UUID] = []
+
+    async def invalidate(self, *, user_id: uuid.UUID) -> None:
+        self.invalidated.append(user_id)
+
+
+@pytest.fixture
+def cache_tasks(monkeypatch: pytest.MonkeyPatch) -> FakeCacheTasks:
+    cache_tasks = FakeCacheTasks()
+    monkeypatch.setattr(admin, "get_cache_tasks_repository", lambda: cache_tasks)
+    return cache_tasks
+
+
+@pytest.mark.unittest
+async def test_delete_project_invalidates_owner_tasks__success(cache_tasks: FakeCacheTasks) -> None:
+    project = SimpleNamespace(user_id=uuid.uuid4())
+
+    await ProjectAdmin().after_model_delete(project, Request({"type": "http"}))
+
+    assert cache_tasks.invalidated == [project.user_id]
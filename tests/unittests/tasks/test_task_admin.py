@@ -0,0 +1,47 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from starlette.requests import Request
+
+from src.apps.tasks import admin
+from src.apps.tasks.admin import TaskAdmin
+
+
+class FakeCacheTasks:
+    def __init__(self) -> None:
+        self.invalidated: list[uuid.UUID] = []
+
+    async def invalidate(self, *, user_id: uuid.UUID) -> None:
+        self.invalidated.append(user_id)
+
+
+@pytest.fixture
+def cache_tasks(monkeypatch: pytest.MonkeyPatch) -> FakeCacheTasks:
+    cache_tasks = FakeCacheTasks()
+    monkeypatch.setattr(admin, "get_cache_tasks_repository", lambda: cache_tasks)
+    return cache_tasks
+
+
+@pytest.mark.unittest
+async def test_move_task_to_other_user_invalidates_both__success(cache_tasks: FakeCacheTasks) -> None:
+    owner_id, new_owner_id = uuid.uuid4(), uuid.uuid4()
+    task = SimpleNamespace(user_id=owner_id)
+    request = Request({"type": "http"})
+
+    await TaskAdmin().on_model_change({}, task, False, request)
+    task.user_id = new_owner_id
+    await TaskAdmin().after_model_change({}, task, False, request)
+
+    assert cache_tasks.invalidated == [new_owner_id, owner_id]
+
+
+@pytest.mark.unittest
+async def test_change_task_invalidates_owner__success(cache_tasks: FakeCacheTasks) -> None:
+    task = SimpleNamespace(user_id=uuid.uuid4())
+    request = Request({"type": "http"})
+
+    await TaskAdmin().on_model_change({}, task, False, request)
+    await TaskAdmin().after_model_change({}, task, False, request)
+
+    assert cache_tasks.invalidated == [task.user_id]
@@ -0,0 +1,27 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from src.apps.tasks.enums import Priority, Status
+from src.apps.tasks.repository import TASK_ROW_FIELDS
+from src.apps.tasks.schemas import TaskOut
+from src.core.utils.serialization import dumps_rows
+
+
+@pytest.mark.unittest
+def test_dumps_rows_as_task_out() -> None:
+    created_at = datetime(2025, 3, 2, 8, 24, 51, 400617, tzinfo=UTC)
+    task = TaskOut(
+        id=uuid.uuid4(),
+        name="Meditation",
+        project_id=None,
+        priority=Priority.high,
+        status=Status.progress,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    # The database formats the ids and the timestamps, the columns after the fields are skipped.
+    row = (str(task.id), task.name, None, task.priority, task.status, "2025-03-02 08:24:51", "2025-03-02 08:24:51", 1)
+
+    assert dumps_rows([row], TASK_ROW_FIELDS) == b"[" + task.model_dump_json(by_alias=True).encode() + b"]"